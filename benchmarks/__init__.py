@@ -0,0 +1,4 @@
+"""
+    Pacote com os benchmarks do projeto.
+    Rodam offline, a partir de páginas e respostas salvas (ou geradas) em 'fixtures'.
+"""
@@ -0,0 +1,174 @@
+"""
+    Benchmark do perfil de navegador: padrão x enxuto (SCRAPE_PROFILE, src/browser.py).
+
+    Para cada perfil, abre o navegador duas vezes (frio e, depois, com o cache da pasta de
+    usuário) e mede, por página: bytes baixados (CDP Network.loadingFinished), requisições
+    bloqueadas e tempo até as linhas da lista aparecerem.
+
+    Sem --url, usa um servidor local com uma página de workspace fictícia que carrega imagens,
+    fontes e um pacote JavaScript com cache (como o shell do Power BI). Com --url, mede páginas
+    reais (a sessão precisa já estar autenticada na pasta de usuário do perfil enxuto).
+
+    Uso:
+    - python -m benchmarks.bench_browser
+    - python -m benchmarks.bench_browser --url https://app.powerbi.com/groups/{id} --loads 3
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from benchmarks.fixtures import workspace_page
+from src.common import network_options, new_driver, quit_driver
+
+ROWS = 40
+IMAGES = 30
+FONTS = 4
+
+ASSETS = {
+    "image/png": b"\x89PNG" + b"\x00" * 20 * 1024,
+    "font/woff2": b"wOF2" + b"\x00" * 60 * 1024,
+    "application/javascript": b"/* shell */" + b" " * 400 * 1024
+}
+
+TIMEOUT = 30
+
+def sample_page() -> str:
+    """
+        Página de workspace fictícia com imagens, fontes e um pacote JavaScript.
+    """
+
+    assets = ["<script src='/app.js'></script>"]
+    assets += [
+        f"<style>@font-face {{ font-family: f{index}; src: url('/font/{index}.woff2'); }}"
+        f" .f{index} {{ font-family: f{index}; }}</style><span class='f{index}'>a</span>"
+        for index in range(FONTS)
+    ]
+    assets += [f"<img src='/img/{index}.png'>" for index in range(IMAGES)]
+
+    return workspace_page(ROWS, shell_size=200).replace("</body>", "".join(assets) + "</body>")
+
+def start_server() -> tuple[ThreadingHTTPServer, str]:
+    """
+        Inicia o servidor local da página fictícia. Retorna o servidor e a url da página.
+    """
+
+    page = sample_page().encode("utf-8")
+
+    class Handler(BaseHTTPRequestHandler):
+        """Serve a página e os recursos dela."""
+
+        def do_GET(self) -> None: # pylint: disable=invalid-name
+            """Trata as requisições GET."""
+
+            if self.path.startswith("/img/"):
+                content_type = "image/png"
+            elif self.path.startswith("/font/"):
+                content_type = "font/woff2"
+            elif self.path == "/app.js":
+                content_type = "application/javascript"
+            else:
+                content_type = "text/html"
+
+            body = page if content_type == "text/html" else ASSETS[content_type]
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            if content_type != "text/html":
+                self.send_header("Cache-Control", "public, max-age=86400")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_) -> None: # pylint: disable=arguments-differ
+            """Silencia o log padrão do http.server."""
+
+    httpd = ThreadingHTTPServer(("localhost", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+    return httpd, f"http://localhost:{httpd.server_port}/groups/benchmark"
+
+def network_totals(driver) -> tuple[int, int, int]:
+    """
+        Lê o log 'performance' e retorna (bytes baixados, requisições, requisições bloqueadas).
+
+        Parâmetros:
+        - driver (webdriver): Sessão medida.
+    """
+
+    downloaded = requests = blocked = 0
+
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        params = message.get("params", {})
+
+        if message["method"] == "Network.loadingFinished":
+            downloaded += int(params.get("encodedDataLength", 0))
+            requests += 1
+        elif message["method"] == "Network.loadingFailed" and params.get("blockedReason"):
+            blocked += 1
+
+    return downloaded, requests, blocked
+
+def measure(url: str, scrape: bool) -> dict:
+    """
+        Abre um navegador, carrega a página e retorna as métricas da carga.
+
+        Parâmetros:
+        - url (str): Página medida.
+        - scrape (bool): Usa o perfil enxuto.
+    """
+
+    driver = new_driver(network_options(), scrape=scrape)
+    try:
+        driver.get_log("performance") # descarta os eventos da abertura do navegador
+
+        start_time = time.perf_counter()
+        driver.get(url)
+        WebDriverWait(driver, TIMEOUT).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div[role='row']"))
+        )
+        seconds = time.perf_counter() - start_time
+
+        time.sleep(1) # deixa os recursos restantes terminarem antes de somar os bytes
+        downloaded, requests, blocked = network_totals(driver)
+    finally:
+        quit_driver(driver)
+
+    return {"seconds": seconds, "kb": downloaded / 1024, "requests": requests, "blocked": blocked}
+
+def main() -> None:
+    """Roda a comparação e imprime uma linha por perfil, página e carga."""
+
+    parser = argparse.ArgumentParser(description="Benchmark do perfil de navegador.")
+    parser.add_argument("--url", nargs="+", help="páginas reais (padrão: página fictícia local)")
+    parser.add_argument("--loads", type=int, default=2, help="cargas por perfil (1ª = fria)")
+    args = parser.parse_args()
+
+    httpd = None
+    urls = args.url
+    if not urls:
+        httpd, url = start_server()
+        urls = [url]
+
+    print(f"{'perfil':<8}{'carga':>6}{'até as linhas (s)':>19}{'baixado (KB)':>14}"
+          f"{'requisições':>13}{'bloqueadas':>12}  página")
+
+    try:
+        for url in urls:
+            for label, scrape in (("padrão", False), ("enxuto", True)):
+                for load in range(1, args.loads + 1):
+                    result = measure(url, scrape)
+                    print(f"{label:<8}{load:>6}{result['seconds']:>19.2f}{result['kb']:>14.0f}"
+                          f"{result['requests']:>13}{result['blocked']:>12}  {url}")
+    finally:
+        if httpd is not None:
+            httpd.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+    Benchmark da extração das linhas: parser original (BeautifulSoup) x passagem única.
+    Mede o tempo (melhor de N repetições) e o pico de memória (tracemalloc) por página.
+
+    Uso:
+    - python -m benchmarks.bench_parser [repetições]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from benchmarks.fixtures import page_fixtures
+from benchmarks.parsers import parse_page, parse_page_soup
+
+PARSERS = {"beautifulsoup": parse_page_soup, "passagem única": parse_page}
+
+def measure(parser, html: str, repeat: int) -> tuple[float, float, int]:
+    """
+        Retorna (melhor tempo em segundos, pico de memória em MB, linhas extraídas).
+
+        Parâmetros:
+        - parser (Callable): Função de extração.
+        - html (str): Página a extrair.
+        - repeat (int): Quantidade de repetições para o tempo.
+    """
+
+    best = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        _, rows = parser(html)
+        best = min(best, time.perf_counter() - start_time)
+
+    tracemalloc.start()
+    parser(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak / 1024 ** 2, len(rows)
+
+def main() -> None:
+    """Roda o benchmark em todas as páginas de 'fixtures' e imprime a comparação."""
+
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    print(f"{'página':<28}{'parser':<16}{'tempo (ms)':>12}{'pico (MB)':>12}{'linhas':>8}")
+
+    for name, html in page_fixtures().items():
+        results = {label: measure(parser, html, repeat) for label, parser in PARSERS.items()}
+
+        for label, (seconds, peak, rows) in results.items():
+            print(f"{name:<28}{label:<16}{seconds * 1000:>12.1f}{peak:>12.1f}{rows:>8}")
+
+        if parse_page(html) != parse_page_soup(html):
+            print(f"{name:<28}ATENÇÃO: os parsers retornaram resultados diferentes!")
+
+        speedup = results["beautifulsoup"][0] / results["passagem única"][0]
+        print(f"{name:<28}{'ganho':<16}{speedup:>11.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+    Benchmark do modelo de dados da execução: JSON legado (dicionários aninhados) x ResultSet.
+    Mede a memória retida pelo resultado (tracemalloc), o tempo de montagem e o tempo para
+    percorrer as linhas publicadas (iter_rows), com artefatos fictícios.
+
+    Uso:
+    - python -m benchmarks.bench_records [artefatos] [workspaces]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Callable, Iterator
+
+from src.extract import build_execution_data
+from src.history import iter_rows
+from src.records import ResultSet
+
+CURRENT_DATE = "31/01/2025 - 08:00:00"
+TYPES = ("Modelo semântico", "Fluxo de dados", "Relatório")
+
+def workspace_rows(workspace: int, count: int) -> list[dict]:
+    """
+        Gera as linhas de uma workspace, como devolvidas pela extração (novas strings a cada
+        chamada, como as que vêm do navegador).
+
+        Parâmetros:
+        - workspace (int): Número da workspace.
+        - count (int): Quantidade de artefatos.
+    """
+
+    return [
+        {
+            "id": f"/groups/{workspace:08d}/datasets/{index:08d}",
+            "name": f"Artefato {index}",
+            "type": TYPES[index % len(TYPES)],
+            "last_refresh": f"{index % 28 + 1:02d}/01/2025, 07:00:00",
+            "next_refresh": "N/D" if index % 5 == 0 else f"31/01/2025, {index % 24:02d}:00:00",
+            "failed": index % 7 == 0
+        }
+        for index in range(count)
+    ]
+
+def stream(artifacts: int, workspaces: int) -> Iterator[tuple[str, list[dict]]]:
+    """
+        Gera (nome da workspace, linhas), uma workspace por vez.
+
+        Parâmetros:
+        - artifacts (int): Total de artefatos.
+        - workspaces (int): Quantidade de workspaces.
+    """
+
+    per_workspace = max(1, artifacts // workspaces)
+    for workspace in range(workspaces):
+        yield f"Workspace {workspace}", workspace_rows(workspace, per_workspace)
+
+def build_legacy(artifacts: int, workspaces: int) -> dict:
+    """Monta o JSON legado ({data hora: {workspace: {artefato: dados}}})."""
+
+    data = {}
+    for name, rows in stream(artifacts, workspaces):
+        data.update(build_execution_data(name, rows, CURRENT_DATE))
+    return {CURRENT_DATE: data}
+
+def build_records(artifacts: int, workspaces: int) -> ResultSet:
+    """Monta o ResultSet."""
+
+    results = ResultSet(CURRENT_DATE)
+    for name, rows in stream(artifacts, workspaces):
+        results.add_rows(name, rows)
+    return results
+
+def measure(builder: Callable, artifacts: int, workspaces: int) -> tuple[float, float, float]:
+    """
+        Retorna (memória retida em MB, tempo de montagem em s, tempo de iter_rows em s).
+
+        Parâmetros:
+        - builder (Callable): Função que monta o resultado.
+        - artifacts (int): Total de artefatos.
+        - workspaces (int): Quantidade de workspaces.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    result = builder(artifacts, workspaces)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start_time = time.perf_counter()
+    builder(artifacts, workspaces)
+    build_seconds = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for _ in iter_rows(result):
+        pass
+    rows_seconds = time.perf_counter() - start_time
+
+    return retained / 1024 ** 2, build_seconds, rows_seconds
+
+def main() -> None:
+    """Roda a comparação e imprime uma linha por modelo."""
+
+    artifacts = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    workspaces = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    print(f"{artifacts} artefatos em {workspaces} workspaces")
+    print(f"{'modelo':<14}{'memória (MB)':>14}{'montagem (s)':>14}{'iter_rows (s)':>15}")
+
+    results = {
+        "JSON legado": measure(build_legacy, artifacts, workspaces),
+        "ResultSet": measure(build_records, artifacts, workspaces)
+    }
+    for label, (memory, build_seconds, rows_seconds) in results.items():
+        print(f"{label:<14}{memory:>14.1f}{build_seconds:>14.2f}{rows_seconds:>15.2f}")
+
+    ratio = results["JSON legado"][0] / results["ResultSet"][0]
+    print(f"{'redução':<14}{ratio:>13.1f}x")
+
+if __name__ == "__main__":
+    main()
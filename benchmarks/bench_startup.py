@@ -0,0 +1,98 @@
+"""
+    Benchmark do tempo de inicialização (importação dos módulos) do programa.
+
+    Roda 'python -X importtime -c "import main"' em processos novos e mostra o tempo total e
+    os módulos mais lentos de importar. Nada é executado além das importações: nenhum navegador,
+    ChromeDriverManager, pandas ou tkinter deveria aparecer aqui.
+
+    Uso:
+    - python -m benchmarks.bench_startup [--repeat 5] [--top 15] [--budget 1.0]
+
+    O código de saída é 1 quando a mediana passa do orçamento (em segundos).
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+REPEAT = 5
+TOP = 15
+BUDGET = 1.0 # segundos até o programa começar a trabalhar
+
+def import_times(stderr: str) -> dict[str, tuple[int, int]]:
+    """
+        Lê a saída do '-X importtime'. Retorna {módulo: (próprio, acumulado)}, em microssegundos.
+
+        Parâmetros:
+        - stderr (str): Saída de erro do processo.
+    """
+
+    times = {}
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = (int(own), int(cumulative))
+
+    return times
+
+def run_once(module: str) -> tuple[float, dict[str, tuple[int, int]]]:
+    """
+        Importa o módulo em um processo novo. Retorna o tempo total e os tempos por módulo.
+
+        Parâmetros:
+        - module (str): Módulo importado (ex.: 'main').
+    """
+
+    start_time = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=False
+    )
+    seconds = time.perf_counter() - start_time
+
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    return seconds, import_times(result.stderr)
+
+def main() -> int:
+    """Roda o benchmark e retorna o código de saída."""
+
+    parser = argparse.ArgumentParser(description="Benchmark de inicialização.")
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--top", type=int, default=TOP)
+    parser.add_argument("--budget", type=float, default=BUDGET)
+    args = parser.parse_args()
+
+    run_once(args.module) # aquece o cache de bytecode (.pyc) e do sistema de arquivos
+
+    totals = []
+    times = {}
+    for _ in range(args.repeat):
+        seconds, times = run_once(args.module)
+        totals.append(seconds)
+
+    median = statistics.median(totals)
+    print(f"Inicialização ({args.repeat}x): mediana {median:.3f}s | mínimo {min(totals):.3f}s")
+    print(f"\n{'próprio (ms)':>13}{'acumulado (ms)':>16}  módulo")
+
+    slowest = sorted(times.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (own, cumulative) in slowest[:args.top]:
+        print(f"{own / 1000:>13.1f}{cumulative / 1000:>16.1f}  {name}")
+
+    if median > args.budget:
+        print(f"\nACIMA DO ORÇAMENTO: {median:.3f}s x {args.budget:.3f}s")
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+    Módulo que gera páginas de workspace fictícias, parecidas com o DOM do Power BI Online.
+    Para usar páginas reais, basta salvar o 'driver.page_source' em benchmarks/fixtures/*.html.
+"""
+
+from pathlib import Path
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures"
+
+TYPES = ("Modelo semântico", "Fluxo de dados", "Relatório", "Pasta")
+
+# simula o peso do shell do Angular (estilos, scripts e menus) que vem junto em 'page_source'
+SHELL = (
+    "<style>.tri-class-{0} {{ color: #{0:06x}; }}</style>"
+    "<nav><div class='menu-item ng-star-inserted'><span>Item {0}</span></div></nav>"
+)
+
+def workspace_page(rows: int, shell_size: int = 2000, workspace: str = "Workspace") -> str:
+    """
+        Gera o HTML de uma workspace com 'rows' artefatos.
+
+        Parâmetros:
+        - rows (int): Quantidade de linhas da lista de artefatos.
+        - shell_size (int): Quantidade de blocos de 'ruído' fora da lista (peso da página).
+        - workspace (str): Nome da workspace.
+    """
+
+    parts = ["<html><head>"]
+    parts.extend(SHELL.format(index) for index in range(shell_size))
+    parts.append("</head><body>")
+    parts.append(
+        f"<h1 class='workspace-name tri-text-overflow-ellipsis tri-subtitle1'>{workspace}</h1>"
+        "<cdk-virtual-scroll-viewport id='artifactContentView'>"
+        "<div class='cdk-virtual-scroll-content-wrapper'>"
+    )
+
+    for index in range(rows):
+        file_type = TYPES[index % len(TYPES)]
+        failed = (
+            "<span class='dataflow-refresh-icons'>"
+            "<button class='glyphicon pbi-glyph-warning ng-star-inserted'></button></span>"
+            if index % 7 == 0 else ""
+        )
+        parts.append(
+            "<div role='row' class='row ng-star-inserted'>"
+            "<div class='cell'><span class='name-container'>"
+            f"<a class='name trimmedTextWithEllipsis ng-star-inserted' "
+            f"href='/groups/g/datasets/{index:08d}'> Artefato {index} </a></span></div>"
+            f"<div class='cell'><span data-testid='fluentListCell.type' title='{file_type}'>"
+            f"{file_type}</span></div>"
+            "<div class='cell'><span data-testid='fluentListCell.lastRefresh' "
+            f"title='{index % 28 + 1:02d}/01/2025, 07:00:00'></span>{failed}</div>"
+            "<div class='cell'><span data-testid='fluentListCell.nextRefresh' "
+            f"title='{'N/D' if index % 5 == 0 else '31/01/2025, 07:00:00'}'></span></div>"
+            "</div>"
+        )
+
+    parts.append("</div></cdk-virtual-scroll-viewport></body></html>")
+    return "".join(parts)
+
+def workspace_rows(rows: int, workspace: str = "Workspace") -> list[dict]:
+    """
+        Gera as linhas de uma workspace no formato de read_rows (src/extract.py), o que a coleta
+        recebe do navegador. Os IDs incluem a workspace, como no Power BI.
+
+        Parâmetros:
+        - rows (int): Quantidade de linhas.
+        - workspace (str): Nome da workspace.
+    """
+
+    return [
+        {
+            "id": f"/groups/{workspace}/datasets/{index:08d}",
+            "name": f"Artefato {index}",
+            "type": TYPES[index % len(TYPES)],
+            "last_refresh": f"{index % 28 + 1:02d}/01/2025, 07:00:00",
+            "next_refresh": "N/D" if index % 5 == 0 else "31/01/2025, 07:00:00",
+            "failed": index % 7 == 0
+        }
+        for index in range(rows)
+    ]
+
+def page_fixtures(sizes: tuple[int, ...] = (50, 500, 2000)) -> dict[str, str]:
+    """
+        Retorna as páginas salvas em FIXTURES_PATH; gera (e salva) as fictícias se não houver.
+
+        Parâmetros:
+        - sizes (tuple[int, ...]): Quantidade de linhas das páginas geradas.
+    """
+
+    FIXTURES_PATH.mkdir(exist_ok=True)
+
+    if not any(FIXTURES_PATH.glob("*.html")):
+        for size in sizes:
+            path = FIXTURES_PATH / f"workspace_{size}.html"
+            path.write_text(workspace_page(size), encoding="utf-8")
+
+    return {
+        path.name: path.read_text(encoding="utf-8")
+        for path in sorted(FIXTURES_PATH.glob("*.html"))
+    }
@@ -0,0 +1,210 @@
+"""
+    Módulo com os parsers de páginas salvas em disco ('driver.page_source'), usados só na
+    comparação do benchmark (benchmarks/bench_parser.py). A coleta lê as linhas dentro do
+    navegador (src/extract.py, read_rows).
+
+    Inclui:
+    - Parser de passagem única (html.parser do Python).
+    - Parser com BeautifulSoup, o original da coleta.
+
+    Os dois retornam (nome_da_workspace, linhas), no mesmo formato de src/extract.py.
+"""
+
+from html.parser import HTMLParser
+
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+
+from src.extract import UNKNOWN_DATE, UNKNOWN_NAME, UNKNOWN_TYPE
+
+WORKSPACE_CLASSES = ("workspace-name", "tri-text-overflow-ellipsis", "tri-subtitle1")
+NAME_CLASSES = ("name", "trimmedTextWithEllipsis", "ng-star-inserted")
+BUTTON_CLASSES = ("glyphicon", "pbi-glyph-warning", "ng-star-inserted")
+ICON_CLASSES = ("warning", "glyphicon", "pbi-glyph-warning", "glyph-small")
+
+CELLS = {
+    "fluentListCell.type": "type",
+    "fluentListCell.lastRefresh": "last_refresh",
+    "fluentListCell.nextRefresh": "next_refresh"
+}
+
+class RowParser(HTMLParser):
+    """
+        Parser de passagem única: percorre o HTML uma vez, guardando só o que interessa.
+        Equivale às buscas do BeautifulSoup, mas sem montar a árvore inteira em memória.
+
+        Atributos (após 'feed'):
+        - workspace_name (str): Nome da workspace.
+        - rows (list[dict]): Linhas da lista de artefatos.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+
+        self.workspace_name = None
+        self.rows = []
+
+        self.__in_list = False # dentro de 'cdk-virtual-scroll-viewport#artifactContentView'
+        self.__row = None
+        self.__row_depth = 0 # profundidade de <div> dentro da linha atual
+        self.__in_container = 0 # profundidade de <span> dentro de 'name-container'
+        self.__in_icons = 0 # profundidade de <span> dentro de 'dataflow-refresh-icons'
+        self.__text = None # destino do texto sendo capturado ('name' ou 'workspace')
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+
+        if self.__row is None:
+            if tag == "cdk-virtual-scroll-viewport" and attrs.get("id") == "artifactContentView":
+                self.__in_list = True
+            elif tag == "div" and self.__in_list and attrs.get("role") == "row":
+                self.__row = {
+                    "id": None, "name": None, "type": UNKNOWN_TYPE, "last_refresh": UNKNOWN_DATE,
+                    "next_refresh": UNKNOWN_DATE, "failed": False, "found": set()
+                }
+                self.__row_depth = 1
+            elif tag == "h1" and self.workspace_name is None and any(
+                name in classes for name in WORKSPACE_CLASSES
+            ):
+                self.workspace_name = ""
+                self.__text = "workspace"
+            return
+
+        if tag == "div":
+            self.__row_depth += 1
+        elif tag == "span":
+            self.__start_span(attrs, classes)
+        elif tag == "a" and self.__in_container and "name" not in self.__row["found"]:
+            if any(name in classes for name in NAME_CLASSES):
+                self.__row["found"].add("name")
+                self.__row["id"] = attrs.get("href")
+                self.__row["name"] = ""
+                self.__text = "name"
+        elif tag == "button" and self.__in_icons:
+            self.__row["failed"] |= any(name in classes for name in BUTTON_CLASSES)
+        elif tag == "i" and any(name in classes for name in ICON_CLASSES):
+            self.__row["failed"] = True
+
+    def __start_span(self, attrs: dict, classes: list) -> None:
+        """Trata as <span> da linha: container do nome, ícones e células com 'title'."""
+
+        found = self.__row["found"]
+
+        if self.__in_container:
+            self.__in_container += 1
+        elif "name-container" in classes and "container" not in found:
+            found.add("container")
+            self.__in_container = 1
+
+        if self.__in_icons:
+            self.__in_icons += 1
+        elif "dataflow-refresh-icons" in classes and "icons" not in found:
+            found.add("icons")
+            self.__in_icons = 1
+
+        field = CELLS.get(attrs.get("data-testid"))
+        if field and field not in found:
+            found.add(field)
+            self.__row[field] = attrs.get("title") or self.__row[field]
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "a" and self.__text == "name":
+            self.__text = None
+        elif tag == "h1" and self.__text == "workspace":
+            self.__text = None
+        elif tag == "cdk-virtual-scroll-viewport":
+            self.__in_list = False
+
+        if self.__row is None:
+            return
+
+        if tag == "span":
+            self.__in_container = max(0, self.__in_container - 1)
+            self.__in_icons = max(0, self.__in_icons - 1)
+        elif tag == "div":
+            self.__row_depth -= 1
+            if self.__row_depth == 0:
+                row = self.__row
+                row["name"] = (row["name"] or "").strip() or UNKNOWN_NAME
+                del row["found"]
+                self.rows.append(row)
+                self.__row = None
+
+    def handle_data(self, data: str) -> None:
+        if self.__text == "name":
+            self.__row["name"] += data
+        elif self.__text == "workspace":
+            self.workspace_name += data
+
+def parse_page(html: str) -> tuple[str, list[dict]]:
+    """
+        Extrai o nome da workspace e as linhas de uma página salva, em uma única passagem.
+
+        Parâmetros:
+        - html (str): HTML da página (ex.: 'page_source' salvo em disco).
+    """
+
+    parser = RowParser()
+    parser.feed(html)
+    parser.close()
+
+    return (parser.workspace_name or "").strip() or UNKNOWN_NAME, parser.rows
+
+def safe_get_text(parent: Tag, selector: tuple[str, dict] | None) -> str:
+    """
+        Função que realiza a sanitização: verifica se existe ou não o elemento.
+        Caso não existir, retorna "Desconhecido".
+
+        Parâmetros:
+        - parent (Tag): Elemento pai do elemento a ser procurado, "selector".
+        - selector (tuple[str, dict] | None): Elemento a ser pego o texto.
+    """
+
+    tag = parent.find(*selector) if parent else None
+    return tag.get_text(strip=True) if tag else UNKNOWN_NAME
+
+def parse_page_soup(html: str) -> tuple[str, list[dict]]:
+    """
+        Extração original, com BeautifulSoup ('html.parser') sobre a página inteira.
+        Mantida como referência para o benchmark (benchmarks/bench_parser.py).
+
+        Parâmetros:
+        - html (str): HTML da página.
+    """
+
+    soup = BeautifulSoup(html, "html.parser")
+
+    workspace_name = safe_get_text(soup, ("h1", {"class": list(WORKSPACE_CLASSES)}))
+
+    if info := soup.find("cdk-virtual-scroll-viewport", {"id": "artifactContentView"}):
+        info = info.find("div", {"class": "cdk-virtual-scroll-content-wrapper"})
+    if not info:
+        return workspace_name, []
+
+    rows = []
+
+    for row in info.find_all("div", {"role": "row"}):
+        container = row.find("span", {"class": "name-container"})
+        link = container.find("a", {"class": list(NAME_CLASSES)}) if container else None
+        icons = row.find("span", {"class": "dataflow-refresh-icons"})
+
+        rows.append({
+            "id": link.get("href") if link else None,
+            "name": safe_get_text(container, ("a", {"class": list(NAME_CLASSES)})),
+            "type": (
+                row.find("span", {"data-testid": "fluentListCell.type"}) or {}
+            ).get("title", UNKNOWN_TYPE),
+            "last_refresh": (
+                row.find("span", {"data-testid": "fluentListCell.lastRefresh"}) or {}
+            ).get("title", UNKNOWN_DATE),
+            "next_refresh": (
+                row.find("span", {"data-testid": "fluentListCell.nextRefresh"}) or {}
+            ).get("title", UNKNOWN_DATE),
+            "failed": bool(
+                row.find("i", {"class": list(ICON_CLASSES)})
+                or (icons and icons.find("button", {"class": list(BUTTON_CLASSES)}))
+            )
+        })
+
+    return workspace_name, rows
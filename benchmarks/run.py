@@ -0,0 +1,235 @@
+"""
+    Suíte de benchmark e regressão do pipeline completo, sem tenant real.
+
+    Um servidor local (src/mock_server.py) substitui api.powerbi.com, login.microsoftonline.com
+    e o SharePoint; as linhas que o navegador devolveria (read_rows, src/extract.py) são geradas.
+    As etapas usam os mesmos caminhos da coleta: ResultSet (src/records.py), build_file e upload.
+    Para cada escala (quantidade de workspaces) são medidos, por etapa: latência, linhas/s e
+    pico de memória Python da etapa (tracemalloc, numa segunda rodada, fora da medição do tempo).
+
+    A linha de base (benchmarks/baseline.json) foi gravada na máquina de referência; ao trocar de
+    máquina, grave uma nova com --save antes de comparar.
+
+    Uso:
+    - python -m benchmarks.run                    # roda e compara com benchmarks/baseline.json
+    - python -m benchmarks.run --save             # roda e grava a nova linha de base
+    - python -m benchmarks.run --scales 10 100 --threshold 0.3
+
+    O código de saída é 1 quando alguma etapa fica mais lenta que a linha de base além do limite.
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.fixtures import workspace_rows
+from src.mock_server import MockServer, sample_routes
+from src.setup import Config
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+SCALES = (10, 100, 1000)
+ROWS_PER_PAGE = 40
+ARTIFACTS_PER_WORKSPACE = 3
+
+API_SCOPE = "https://analysis.windows.net/powerbi/api/.default"
+
+THRESHOLD = 0.5 # regressão: mais de 50% acima da linha de base...
+MIN_DELTA = 0.05 # ...e pelo menos 50 ms mais lento (evita falsos positivos por ruído)
+
+def measure(stage: str, func, rows: int) -> dict:
+    """
+        Executa uma etapa duas vezes e retorna as métricas dela: o tempo da primeira, sem
+        tracemalloc (que deixa o Python mais lento), e o pico de memória da segunda, medido
+        só durante a etapa. As etapas podem rodar de novo: cada uma refaz o próprio resultado.
+
+        Parâmetros:
+        - stage (str): Nome da etapa.
+        - func (Callable): Função sem argumentos que executa a etapa.
+        - rows (int): Linhas processadas pela etapa (para linhas/s).
+    """
+
+    start_time = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start_time
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "stage": stage,
+        "seconds": seconds,
+        "rows_per_second": rows / seconds if seconds else 0.0,
+        "peak_mb": peak / 1024 ** 2
+    }
+
+def configure(mock: MockServer, api_url: str) -> None:
+    """
+        Aponta o projeto para o servidor local. Precisa rodar antes de importar os módulos.
+
+        Parâmetros:
+        - mock (MockServer): Servidor local já iniciado.
+        - api_url (str): Url da API fictícia (retorno de mock.start()).
+    """
+
+    Config.set("INIT", "API_URL", api_url)
+    Config.set("INIT", "LOGIN_URL", mock.url)
+    Config.set("INIT", "SHAREPOINT_URL", mock.url)
+    Config.set("INIT", "DOMAIN_NAME", "benchmark")
+    Config.set("INIT", "SITE_NAME", "benchmark")
+    Config.set("INIT", "HTTP_RATE_LIMIT", "0")
+
+def run_scale(scale: int, mock: MockServer) -> list[dict]:
+    """
+        Roda todas as etapas para uma quantidade de workspaces.
+
+        Parâmetros:
+        - scale (int): Quantidade de workspaces.
+        - mock (MockServer): Servidor local já configurado.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from src import client
+    from src.api import API_URL, ApiExtractor
+    from src.auth import refresh_access_token
+    from src.dates import capture_time
+    from src.extract import build_execution_data
+    from src.records import ResultSet
+    from src.sharepoint import UpdateSharepointFile
+
+    mock.routes = sample_routes(workspaces=scale, artifacts=ARTIFACTS_PER_WORKSPACE)
+    current_date = capture_time()
+    results = []
+    state = {}
+
+    # o retorno de read_rows chega do ChromeDriver como JSON
+    payloads = [
+        json.dumps([f"Workspace {index}", workspace_rows(ROWS_PER_PAGE, f"ws{index}")])
+        for index in range(scale)
+    ]
+
+    def auth() -> None:
+        state["token"] = refresh_access_token("bench", "bench", "refresh-local", API_SCOPE)
+
+    def groups() -> None:
+        state["groups"] = client.get(API_URL + "/groups").json()["value"]
+
+    def api() -> None:
+        extractor = ApiExtractor(state["token"]["access_token"], current_date)
+        api_results = ResultSet(current_date)
+        for data in client.fan_out(
+            lambda group: extractor.read(group["id"], group["name"]), state["groups"]
+        ):
+            api_results.add_json(data)
+
+    def rows() -> None:
+        # como Execution.merge_rows: dicionário do estado local e linhas do ResultSet
+        state["results"] = ResultSet(current_date)
+        for payload in payloads:
+            workspace_name, page = json.loads(payload)
+            build_execution_data(workspace_name, page, current_date)
+            state["results"].add_rows(workspace_name, page)
+
+    def build() -> None:
+        state["file"] = UpdateSharepointFile().build_file(state["results"])
+
+    def upload() -> None:
+        UpdateSharepointFile().upload(state["file"], state["token"]["access_token"])
+
+    artifacts = scale * ARTIFACTS_PER_WORKSPACE * 2
+    page_rows = scale * ROWS_PER_PAGE
+
+    results.append(measure("auth", auth, 1))
+    results.append(measure("groups", groups, scale))
+    results.append(measure("api", api, artifacts))
+    results.append(measure("rows", rows, page_rows))
+    results.append(measure("build", build, page_rows))
+    results.append(measure("upload", upload, page_rows))
+
+    return results
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+        Retorna as regressões encontradas (etapas mais lentas que a linha de base).
+
+        Parâmetros:
+        - current (dict): {escala: {etapa: segundos}} desta execução.
+        - baseline (dict): {escala: {etapa: segundos}} salvo anteriormente.
+        - threshold (float): Aumento relativo tolerado (0.5 = 50%).
+    """
+
+    regressions = []
+
+    for scale, stages in current.items():
+        for stage, seconds in stages.items():
+            reference = baseline.get(scale, {}).get(stage)
+            if reference is None:
+                continue
+            if seconds > reference * (1 + threshold) and seconds - reference > MIN_DELTA:
+                regressions.append(
+                    f"{stage} ({scale} workspaces): {seconds:.3f}s x {reference:.3f}s na base"
+                )
+
+    return regressions
+
+def main() -> int:
+    """Roda a suíte e retorna o código de saída."""
+
+    parser = argparse.ArgumentParser(description="Benchmark offline do pipeline.")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(SCALES))
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--save", action="store_true", help="grava a linha de base")
+    parser.add_argument("--output", type=Path, help="grava as métricas completas em JSON")
+    args = parser.parse_args()
+
+    mock = MockServer({})
+    configure(mock, mock.start())
+
+    current = {}
+    report = []
+
+    print(f"{'escala':>8} {'etapa':<8}{'tempo (s)':>11}{'linhas/s':>12}{'pico (MB)':>11}")
+
+    try:
+        for scale in args.scales:
+            results = run_scale(scale, mock)
+            current[str(scale)] = {
+                result["stage"]: round(result["seconds"], 4) for result in results
+            }
+            report.append({"scale": scale, "stages": results})
+
+            for result in results:
+                print(f"{scale:>8} {result['stage']:<8}{result['seconds']:>11.3f}"
+                      f"{result['rows_per_second']:>12.0f}{result['peak_mb']:>11.1f}")
+    finally:
+        mock.stop()
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.save:
+        BASELINE_PATH.write_text(json.dumps(current, indent=2), encoding="utf-8")
+        print(f"Linha de base gravada em {BASELINE_PATH}.")
+        return 0
+
+    if not BASELINE_PATH.exists():
+        print("Sem linha de base para comparar (use --save).")
+        return 0
+
+    baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+    regressions = compare(current, baseline, args.threshold)
+
+    for regression in regressions:
+        print(f"REGRESSÃO: {regression}")
+
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,45 @@
 """Módulo principal. Ele que é o responsável pela execução do programa."""
 
+import argparse
+import multiprocessing
+
+from src.daemon import Daemon
 from src.info import WebExtractor
+from src.metrics import METRICS, stage
 from src.setup import insert_env_variables
 from src.sharepoint import UpdateSharepointFile
+from src.tenants import PROFILES, collect_tenants
 
 def main() -> None:
     """Função principal."""
 
+    parser = argparse.ArgumentParser(description="Monitoramento das atualizações do Power BI.")
+    parser.add_argument(
+        "--daemon", action="store_true",
+        help="executa em ciclos, mantendo navegadores e tokens entre eles (ver DAEMON_INTERVAL)"
+    )
+    args = parser.parse_args()
+
     insert_env_variables()
 
-    infos = WebExtractor()
-    json_data = infos.get_info()
+    if args.daemon:
+        Daemon().run()
+        return
+
+    try:
+        with stage("extract"):
+            if PROFILES:
+                json_data = collect_tenants()
+            else:
+                infos = WebExtractor()
+                json_data = infos.get_info()
 
-    sharepoint = UpdateSharepointFile()
-    sharepoint.put_in_sharepoint(json_data)
+        with stage("publish"):
+            sharepoint = UpdateSharepointFile()
+            sharepoint.put_in_sharepoint(json_data)
+    finally:
+        METRICS.export()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support() # processos do modo multi-tenant no executável (PyInstaller)
     main()
@@ -0,0 +1,269 @@
+"""
+    Módulo responsável por coletar as informações do Power BI Online via API REST.
+    É uma alternativa ao webscrapping: preenche exatamente o mesmo dicionário, mas a partir
+    dos endpoints de datasets, dataflows, refreshes e refreshSchedule.
+"""
+
+import datetime
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from requests.exceptions import RequestException
+
+from src import client, dates
+from src.client import TIMEOUT
+from src.setup import Config, Logger
+
+API_URL = Config.get("INIT", "API_URL", fallback="https://api.powerbi.com/v1.0/myorg")
+
+DATASET_TYPE = "Modelo semântico"
+DATAFLOW_TYPE = "Fluxo de dados"
+
+WEEK_DAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# 'localTimeZoneId' do agendamento (nomes do Windows) -> fuso IANA
+WINDOWS_ZONES = {
+    "UTC": "UTC",
+    "E. South America Standard Time": "America/Sao_Paulo",
+    "SA Eastern Standard Time": "America/Cayenne",
+    "SA Western Standard Time": "America/La_Paz",
+    "SA Pacific Standard Time": "America/Bogota",
+    "Argentina Standard Time": "America/Argentina/Buenos_Aires",
+    "Pacific SA Standard Time": "America/Santiago",
+    "Central Standard Time (Mexico)": "America/Mexico_City",
+    "Eastern Standard Time": "America/New_York",
+    "Central Standard Time": "America/Chicago",
+    "Mountain Standard Time": "America/Denver",
+    "Pacific Standard Time": "America/Los_Angeles",
+    "GMT Standard Time": "Europe/London",
+    "W. Europe Standard Time": "Europe/Berlin",
+    "Romance Standard Time": "Europe/Paris",
+    "Central Europe Standard Time": "Europe/Budapest",
+    "India Standard Time": "Asia/Kolkata",
+    "Tokyo Standard Time": "Asia/Tokyo",
+    "AUS Eastern Standard Time": "Australia/Sydney"
+}
+
+# uma classe, e não funções soltas: guarda os cabeçalhos e a data hora usados pelas threads
+class ApiExtractor: # pylint: disable=too-few-public-methods
+    """
+        Classe que lê as informações de uma workspace usando a API REST do Power BI.
+        O resultado tem o mesmo formato do gerado pela leitura via Selenium.
+
+        Métodos:
+        - read(workspace_id, workspace_name): Retorna os dados de uma workspace.
+    """
+
+    def __init__(self, access_token: str, current_date: str) -> None:
+        """
+            Parâmetros:
+            - access_token (str): Token de acesso do escopo do Power BI.
+            - current_date (str): Data hora da execução, no formato 'dd/mm/aaaa - HH:MM:SS'.
+        """
+
+        self.__headers = {"Authorization": f"Bearer {access_token}"}
+        self.__current_date = current_date
+
+    def __get(self, path: str) -> dict:
+        """
+            Faz um GET na API do Power BI e retorna o JSON da resposta.
+
+            Parâmetros:
+            - path (str): Caminho do endpoint, a partir de '/myorg'.
+        """
+
+        response = client.get(url=API_URL + path, headers=self.__headers, timeout=TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+
+    def read(self, workspace_id: str, workspace_name: str) -> dict:
+        """
+            Lê todos os modelos semânticos e fluxos de dados de uma workspace.
+            Retorna {workspace_name: {nome_artefato: dados}}.
+
+            Parâmetros:
+            - workspace_id (str): ID da workspace (group).
+            - workspace_name (str): Nome da workspace, usado como chave do resultado.
+        """
+
+        execution_data = {workspace_name: {}}
+        base = f"/groups/{workspace_id}"
+
+        datasets = self.__get(f"{base}/datasets").get("value", [])
+        dataflows = self.__get(f"{base}/dataflows").get("value", [])
+
+        # as requisições de cada artefato são disparadas em paralelo pela camada HTTP
+        dataset_info = client.fan_out(
+            lambda dataset: self.__dataset_info(f"{base}/datasets/{dataset['id']}", dataset),
+            datasets
+        )
+        dataflow_info = client.fan_out(
+            lambda dataflow: self.__last_refresh(
+                f"{base}/dataflows/{dataflow['objectId']}/transactions"
+            ),
+            dataflows
+        )
+
+        for dataset, (refresh, schedule) in zip(datasets, dataset_info):
+            add_artifact(execution_data[workspace_name], dataset["name"], self.__entry(
+                f"{base}/datasets/{dataset['id']}", DATASET_TYPE, refresh, schedule
+            ))
+
+        for dataflow, refresh in zip(dataflows, dataflow_info):
+            # a API não expõe o agendamento de dataflows, somente a alteração dele
+            add_artifact(execution_data[workspace_name], dataflow["name"], self.__entry(
+                f"{base}/dataflows/{dataflow['objectId']}", DATAFLOW_TYPE, refresh, None
+            ))
+
+        return execution_data
+
+    def __dataset_info(self, path: str, dataset: dict) -> tuple[dict, dict]:
+        """
+            Retorna a última atualização e o agendamento de um modelo semântico.
+
+            Parâmetros:
+            - path (str): Caminho do modelo semântico na API.
+            - dataset (dict): Modelo semântico retornado pelo endpoint 'datasets'.
+        """
+
+        if not dataset.get("isRefreshable", True):
+            return {}, {}
+
+        return self.__last_refresh(f"{path}/refreshes"), self.__safe_get(f"{path}/refreshSchedule")
+
+    def __last_refresh(self, path: str) -> dict:
+        """
+            Retorna a atualização mais recente do histórico (ou vazio, se não existir).
+            Um artefato sem acesso ao histórico (403/404) não interrompe a workspace.
+
+            Parâmetros:
+            - path (str): Caminho do histórico ('refreshes' ou 'transactions').
+        """
+
+        return next(iter(self.__safe_get(f"{path}?$top=1").get("value", [])), {})
+
+    def __safe_get(self, path: str) -> dict:
+        """
+            GET que não interrompe a leitura: alguns artefatos não possuem agendamento.
+
+            Parâmetros:
+            - path (str): Caminho do endpoint, a partir de '/myorg'.
+        """
+
+        try:
+            return self.__get(path)
+        except RequestException as error:
+            Logger.info("[Requests] Sem dados em %s: %s", path, error)
+            return {}
+
+    def __entry(self, artifact_id: str, file_type: str, refresh: dict,
+                schedule: dict | None) -> dict:
+        """
+            Converte os retornos da API no dicionário usado pela tela de monitoramento.
+
+            Parâmetros:
+            - artifact_id (str): Caminho do artefato, no mesmo formato do link da tela.
+            - file_type (str): Tipo do artefato, igual ao exibido na tela.
+            - refresh (dict): Última atualização retornada pela API (pode ser vazia).
+            - schedule (dict | None): Agendamento retornado pela API (None = desconhecido).
+        """
+
+        last_refresh = format_api_date(refresh.get("endTime") or refresh.get("startTime"))
+        last_refresh = last_refresh or "Desconhecida."
+
+        if schedule is None:
+            next_upt = "Desconhecida."
+        else:
+            next_upt = next_schedule(schedule, dates.now()) or "N/D"
+
+        return {
+            "id": artifact_id,
+            "tipo": file_type,
+            "last_update": last_refresh,
+            "atualizado_hoje": dates.same_day(last_refresh, self.__current_date),
+            "update_success": refresh.get("status") not in ("Failed", "Cancelled"),
+            "next_update": next_upt,
+            "agendamento_cancelado": next_upt == "N/D"
+        }
+
+def add_artifact(data: dict, name: str, entry: dict) -> None:
+    """
+        Insere o artefato no dicionário da workspace. Nomes repetidos recebem o tipo no nome,
+        como na leitura da tela.
+
+        Parâmetros:
+        - data (dict): Dicionário da workspace, onde o artefato será inserido.
+        - name (str): Nome do artefato.
+        - entry (dict): Dados do artefato (ver ApiExtractor.__entry).
+    """
+
+    if name in data:
+        name = name + " " + entry["tipo"]
+    data[name] = entry
+
+def format_api_date(value: str | None) -> str | None:
+    """
+        Converte uma data ISO 8601 (UTC) da API para o formato exibido na tela, no fuso
+        configurado (ver src/dates.format_title).
+
+        Parâmetros:
+        - value (str | None): Data retornada pela API, por exemplo '2025-01-31T10:00:00.123Z'.
+    """
+
+    if not value:
+        return None
+
+    try:
+        date = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+    return dates.format_title(date)
+
+def schedule_zone(schedule: dict) -> datetime.tzinfo:
+    """
+        Retorna o fuso em que os horários do agendamento foram cadastrados ('localTimeZoneId',
+        no padrão do Windows). Sem o campo, a API usa UTC.
+
+        Parâmetros:
+        - schedule (dict): Retorno do endpoint 'refreshSchedule'.
+    """
+
+    zone_id = schedule.get("localTimeZoneId") or "UTC"
+
+    try:
+        return ZoneInfo(WINDOWS_ZONES.get(zone_id, zone_id))
+    except (ZoneInfoNotFoundError, ValueError):
+        Logger.info("[Requests] Fuso %s desconhecido. Usando o fuso configurado.", zone_id)
+        return dates.now().tzinfo
+
+def next_schedule(schedule: dict, now: datetime.datetime) -> str | None:
+    """
+        Calcula a próxima atualização agendada a partir do retorno de 'refreshSchedule'.
+        Os horários valem no fuso do agendamento; o resultado sai no fuso configurado, como
+        na tela.
+        Retorna None quando o agendamento está desativado ou vazio.
+
+        Parâmetros:
+        - schedule (dict): Retorno do endpoint, com 'enabled', 'days', 'times' e
+          'localTimeZoneId'.
+        - now (datetime.datetime): Momento de referência, com fuso.
+    """
+
+    if not schedule.get("enabled") or not schedule.get("times"):
+        return None
+
+    zone = schedule_zone(schedule)
+    days = set(schedule.get("days") or WEEK_DAYS)
+    times = sorted(schedule["times"])
+    today = now.astimezone(zone).date()
+
+    for offset in range(0, 8, 1):
+        day = today + datetime.timedelta(days=offset)
+        if WEEK_DAYS[day.weekday()] not in days:
+            continue
+
+        for hour in times:
+            moment = datetime.datetime.combine(day, datetime.time.fromisoformat(hour), zone)
+            if moment > now:
+                return dates.format_title(moment)
+
+    return None
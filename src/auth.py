@@ -0,0 +1,190 @@
+"""
+    Módulo com o cache de tokens de acesso em disco.
+
+    Inclui:
+    - Cache por tenant, client e escopo, protegido por arquivo de trava (lock) somente durante
+      a leitura e a gravação: o fluxo no navegador acontece fora da trava.
+    - Renovação silenciosa via 'refresh_token', sem abrir o navegador.
+    - Reaproveitamento de um único refresh token para os escopos do Power BI e do SharePoint.
+    - Fluxo de código do dispositivo (navegador) somente quando não há refresh token válido.
+"""
+
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from requests.exceptions import RequestException
+
+from src import client
+from src.client import TIMEOUT
+from src.common import LOGIN_URL, network_options, new_driver, quit_driver
+from src.common import get_device_code, get_token_response
+from src.metrics import METRICS
+from src.setup import Logger, data_dir, get_env_values
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+CACHE_NAME = "token_cache.json" # na pasta do perfil ativo (ver src/setup.py)
+LOCK_NAME = "token_cache.lock"
+
+LOCK_TIMEOUT = 30 # segundos: a trava só cobre a leitura e a gravação do arquivo
+EXPIRY_MARGIN = 300 # renova o token 5 minutos antes de expirar
+
+@contextmanager
+def cache_lock():
+    """
+        Trava o cache de tokens entre processos, usando a criação exclusiva de um arquivo.
+        Travas mais antigas que LOCK_TIMEOUT são consideradas abandonadas e removidas.
+    """
+
+    lock_path = data_dir() / LOCK_NAME
+    start_time = time.time()
+
+    while True:
+        try:
+            descriptor = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.close(descriptor)
+            break
+        except FileExistsError as error:
+            try:
+                if time.time() - os.path.getmtime(lock_path) > LOCK_TIMEOUT:
+                    Logger.info("[Auth] Removendo trava abandonada do cache de tokens.")
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                continue
+
+            if time.time() - start_time > LOCK_TIMEOUT:
+                raise TimeoutError("Cache de tokens travado por outra execução.") from error
+            time.sleep(0.2)
+
+    try:
+        yield
+    finally:
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
+def read_cache() -> dict:
+    """
+        Lê o cache de tokens do disco. Retorna vazio se não existir ou estiver corrompido.
+    """
+
+    try:
+        with open(data_dir() / CACHE_NAME, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+def write_cache(cache: dict) -> None:
+    """
+        Grava o cache de tokens de forma atômica (arquivo temporário + substituição).
+
+        Parâmetros:
+        - cache (dict): Conteúdo completo do cache.
+    """
+
+    cache_path = data_dir() / CACHE_NAME
+    descriptor, temp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+        json.dump(cache, file)
+    os.replace(temp_path, cache_path)
+
+def refresh_access_token(tenant_id: str, client_id: str, refresh_token: str,
+                         scope: str) -> dict | None:
+    """
+        Troca um refresh token por um novo token de acesso do escopo informado.
+        Retorna a resposta do token, ou None se o refresh token não for mais válido.
+
+        Parâmetros:
+        - tenant_id (str): ID do tenant do Azure AD.
+        - client_id (str): ID do cliente (aplicativo registrado no Azure AD).
+        - refresh_token (str): Refresh token salvo no cache.
+        - scope (str): É a url que se quer ter acesso, seguido de '.default'.
+    """
+
+    token_url = f"{LOGIN_URL}/{tenant_id}/oauth2/v2.0/token"
+    token_data = {
+        "grant_type": "refresh_token",
+        "client_id": client_id,
+        "refresh_token": refresh_token,
+        "scope": f"{scope} offline_access"
+    }
+
+    try:
+        token_json = client.post(token_url, data=token_data, timeout=TIMEOUT).json()
+    except (RequestException, ValueError) as error:
+        Logger.error("[Auth] Erro ao renovar o token: %s", error)
+        return None
+
+    if "access_token" not in token_json:
+        Logger.info("[Auth] Refresh token recusado: %s", token_json.get("error"))
+        return None
+
+    return token_json
+
+def get_token(scope: str, driver: "webdriver" = None) -> str:
+    """
+        Retorna um token de acesso válido para o escopo, na seguinte ordem:
+        1. token de acesso do cache, se ainda não expirou;
+        2. renovação silenciosa com o refresh token do cache (vale para qualquer escopo);
+        3. fluxo de código do dispositivo no navegador.
+
+        Parâmetros:
+        - scope (str): É a url que se quer ter acesso, seguido de '.default'.
+        - driver (webdriver, opcional): Navegador usado no fluxo de código do dispositivo.
+          Se não for informado e o fluxo for necessário, um navegador temporário é aberto.
+    """
+
+    tenant_id = get_env_values().get('TENANT_ID')
+    client_id = get_env_values().get('CLIENT_ID')
+    key = f"{tenant_id}|{client_id}"
+
+    with cache_lock():
+        account = read_cache().get(key, {})
+
+    cached = account.get("scopes", {}).get(scope, {})
+    if cached.get("expires_at", 0) - EXPIRY_MARGIN > time.time():
+        Logger.info("[Auth] Token de %s obtido do cache.", scope)
+        METRICS.count("tokens_total", source="cache")
+        return cached["access_token"]
+
+    # a renovação e o fluxo no navegador ficam fora da trava: o fluxo pode levar minutos
+    token_json = None
+    if account.get("refresh_token"):
+        token_json = refresh_access_token(tenant_id, client_id, account["refresh_token"], scope)
+
+    if token_json:
+        Logger.info("[Auth] Token de %s renovado silenciosamente.", scope)
+        METRICS.count("tokens_total", source="refresh")
+    else:
+        Logger.info("[Auth] Sem refresh token válido. Iniciando fluxo no navegador...")
+        METRICS.count("tokens_total", source="device_code")
+        code = get_device_code(tenant_id, client_id, f"{scope} offline_access")
+
+        temporary = driver is None
+        if temporary:
+            driver = new_driver(network_options())
+        try:
+            token_json = get_token_response(driver=driver, device_code_json=code)
+        finally:
+            if temporary:
+                quit_driver(driver)
+
+    # relê o cache: outra execução pode ter gravado outros escopos enquanto isso
+    with cache_lock():
+        cache = read_cache()
+        account = cache.setdefault(key, {"refresh_token": None, "scopes": {}})
+        account["refresh_token"] = token_json.get("refresh_token", account.get("refresh_token"))
+        account["scopes"][scope] = {
+            "access_token": token_json["access_token"],
+            "expires_at": time.time() + int(token_json.get("expires_in", 0))
+        }
+        write_cache(cache)
+
+    return token_json["access_token"]
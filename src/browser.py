@@ -0,0 +1,116 @@
+"""
+    Módulo com o perfil de navegador enxuto usado na extração ('scrape profile').
+
+    Inclui:
+    - Bloqueio, via CDP (Network.setBlockedURLs), de imagens, fontes e hosts de telemetria.
+    - Argumentos que desligam recursos do Chrome que não servem para a extração.
+    - Pastas de usuário (user-data-dir) persistentes, para o cache dos pacotes estáticos do
+      Power BI sobreviver entre execuções. Cada sessão aberta ao mesmo tempo usa a sua pasta.
+"""
+
+import copy
+import threading
+from typing import TYPE_CHECKING
+
+from selenium.common.exceptions import WebDriverException
+
+from src.setup import Config, Logger, data_dir
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+SCRAPE_PROFILE = Config.get("INIT", "SCRAPE_PROFILE", fallback="true").lower() == "true"
+
+PROFILE_DIR = "chrome" # na pasta do perfil ativo (ver src/setup.py)
+
+BLOCKED_URLS = [
+    # imagens e fontes: a extração só lê texto e atributos
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.ico", "*.bmp",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # telemetria e analytics
+    "*browser.events.data.microsoft.com*",
+    "*.events.data.microsoft.com*",
+    "*dc.services.visualstudio.com*",
+    "*.applicationinsights.azure.com*",
+    "*js.monitor.azure.com*",
+    "*.clarity.ms*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*"
+]
+
+SCRAPE_ARGUMENTS = (
+    "--blink-settings=imagesEnabled=false",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-client-side-phishing-detection",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-default-browser-check",
+    "--no-first-run"
+)
+
+SLOTS_LOCK = threading.Lock()
+SLOTS_IN_USE = set()
+
+def acquire_slot() -> int:
+    """
+        Reserva a menor pasta de usuário livre neste processo e retorna o número dela.
+        O Chrome não permite duas sessões na mesma pasta ao mesmo tempo.
+    """
+
+    with SLOTS_LOCK:
+        slot = 0
+        while slot in SLOTS_IN_USE:
+            slot += 1
+        SLOTS_IN_USE.add(slot)
+        return slot
+
+def release_slot(slot: int) -> None:
+    """
+        Libera a pasta de usuário reservada por acquire_slot.
+
+        Parâmetros:
+        - slot (int): Número da pasta.
+    """
+
+    with SLOTS_LOCK:
+        SLOTS_IN_USE.discard(slot)
+
+def scrape_options(options: "webdriver.ChromeOptions", slot: int) -> "webdriver.ChromeOptions":
+    """
+        Retorna uma cópia das opções com os argumentos do perfil enxuto e a pasta de usuário
+        persistente 'slot'. As opções originais não são alteradas.
+
+        Parâmetros:
+        - options (webdriver.ChromeOptions): Opções do navegador.
+        - slot (int): Número da pasta (ver acquire_slot).
+    """
+
+    path = data_dir() / PROFILE_DIR / f"session-{slot}"
+    path.mkdir(parents=True, exist_ok=True)
+
+    options = copy.deepcopy(options)
+    for argument in SCRAPE_ARGUMENTS:
+        options.add_argument(argument)
+    options.add_argument(f"--user-data-dir={path}")
+
+    return options
+
+def block_resources(driver: "webdriver") -> None:
+    """
+        Bloqueia imagens, fontes e telemetria na sessão (CDP Network.setBlockedURLs).
+
+        Parâmetros:
+        - driver (webdriver): Instância do WebDriver do Selenium. É a instância do navegador ativo.
+    """
+
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    except WebDriverException as error:
+        Logger.info("[Selenium] Bloqueio de recursos indisponível. Erro: %s", error)
@@ -0,0 +1,173 @@
+"""
+    Módulo com o diário (checkpoint) da execução em andamento, para retomar após uma queda.
+
+    Inclui:
+    - Diário JSONL na pasta do perfil ativo: uma linha de cabeçalho (data hora da execução) e
+      uma linha por workspace concluída (dados e hora da leitura), gravada de uma vez e
+      enviada ao disco (fsync).
+    - Retomada: uma execução interrompida há menos de CHECKPOINT_TTL minutos continua de onde
+      parou, sem ler de novo as workspaces do diário. Uma linha incompleta (queda no meio da
+      gravação) é descartada.
+    - Remoção do diário quando a execução termina, mesmo com falhas: só uma execução que caiu
+      é retomada. As workspaces que falharam são lidas de novo pelo estado local.
+"""
+
+import json
+import os
+import tempfile
+import time
+
+from src.setup import Config, Logger, data_dir
+
+CHECKPOINT_NAME = "checkpoint.jsonl" # na pasta do perfil ativo (ver src/setup.py)
+
+# minutos em que uma execução interrompida pode ser retomada (0 = desativado)
+CHECKPOINT_TTL = Config.getint("INIT", "CHECKPOINT_TTL", fallback=180)
+
+class Checkpoint:
+    """
+        Classe que grava as workspaces concluídas da execução em um diário em disco.
+
+        Métodos:
+        - resume(): Retorna a execução interrompida (data hora e workspaces lidas), se houver.
+        - start(captured_at, done): Abre o diário da execução (nova ou retomada).
+        - record(workspace_id, execution_data, read_at): Acrescenta uma workspace concluída.
+        - close(): Fecha o diário, mantendo-o em disco.
+        - clear(): Fecha e remove o diário (execução concluída).
+    """
+
+    def __init__(self, ttl: int = CHECKPOINT_TTL) -> None:
+        """
+            Parâmetros:
+            - ttl (int, opcional): Minutos em que uma execução pode ser retomada (0 = desativado).
+        """
+
+        self.__ttl = ttl * 60
+        self.__path = data_dir() / CHECKPOINT_NAME
+        self.__file = None
+        self.__started_at = None # início da execução retomada
+
+    def resume(self) -> tuple[str, dict] | None:
+        """
+            Lê o diário de uma execução interrompida.
+            Retorna (data hora da execução, {workspace_id: {"read_at": ..., "data": ...}}),
+            no mesmo formato do estado local (src/state.py), ou None se não houver diário, se
+            ele estiver vencido ou se o checkpoint estiver desativado.
+        """
+
+        self.__started_at = None
+        if self.__ttl <= 0:
+            return None
+
+        try:
+            with open(self.__path, "r", encoding="utf-8") as file:
+                lines = file.readlines()
+        except OSError:
+            return None
+
+        header = None
+        done = {}
+
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                Logger.info("[Checkpoint] Linha incompleta descartada.")
+                continue
+
+            if "captured_at" in entry:
+                header = entry
+            elif header is not None:
+                # diário sem a hora da leitura: o início da execução é o limite inferior
+                done[entry["workspace_id"]] = {
+                    "read_at": entry.get("read_at", header["started_at"]), "data": entry["data"]
+                }
+
+        if header is None or time.time() - header["started_at"] > self.__ttl:
+            Logger.info("[Checkpoint] Diário anterior vencido ou inválido. Começando do zero.")
+            return None
+
+        self.__started_at = header["started_at"]
+        return header["captured_at"], done
+
+    def start(self, captured_at: str, done: dict | None = None) -> None:
+        """
+            Abre o diário. Numa retomada, regrava (de forma atômica) só as linhas válidas,
+            para que as próximas não sejam emendadas a uma linha incompleta.
+
+            Parâmetros:
+            - captured_at (str): Data hora da execução.
+            - done (dict | None, opcional): Workspaces já concluídas (retorno de resume).
+        """
+
+        self.close()
+        if self.__ttl <= 0:
+            return
+
+        # a retomada mantém o início original: o prazo (TTL) não é renovado a cada queda
+        started_at = self.__started_at if done is not None else time.time()
+        lines = [self.__line({"captured_at": captured_at, "started_at": started_at})]
+        lines += [
+            self.__line({"workspace_id": workspace_id, **entry})
+            for workspace_id, entry in (done or {}).items()
+        ]
+
+        descriptor, temp_path = tempfile.mkstemp(dir=self.__path.parent, suffix=".tmp")
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            file.writelines(lines)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.__path)
+
+        self.__file = open(self.__path, "a", encoding="utf-8") # pylint: disable=consider-using-with
+
+    def record(self, workspace_id: str, execution_data: dict, read_at: float) -> None:
+        """
+            Acrescenta uma workspace concluída ao diário e espera a gravação em disco.
+            Não é seguro entre threads: quem chama deve serializar (ver Execution.merge).
+
+            Parâmetros:
+            - workspace_id (str): ID da workspace.
+            - execution_data (dict): Dicionário {workspace: {artefato: dados}}.
+            - read_at (float): Hora da leitura (segundos desde 1970), mantida na retomada.
+        """
+
+        if self.__file is None:
+            return
+
+        self.__file.write(self.__line(
+            {"workspace_id": workspace_id, "read_at": read_at, "data": execution_data}
+        ))
+        self.__file.flush()
+        os.fsync(self.__file.fileno())
+
+    def close(self) -> None:
+        """
+            Fecha o diário, mantendo-o em disco para uma retomada.
+        """
+
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    def clear(self) -> None:
+        """
+            Fecha e remove o diário: a execução terminou e não há o que retomar.
+        """
+
+        self.close()
+        try:
+            os.remove(self.__path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def __line(entry: dict) -> str:
+        """
+            Converte uma entrada do diário em uma linha JSON.
+
+            Parâmetros:
+            - entry (dict): Entrada do diário.
+        """
+
+        return json.dumps(entry, ensure_ascii=False) + "\n"
@@ -0,0 +1,187 @@
+"""
+    Módulo com a camada HTTP compartilhada por todo o projeto.
+
+    Inclui:
+    - Sessão única do requests, com conexões keep-alive reaproveitadas (pool de conexões).
+    - Semáforo que limita quantas requisições ficam em voo ao mesmo tempo.
+    - Token bucket dimensionado para a cota de requisições do Power BI.
+    - Novas tentativas para HTTP 429/503, respeitando o cabeçalho 'Retry-After'.
+    - Função para disparar centenas de requisições em paralelo (fan_out).
+"""
+
+import email.utils
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.metrics import METRICS
+from src.setup import Config, Logger
+
+# Variáveis globais
+
+TIMEOUT = 10
+
+CONCURRENCY = max(1, Config.getint("INIT", "HTTP_CONCURRENCY", fallback=16))
+RATE_LIMIT = Config.getfloat("INIT", "HTTP_RATE_LIMIT", fallback=10.0) # requisições por segundo
+RATE_BURST = max(1, Config.getint("INIT", "HTTP_RATE_BURST", fallback=20))
+
+MAX_RETRIES = 5
+BACKOFF = 1 # segundos, dobrando a cada tentativa
+RETRY_STATUS = (429, 503)
+
+# uma classe: o saldo de fichas e o instante da reposição são estado compartilhado entre threads
+class TokenBucket: # pylint: disable=too-few-public-methods
+    """
+        Limitador de taxa no formato token bucket (seguro entre threads).
+        Permite rajadas de até 'capacity' requisições e, depois, 'rate' por segundo.
+
+        Métodos:
+        - take(): Bloqueia até existir uma ficha disponível e a consome.
+    """
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        """
+            Parâmetros:
+            - rate (float): Fichas repostas por segundo. Se 0 ou menor, não limita.
+            - capacity (int): Quantidade máxima de fichas acumuladas.
+        """
+
+        self.__rate = rate
+        self.__capacity = capacity
+        self.__tokens = float(capacity)
+        self.__updated = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def take(self) -> None:
+        """
+            Consome uma ficha, esperando o tempo necessário caso o balde esteja vazio.
+        """
+
+        if self.__rate <= 0:
+            return
+
+        while True:
+            with self.__lock:
+                now = time.monotonic()
+                self.__tokens = min(
+                    self.__capacity,
+                    self.__tokens + (now - self.__updated) * self.__rate
+                )
+                self.__updated = now
+
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return
+
+                delay = (1 - self.__tokens) / self.__rate
+
+            time.sleep(delay)
+
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=CONCURRENCY, pool_maxsize=CONCURRENCY))
+SESSION.mount("http://", HTTPAdapter(pool_connections=CONCURRENCY, pool_maxsize=CONCURRENCY))
+
+LIMITER = TokenBucket(RATE_LIMIT, RATE_BURST)
+SEMAPHORE = threading.BoundedSemaphore(CONCURRENCY)
+
+# Funções
+
+def retry_after(response: requests.Response, attempt: int) -> float:
+    """
+        Calcula quanto tempo esperar antes de repetir a requisição.
+        Usa o cabeçalho 'Retry-After' (segundos ou data HTTP); senão, backoff exponencial.
+
+        Parâmetros:
+        - response (requests.Response): Resposta com status 429 ou 503.
+        - attempt (int): Número da tentativa atual, começando em 1.
+    """
+
+    header = response.headers.get("Retry-After")
+
+    if header:
+        if header.isdigit():
+            return float(header)
+        try:
+            return max(0.0, email.utils.parsedate_to_datetime(header).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+
+    return BACKOFF * 2 ** (attempt - 1)
+
+def http_request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+        Faz uma requisição pela sessão compartilhada, respeitando semáforo e limite de taxa.
+        Respostas 429/503 são repetidas até MAX_RETRIES vezes; a última resposta é retornada.
+
+        Parâmetros:
+        - method (str): Método HTTP ('GET', 'POST', 'PUT'...).
+        - url (str): Url da requisição.
+        - kwargs: Argumentos repassados ao requests (headers, data, json...).
+    """
+
+    kwargs.setdefault("timeout", TIMEOUT)
+
+    # corpos em streaming (arquivos) precisam voltar ao início antes de repetir o envio
+    body = kwargs.get("data")
+    start = body.tell() if hasattr(body, "seek") else None
+
+    for attempt in range(1, MAX_RETRIES + 1, 1):
+        LIMITER.take()
+
+        if start is not None:
+            body.seek(start)
+
+        with SEMAPHORE:
+            response = SESSION.request(method, url, **kwargs)
+
+        sent = int(response.request.headers.get("Content-Length") or 0)
+        METRICS.count("http_requests_total", method=method, status=response.status_code)
+        METRICS.count("http_bytes_total", sent, direction="sent")
+        METRICS.count("http_bytes_total", len(response.content), direction="received")
+
+        if response.status_code not in RETRY_STATUS or attempt == MAX_RETRIES:
+            return response
+
+        delay = retry_after(response, attempt)
+        METRICS.count("retries_total", stage="http")
+        Logger.info(
+            "[Requests] Status %s em %s. Tentando novamente em %.1f segundos...",
+            response.status_code, url, delay
+        )
+        time.sleep(delay)
+
+    return response
+
+def get(url: str, **kwargs) -> requests.Response:
+    """Atalho para http_request('GET', ...)."""
+    return http_request("GET", url, **kwargs)
+
+def post(url: str, **kwargs) -> requests.Response:
+    """Atalho para http_request('POST', ...)."""
+    return http_request("POST", url, **kwargs)
+
+def put(url: str, **kwargs) -> requests.Response:
+    """Atalho para http_request('PUT', ...)."""
+    return http_request("PUT", url, **kwargs)
+
+def fan_out(func: Callable[[Any], Any], items: Iterable) -> list:
+    """
+        Executa 'func' para cada item em paralelo, limitado por CONCURRENCY.
+        Retorna os resultados na mesma ordem dos itens; exceções são propagadas.
+
+        Parâmetros:
+        - func (Callable): Função que recebe um item e faz as requisições dele.
+        - items (Iterable): Itens a processar.
+    """
+
+    items = list(items)
+
+    if len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(CONCURRENCY, len(items))) as executor:
+        return list(executor.map(func, items))
@@ -4,51 +4,185 @@
     Inclui:
     - Funções para autenticação e obtenção de tokens de acesso.
     - Funções para interagir com a UI usando Selenium.
+    - Registro das sessões do Chrome abertas, encerradas ao fim do processo (inclusive sys.exit).
     - Configuração de logging para monitoramento e depuração.
+
+    O Selenium (selenium.webdriver, que carrega todos os navegadores) só é importado ao abrir
+    ou usar uma sessão: o backend de API e a publicação no SharePoint não dependem dele.
 """
 
+import atexit
+import copy
+import functools
 import sys
+import threading
 import time
-import requests
+from typing import TYPE_CHECKING
 from requests.exceptions import RequestException
 
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import WebDriverException
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.keys import Keys
-from selenium import webdriver
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import WebDriverException # leve: não carrega o webdriver
 
+from src import client
+from src.browser import SCRAPE_PROFILE, acquire_slot, block_resources, release_slot
+from src.browser import scrape_options
+from src.client import TIMEOUT
+from src.metrics import timed
+from src.readiness import POLL_INTERVAL, wait_network_idle
 from src.setup import Config, Logger, get_env_values
 
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.support.ui import WebDriverWait
+
 # Variáveis globais
 
-CHROME_SERVICE = Service(ChromeDriverManager().install())
+SHOW_SCREEN = Config.get("INIT", "SHOW_SCREEN").lower() != "false"
 
-WEBDRIVER_OPTIONS = webdriver.ChromeOptions()
+LOAD_TIME = 10
 
-if Config.get("INIT", "SHOW_SCREEN").lower() == "false":
-    WEBDRIVER_OPTIONS.add_argument("--headless=new")
-else:
-    WEBDRIVER_OPTIONS.add_argument("--start-maximized")
+# teto da espera pela rede depois do fluxo de código do dispositivo (antes, uma pausa fixa)
+DEVICE_FLOW_WAIT = 3
 
-WEBDRIVER_OPTIONS.add_argument("--disable-notifications")
-WEBDRIVER_OPTIONS.add_argument("--disable-extensions")
-WEBDRIVER_OPTIONS.add_argument("--disable-background-networking")
-WEBDRIVER_OPTIONS.add_argument("--disable-gpu")
+# LOGIN_URL só deve ser alterada em testes (ex.: servidor local dos benchmarks)
+LOGIN_URL = Config.get("INIT", "LOGIN_URL", fallback="https://login.microsoftonline.com")
 
-LOAD_TIME = 10
-WORKSPACE_REQUEST_INTERVAL = 3
+# sessões abertas por new_driver e ainda não encerradas por quit_driver, com a pasta de usuário
+# reservada por cada uma (None fora do perfil enxuto)
+OPEN_DRIVERS = {}
+OPEN_DRIVERS_LOCK = threading.Lock()
 
-# Variáveis locais
+# Funções
 
-TIMEOUT = 10
+@functools.cache
+def get_chrome_service() -> "Service":
+    """
+        Retorna o serviço do ChromeDriver, criado somente na primeira chamada.
+        O ChromeDriverManager pode acessar a rede e o disco: não deve rodar ao importar o módulo.
+    """
 
-# Funções
+    # pylint: disable=import-outside-toplevel
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
 
-def get_access_token(driver: webdriver, device_code_json: str) -> str:
+    return Service(ChromeDriverManager().install())
+
+@functools.cache
+def webdriver_options() -> "webdriver.ChromeOptions":
+    """
+        Retorna as opções padrão do Chrome (SHOW_SCREEN, settings.ini), criadas somente na
+        primeira chamada. Quem precisar mudar alguma opção deve trabalhar numa cópia.
+    """
+
+    from selenium import webdriver # pylint: disable=import-outside-toplevel
+
+    options = webdriver.ChromeOptions()
+
+    if SHOW_SCREEN:
+        options.add_argument("--start-maximized")
+    else:
+        options.add_argument("--headless=new")
+
+    options.add_argument("--disable-notifications")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-gpu")
+
+    return options
+
+def network_options(
+    options: "webdriver.ChromeOptions | None" = None
+) -> "webdriver.ChromeOptions":
+    """
+        Retorna uma cópia das opções com o log 'performance' (eventos de rede do CDP), usado
+        por wait_network_idle. Só as sessões que esperam pela rede devem usá-lo: o ChromeDriver
+        acumula os eventos em memória até alguém lê-los.
+
+        Parâmetros:
+        - options (webdriver.ChromeOptions | None, opcional): Opções do navegador (padrão:
+          webdriver_options()).
+    """
+
+    options = copy.deepcopy(options or webdriver_options())
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+def new_driver(
+    options: "webdriver.ChromeOptions | None" = None, scrape: bool = SCRAPE_PROFILE
+) -> "webdriver.Chrome":
+    """
+        Abre uma nova sessão do Chrome com o serviço compartilhado do ChromeDriver.
+        Com o perfil enxuto (SCRAPE_PROFILE), a sessão usa uma pasta de usuário persistente e
+        bloqueia imagens, fontes e telemetria (ver src/browser.py).
+
+        Parâmetros:
+        - options (webdriver.ChromeOptions | None, opcional): Opções do navegador (padrão:
+          webdriver_options()).
+        - scrape (bool, opcional): Usa o perfil enxuto.
+    """
+
+    from selenium import webdriver # pylint: disable=import-outside-toplevel
+
+    options = options or webdriver_options()
+
+    if not scrape:
+        driver = webdriver.Chrome(service=get_chrome_service(), options=options)
+        with OPEN_DRIVERS_LOCK:
+            OPEN_DRIVERS[driver] = None
+        return driver
+
+    slot = acquire_slot()
+    try:
+        driver = webdriver.Chrome(
+            service=get_chrome_service(), options=scrape_options(options, slot)
+        )
+    except WebDriverException:
+        release_slot(slot)
+        raise
+
+    with OPEN_DRIVERS_LOCK:
+        OPEN_DRIVERS[driver] = slot
+    block_resources(driver)
+
+    return driver
+
+def quit_driver(driver: "webdriver") -> None:
+    """
+        Encerra uma sessão do Chrome e libera a pasta de usuário dela. Erros são registrados:
+        a sessão pode já ter caído.
+
+        Parâmetros:
+        - driver (webdriver): Instância do WebDriver do Selenium. É a instância do navegador ativo.
+    """
+
+    with OPEN_DRIVERS_LOCK:
+        slot = OPEN_DRIVERS.pop(driver, None)
+
+    try:
+        driver.quit()
+    except WebDriverException as error:
+        Logger.error("[Selenium] Erro ao encerrar sessão: %s", error)
+    finally:
+        # só depois do quit: antes disso o Chrome ainda trava a pasta
+        if slot is not None:
+            release_slot(slot)
+
+@atexit.register
+def quit_all() -> None:
+    """
+        Encerra as sessões que continuam abertas ao fim do processo (ex.: sys.exit() no login),
+        para não deixar processos do Chrome órfãos.
+    """
+
+    with OPEN_DRIVERS_LOCK:
+        drivers = list(OPEN_DRIVERS)
+
+    if drivers:
+        Logger.info("[Selenium] Encerrando %s sessões abertas.", len(drivers))
+    for driver in drivers:
+        quit_driver(driver)
+
+def get_access_token(driver: "webdriver", device_code_json: str) -> str:
     """
         Obtém o token de acesso usando o código do dispositivo.
         Este token é usado para realizar requisições à API do Power BI / Sharepoint.
@@ -58,7 +192,20 @@ def get_access_token(driver: webdriver, device_code_json: str) -> str:
         - device_code_json (str): Código do dispositivo obtido da função get_device_code.
     """
 
-    access_token = None
+    return get_token_response(driver, device_code_json)["access_token"]
+
+@timed("access_token")
+def get_token_response(driver: "webdriver", device_code_json: dict) -> dict:
+    """
+        Faz o fluxo de código do dispositivo no navegador e retorna a resposta completa do token.
+        Além do 'access_token', a resposta traz 'refresh_token' e 'expires_in' (usados no cache).
+
+        Parâmetros:
+        - driver (webdriver): Instância do WebDriver do Selenium. É a instância do navegador ativo.
+        - device_code_json (dict): Código do dispositivo obtido da função get_device_code.
+    """
+
+    token_json = {}
 
     driver.get(device_code_json.get("verification_uri", "#"))
 
@@ -95,12 +242,9 @@ def get_access_token(driver: webdriver, device_code_json: str) -> str:
             Logger.error("[Selenium] Não foi possível prosseguir o fluxo.")
 
     wait_loading(driver)
-    time.sleep(WORKSPACE_REQUEST_INTERVAL)
+    wait_network_idle(driver, timeout=DEVICE_FLOW_WAIT)
 
-    token_url = (
-        f"https://login.microsoftonline.com/{get_env_values().get('TENANT_ID')}"
-        "/oauth2/v2.0/token"
-    )
+    token_url = f"{LOGIN_URL}/{get_env_values().get('TENANT_ID')}/oauth2/v2.0/token"
     token_data = {
         "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
         "client_id": get_env_values().get('CLIENT_ID'),
@@ -114,11 +258,10 @@ def get_access_token(driver: webdriver, device_code_json: str) -> str:
 
     while time.time() - start_time < expires_in:
         try:
-            token_response = requests.post(token_url, data=token_data, timeout=TIMEOUT)
+            token_response = client.post(token_url, data=token_data, timeout=TIMEOUT)
             token_json = token_response.json()
 
             if "access_token" in token_json:
-                access_token = token_json["access_token"]
                 break
 
             if token_json.get("error"):
@@ -128,12 +271,13 @@ def get_access_token(driver: webdriver, device_code_json: str) -> str:
 
         time.sleep(interval)
 
-    if not access_token:
+    if "access_token" not in token_json:
         Logger.critical("[Requests] Não foi possível obter o token de acesso!")
         sys.exit()
 
-    return access_token
+    return token_json
 
+@timed("device_code")
 def get_device_code(tenant_id: str, client_id: str, scope: str) -> dict:
     """
         Obtém o código do dispositivo para autenticação OAuth2.
@@ -147,7 +291,7 @@ def get_device_code(tenant_id: str, client_id: str, scope: str) -> dict:
         OBS.: Para que funcione corretamente, tem que ter as permissões no portal do Azure.
     """
 
-    auth_url =  f"https://login.microsoftonline.com/{tenant_id}/oauth2/v2.0/devicecode"
+    auth_url =  f"{LOGIN_URL}/{tenant_id}/oauth2/v2.0/devicecode"
     data = {
         "client_id": client_id,
         "scope": scope
@@ -157,22 +301,26 @@ def get_device_code(tenant_id: str, client_id: str, scope: str) -> dict:
     }
 
     try:
-        response = requests.post(url=auth_url, data=data, headers=headers, timeout=TIMEOUT)
+        response = client.post(url=auth_url, data=data, headers=headers, timeout=TIMEOUT)
     except RequestException as error:
         Logger.error("[Requests] Erro inesperado! Descrição: %s", error)
 
     return response.json()
 
-def wait(driver: webdriver) -> WebDriverWait:
+def wait(driver: "webdriver") -> "WebDriverWait":
     """
         Método usado somente para reduzir o método WebDriverWait.
 
         Parâmetros:
         - driver (webdriver): Instância do navegador a esperar.
     """
+
+    # pylint: disable=import-outside-toplevel
+    from selenium.webdriver.support.ui import WebDriverWait
+
     return WebDriverWait(driver, LOAD_TIME)
 
-def interact_with_ui(driver: webdriver, css: str, value = None) -> None:
+def interact_with_ui(driver: "webdriver", css: str, value = None) -> None:
     """
         Função usada para interagir com a UI da página.
         Pode ser usada para clicar em botões ou inserir valores em campos de texto.
@@ -184,6 +332,11 @@ def interact_with_ui(driver: webdriver, css: str, value = None) -> None:
         - value (str, opcional): Valor a ser inserido no input. Se vazio, o elemento é clicado.
     """
 
+    # pylint: disable=import-outside-toplevel
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support import expected_conditions as EC
+
     selector = (By.CSS_SELECTOR, css)
 
     if value:
@@ -196,17 +349,23 @@ def interact_with_ui(driver: webdriver, css: str, value = None) -> None:
         element = driver.find_element(*selector) # o '*' desempacota a tupla
         element.click()
 
-def wait_loading(driver: webdriver) -> None:
+def wait_loading(driver: "webdriver", timeout: float = LOAD_TIME) -> float:
     """
         Função que espera o carregamento completo da página.
         Útil para garantir que a página esteja totalmente carregada antes de prosseguir.
+        Retorna o tempo esperado, em segundos.
 
         Parâmetros:
         - driver (webdriver): Instância do WebDriver do Selenium. É a instância do navegador ativo.
+        - timeout (float, opcional): Tempo máximo de espera, em segundos.
     """
 
-    while True:
-        state = driver.execute_script("return document.readyState")
+    start_time = time.monotonic()
 
-        if state == "complete":
+    while driver.execute_script("return document.readyState") != "complete":
+        if time.monotonic() - start_time > timeout:
+            Logger.info("[Espera] Página não terminou de carregar em %ss.", timeout)
             break
+        time.sleep(POLL_INTERVAL)
+
+    return time.monotonic() - start_time
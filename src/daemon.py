@@ -0,0 +1,153 @@
+"""
+    Módulo com o modo residente (daemon), que repete a coleta e a publicação em ciclos.
+
+    Inclui:
+    - Agendador interno: intervalo fixo ou alinhado às próximas atualizações já coletadas.
+    - Navegadores e tokens reaproveitados entre os ciclos (sem novo login a cada execução).
+    - Encerramento limpo ao receber SIGINT/SIGTERM (Ctrl+C, Agendador de Tarefas, systemd).
+    - Métricas de cada ciclo gravadas em disco e, se METRICS_PORT > 0, em /metrics.
+    - Modo multi-tenant (PROFILES): cada ciclo extrai todos os perfis (src/tenants.py). Os
+      processos dos perfis terminam a cada ciclo, então navegadores e estado do Selenium não
+      são mantidos entre eles; o cache de tokens de cada perfil, sim.
+"""
+
+import datetime
+import signal
+import threading
+
+from src import dates
+from src.info import WebExtractor
+from src.metrics import METRICS, METRICS_PORT, stage
+from src.records import ResultSet
+from src.setup import Config, Logger
+from src.sharepoint import UpdateSharepointFile
+from src.tenants import PROFILES, collect_tenants
+
+DAEMON_INTERVAL = Config.getint("INIT", "DAEMON_INTERVAL", fallback=30) # minutos entre ciclos
+DAEMON_ALIGN = Config.get("INIT", "DAEMON_ALIGN", fallback="true").lower() == "true"
+
+ALIGN_MARGIN = 5 # minutos após a atualização agendada, para ela terminar antes da leitura
+MIN_WAIT = 60 # segundos mínimos entre ciclos
+
+def next_wakeup(
+    results: ResultSet | None, now: datetime.datetime, interval: int = DAEMON_INTERVAL
+) -> float:
+    """
+        Retorna quantos segundos esperar até o próximo ciclo: o intervalo, ou menos, se alguma
+        atualização agendada (next_update) terminar antes dele.
+
+        Parâmetros:
+        - results (ResultSet | None): Resultado de WebExtractor.get_info() (None se falhou).
+        - now (datetime): Data hora atual, com fuso (ver src/dates.py).
+        - interval (int): Intervalo máximo entre ciclos, em minutos.
+    """
+
+    wakeup = now + datetime.timedelta(minutes=interval)
+
+    # datas numéricas do ResultSet (segundos desde 1970; NaN sem agendamento)
+    current = now.timestamp()
+    upcoming = [
+        value for value in results.column("next_update_at") if value > current
+    ] if results else []
+
+    if upcoming:
+        next_update = datetime.datetime.fromtimestamp(min(upcoming), now.tzinfo)
+        wakeup = min(wakeup, next_update + datetime.timedelta(minutes=ALIGN_MARGIN))
+
+    return max(MIN_WAIT, (wakeup - now).total_seconds())
+
+class Daemon:
+    """
+        Classe que executa a coleta e a publicação em ciclos, até receber um sinal de parada.
+
+        Métodos:
+        - run(): Executa os ciclos até stop() (ou SIGINT/SIGTERM).
+        - stop(): Pede o encerramento; o ciclo em andamento termina antes.
+    """
+
+    def __init__(self, interval: int = DAEMON_INTERVAL, align: bool = DAEMON_ALIGN) -> None:
+        """
+            Parâmetros:
+            - interval (int, opcional): Minutos entre ciclos.
+            - align (bool, opcional): Antecipa o ciclo para logo após as atualizações agendadas.
+        """
+
+        self.__interval = interval
+        self.__align = align
+        self.__stopped = threading.Event()
+        self.__extractor = None if PROFILES else WebExtractor(keep_alive=True)
+
+    def stop(self, *_) -> None:
+        """
+            Pede o encerramento do daemon. Também é o tratador dos sinais.
+        """
+
+        if not self.__stopped.is_set():
+            Logger.info("[Daemon] Encerramento solicitado. Finalizando o ciclo atual...")
+        self.__stopped.set()
+
+    def run(self) -> None:
+        """
+            Executa os ciclos até stop(). Os navegadores são encerrados ao final, sempre.
+        """
+
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+        if hasattr(signal, "SIGBREAK"): # Windows: Ctrl+Break
+            signal.signal(signal.SIGBREAK, self.stop)
+
+        Logger.info("[Daemon] Iniciado. Intervalo de %s minutos.", self.__interval)
+        if PROFILES:
+            Logger.info(
+                "[Daemon] Modo multi-tenant (%s perfis): navegadores não são mantidos "
+                "entre os ciclos.", len(PROFILES)
+            )
+
+        httpd = METRICS.serve(METRICS_PORT) if METRICS_PORT > 0 else None
+
+        try:
+            while not self.__stopped.is_set():
+                results = self.__cycle()
+
+                if self.__align:
+                    seconds = next_wakeup(results, dates.now(), self.__interval)
+                else:
+                    seconds = self.__interval * 60
+
+                Logger.info("[Daemon] Próximo ciclo em %.0f segundos.", seconds)
+                self.__stopped.wait(seconds)
+        finally:
+            self.__close()
+            if httpd is not None:
+                httpd.shutdown()
+            Logger.info("[Daemon] Encerrado.")
+
+    def __cycle(self) -> ResultSet | None:
+        """
+            Executa uma coleta e publica o resultado. Retorna o resultado coletado.
+            Falhas de um ciclo são registradas e não encerram o daemon.
+        """
+
+        METRICS.reset()
+
+        try:
+            with stage("extract"):
+                results = collect_tenants() if PROFILES else self.__extractor.get_info()
+            with stage("publish"):
+                UpdateSharepointFile().put_in_sharepoint(results)
+            return results
+        except (Exception, SystemExit) as error: # pylint: disable=broad-exception-caught
+            Logger.error("[Daemon] Ciclo falhou. Erro: %r", error)
+            METRICS.count("cycles_failed_total")
+            self.__close() # próximo ciclo começa com navegadores novos
+            return None
+        finally:
+            METRICS.export()
+
+    def __close(self) -> None:
+        """
+            Encerra os navegadores mantidos entre os ciclos (não há no modo multi-tenant).
+        """
+
+        if self.__extractor is not None:
+            self.__extractor.close()
@@ -0,0 +1,172 @@
+"""
+    Módulo com a conversão das datas exibidas pelo Power BI (atributo 'title') para datetime.
+
+    Inclui:
+    - Formatos da interface em pt-BR ('31/01/2025, 07:00:00') e en-US ('1/31/2025, 7:00:00 AM'),
+      com detecção do idioma (UI_LOCALE, settings.ini; 'auto' = pelo próprio texto).
+    - Datas com fuso horário (TIMEZONE, settings.ini; vazio = fuso do computador, o mesmo em
+      que o navegador exibe as datas).
+    - Textos sem data ('N/D', 'Desconhecida.') convertidos para None.
+    - Formatação no mesmo padrão da tela, para as datas do backend de API (src/api.py).
+"""
+
+import datetime
+import functools
+import math
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from src.setup import Config, Logger
+
+TIMEZONE = Config.get("INIT", "TIMEZONE", fallback="").strip() # ex.: America/Sao_Paulo
+UI_LOCALE = Config.get("INIT", "UI_LOCALE", fallback="auto").strip() # 'auto', 'pt-BR', 'en-US'
+
+CAPTURE_FORMAT = "%d/%m/%Y - %H:%M:%S" # data hora da execução
+NO_SCHEDULE = "N/D" # próxima atualização quando o agendamento está desligado
+UNKNOWN_DATE = "Desconhecida." # data que a tela (ou a API) não informou
+NO_DATES = (NO_SCHEDULE, UNKNOWN_DATE, "")
+
+FORMATS = {
+    "pt-BR": ("%d/%m/%Y, %H:%M:%S", "%d/%m/%Y %H:%M:%S", "%d/%m/%Y, %H:%M"),
+    "en-US": ("%m/%d/%Y, %I:%M:%S %p", "%m/%d/%Y %I:%M:%S %p", "%m/%d/%Y, %H:%M:%S")
+}
+
+@functools.cache
+def zone() -> datetime.tzinfo | None:
+    """
+        Retorna o fuso de TIMEZONE, ou None para usar o fuso do computador.
+    """
+
+    if not TIMEZONE:
+        return None
+
+    try:
+        return ZoneInfo(TIMEZONE)
+    except (ZoneInfoNotFoundError, ValueError):
+        Logger.error("[Datas] Fuso %s não encontrado. Usando o fuso do computador.", TIMEZONE)
+        return None
+
+def localize(naive: datetime.datetime) -> datetime.datetime:
+    """
+        Associa o fuso configurado a uma data sem fuso (como as exibidas na tela).
+
+        Parâmetros:
+        - naive (datetime): Data sem fuso horário.
+    """
+
+    timezone = zone()
+    return naive.replace(tzinfo=timezone) if timezone else naive.astimezone()
+
+def now() -> datetime.datetime:
+    """
+        Retorna a data hora atual, com fuso.
+    """
+
+    timezone = zone()
+    return datetime.datetime.now(timezone) if timezone else datetime.datetime.now().astimezone()
+
+def capture_time() -> str:
+    """
+        Retorna a data hora da execução no formato CAPTURE_FORMAT, no fuso de TIMEZONE: é
+        nele que parse_capture e same_day leem o texto, e não no fuso do computador.
+    """
+
+    return now().strftime(CAPTURE_FORMAT)
+
+def format_title(date: datetime.datetime) -> str:
+    """
+        Formata uma data com fuso como a tela exibe (atributo 'title'): no fuso de TIMEZONE e
+        no idioma de UI_LOCALE ('auto' = pt-BR). Assim, parse_title e same_day leem do mesmo
+        jeito as datas dos dois backends.
+
+        Parâmetros:
+        - date (datetime): Data com fuso.
+    """
+
+    return date.astimezone(zone()).strftime(FORMATS.get(UI_LOCALE, FORMATS["pt-BR"])[0])
+
+def guess_locale(value: str) -> str:
+    """
+        Retorna o idioma de um texto de data: a interface em inglês usa relógio de 12 horas
+        (AM/PM) e mês antes do dia; em português, 24 horas e dia antes do mês.
+
+        Parâmetros:
+        - value (str): Data no formato exibido pelo Power BI.
+    """
+
+    if UI_LOCALE != "auto":
+        return UI_LOCALE
+    return "en-US" if value.rstrip().upper().endswith(("AM", "PM")) else "pt-BR"
+
+@functools.lru_cache(maxsize=8192)
+def parse_title(value: str | None, locale: str | None = None) -> datetime.datetime | None:
+    """
+        Converte a data exibida na tela (atributo 'title') para datetime com fuso.
+        Retorna None para valores como "N/D" e "Desconhecida.".
+        Os textos se repetem muito numa execução: as conversões ficam em cache.
+
+        Parâmetros:
+        - value (str | None): Data no formato exibido pelo Power BI.
+        - locale (str | None, opcional): 'pt-BR' ou 'en-US'. Se None, é detectado pelo texto.
+    """
+
+    if not value or value in NO_DATES:
+        return None
+
+    for date_format in FORMATS.get(locale or guess_locale(value), ()):
+        try:
+            return localize(datetime.datetime.strptime(value.strip(), date_format))
+        except ValueError:
+            continue
+    return None
+
+@functools.lru_cache(maxsize=64)
+def parse_capture(value: str) -> datetime.datetime:
+    """
+        Converte a data hora da execução ('dd/mm/aaaa - HH:MM:SS') para datetime com fuso.
+
+        Parâmetros:
+        - value (str): Data hora no formato CAPTURE_FORMAT.
+    """
+
+    return localize(datetime.datetime.strptime(value, CAPTURE_FORMAT))
+
+def same_day(value: str | None, captured_at: str) -> bool:
+    """
+        Indica se a data exibida é do mesmo dia (no fuso configurado) que a execução.
+        Substitui a comparação dos 9 primeiros caracteres, que ignorava o último dígito do ano
+        e não funcionava com a interface em inglês.
+
+        Parâmetros:
+        - value (str | None): Data no formato exibido pelo Power BI.
+        - captured_at (str): Data hora da execução, no formato CAPTURE_FORMAT.
+    """
+
+    date = parse_title(value)
+    if date is None:
+        return False
+
+    captured = parse_capture(captured_at)
+    return date.astimezone(captured.tzinfo).date() == captured.date()
+
+def to_epoch(date: datetime.datetime | None) -> float:
+    """
+        Converte para segundos desde 1970 (UTC). None vira NaN (coluna numérica sem data).
+
+        Parâmetros:
+        - date (datetime | None): Data com fuso.
+    """
+
+    return math.nan if date is None else date.timestamp()
+
+def to_excel(epoch: float) -> datetime.datetime | None:
+    """
+        Converte segundos desde 1970 para datetime sem fuso, no fuso de TIMEZONE (o Excel não
+        guarda fuso). NaN vira None (célula vazia).
+
+        Parâmetros:
+        - epoch (float): Segundos desde 1970 (ver to_epoch).
+    """
+
+    if math.isnan(epoch):
+        return None
+    return datetime.datetime.fromtimestamp(epoch, zone()).replace(tzinfo=None)
@@ -0,0 +1,239 @@
+"""
+    Módulo responsável pela publicação incremental (delta) em uma lista do SharePoint.
+
+    Inclui:
+    - Snapshot local do que já foi publicado, com o ID de cada item da lista.
+    - Cálculo da diferença por Workspace + Relatório + Tipo (somente inclusões e alterações).
+    - Envio das diferenças em lotes pelo endpoint '$batch' da API REST do SharePoint.
+
+    A lista precisa ter as colunas (nomes internos) de FIELDS. O título do item é o relatório.
+    As colunas de OPTIONAL (tenant e detalhes da falha) só são enviadas quando preenchidas,
+    ou para limpar um valor já publicado.
+"""
+
+import email
+import email.policy
+import json
+import os
+import tempfile
+import uuid
+
+from requests.exceptions import RequestException
+
+from src import client
+from src.history import iter_rows
+from src.setup import Config, ENV_PATH, Logger
+
+LIST_NAME = Config.get("INIT", "LIST_NAME", fallback="").strip()
+SNAPSHOT_PATH = ENV_PATH.parent / "published.json"
+
+BATCH_SIZE = 100 # operações por requisição '$batch'
+BATCH_TIMEOUT = 120
+
+# colunas do arquivo (ordem de COLUMNS) -> nome interno da coluna na lista
+FIELDS = (
+    "DataHora", "Workspace", "Title", "Tipo", "UltimaAtualizacao", "AtualizadoHoje",
+    "SucessoAtualizacao", "ProximaAtualizacao", "AgendamentoCancelado", "Tenant",
+    "CodigoErro", "MensagemErro", "DuracaoSegundos", "Tentativas"
+)
+IGNORED = ("DataHora",) # muda em toda execução: não conta como diferença
+OPTIONAL = ("Tenant", "CodigoErro", "MensagemErro", "DuracaoSegundos", "Tentativas")
+
+JSON_TYPE = "application/json;odata=nometadata"
+
+def row_key(values: dict) -> str:
+    """
+        Chave de um artefato na lista: Workspace + Relatório + Tipo (+ Tenant, se houver).
+
+        Parâmetros:
+        - values (dict): Valores do item, com os nomes de FIELDS.
+    """
+
+    key = "|".join((values["Workspace"], values["Title"], values["Tipo"]))
+    return f"{values['Tenant']}|{key}" if values.get("Tenant") else key
+
+def parse_batch_response(content_type: str, body: bytes) -> list[tuple[int, dict]]:
+    """
+        Extrai, na ordem, o status HTTP e o corpo JSON de cada operação da resposta '$batch'.
+        A resposta é um multipart/mixed (com o changeset aninhado) cujo boundary vem no
+        Content-Type: as partes são separadas pelo parser MIME da biblioteca padrão, e não
+        por busca de texto, que confundiria um '--' dentro de um valor com um separador.
+
+        Parâmetros:
+        - content_type (str): Cabeçalho Content-Type da resposta, com o boundary.
+        - body (bytes): Corpo da resposta.
+    """
+
+    message = email.message_from_bytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode("ascii") + body,
+        policy=email.policy.HTTP
+    )
+    results = []
+
+    for part in message.walk():
+        if part.get_content_type() != "application/http":
+            continue
+
+        # cada parte é uma resposta HTTP inteira: linha de status, cabeçalhos e corpo
+        response = (part.get_payload(decode=True) or b"").replace(b"\r\n", b"\n")
+        head, _, content = response.partition(b"\n\n")
+        status = head.split(b"\n", 1)[0].split()
+        if len(status) < 2 or not status[1].isdigit():
+            continue
+
+        try:
+            data = json.loads(content) if content.strip().startswith(b"{") else {}
+        except ValueError:
+            data = {}
+
+        results.append((int(status[1]), data))
+
+    return results
+
+class ListPublisher:
+    """
+        Classe que publica somente as linhas novas ou alteradas em uma lista do SharePoint.
+
+        Métodos:
+        - diff(json): Retorna as inclusões e alterações em relação ao último snapshot.
+        - publish(json, access_token): Envia a diferença. Retorna False se algo falhar.
+    """
+
+    def __init__(self, site_url: str, list_name: str = LIST_NAME) -> None:
+        """
+            Parâmetros:
+            - site_url (str): Url do site, ex.: https://{dominio}.sharepoint.com/sites/{site}.
+            - list_name (str, opcional): Título da lista do SharePoint.
+        """
+
+        self.__site_url = site_url
+        self.__items_url = f"{site_url}/_api/web/lists/getbytitle('{list_name}')/items"
+
+        try:
+            with open(SNAPSHOT_PATH, "r", encoding="utf-8") as file:
+                self.__snapshot = json.load(file)
+        except (OSError, ValueError):
+            self.__snapshot = {}
+
+    def diff(self, data: dict) -> list[tuple[str, int | None, dict]]:
+        """
+            Compara o JSON com o snapshot publicado.
+            Retorna [(chave, id_do_item ou None para inclusão, valores)].
+
+            Parâmetros:
+            - data (dict | ResultSet): Dados extraídos (ver src/records.py).
+        """
+
+        changes = []
+
+        for row in iter_rows(data):
+            values = dict(zip(FIELDS, row))
+            key = row_key(values)
+            published = self.__snapshot.get(key)
+            old = published["values"] if published else {}
+
+            # vazio e nunca publicado (um só tenant, sem falha): a lista não precisa da coluna
+            for field in OPTIONAL:
+                if values[field] in ("", None) and not old.get(field):
+                    del values[field]
+
+            if published is None:
+                changes.append((key, None, values))
+                continue
+
+            if any(old.get(field) != values.get(field) for field in FIELDS if field not in IGNORED):
+                changes.append((key, published["id"], values))
+
+        return changes
+
+    def publish(self, data: dict, access_token: str) -> bool:
+        """
+            Envia as inclusões e alterações em lotes de BATCH_SIZE.
+            O snapshot é atualizado com cada lote aceito, mesmo que um lote posterior falhe.
+
+            Parâmetros:
+            - data (dict | ResultSet): Dados extraídos (ver src/records.py).
+            - access_token (str): Token de acesso do escopo do SharePoint.
+        """
+
+        changes = self.diff(data)
+        Logger.info("[Delta] %s linhas novas ou alteradas.", len(changes))
+
+        try:
+            for start in range(0, len(changes), BATCH_SIZE):
+                self.__send_batch(changes[start:start + BATCH_SIZE], access_token)
+        except RequestException as error:
+            Logger.error("[Delta] Falha ao publicar na lista: %s", error)
+            return False
+        finally:
+            self.__save()
+
+        return True
+
+    def __send_batch(self, changes: list, access_token: str) -> None:
+        """
+            Envia um lote de operações em um único changeset do '$batch'.
+
+            Parâmetros:
+            - changes (list): Parte do retorno de diff().
+            - access_token (str): Token de acesso do escopo do SharePoint.
+        """
+
+        batch = f"batch_{uuid.uuid4()}"
+        changeset = f"changeset_{uuid.uuid4()}"
+        lines = [f"--{batch}", f"Content-Type: multipart/mixed; boundary={changeset}", ""]
+
+        for _, item_id, values in changes:
+            lines += [
+                f"--{changeset}",
+                "Content-Type: application/http",
+                "Content-Transfer-Encoding: binary",
+                ""
+            ]
+            if item_id is None:
+                lines.append(f"POST {self.__items_url} HTTP/1.1")
+            else:
+                lines += [f"PATCH {self.__items_url}({item_id}) HTTP/1.1", "If-Match: *"]
+            lines += [
+                f"Content-Type: {JSON_TYPE}",
+                f"Accept: {JSON_TYPE}",
+                "",
+                json.dumps(values),
+                ""
+            ]
+
+        lines += [f"--{changeset}--", "", f"--{batch}--", ""]
+
+        response = client.post(
+            url=f"{self.__site_url}/_api/$batch",
+            headers={
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": f"multipart/mixed; boundary={batch}",
+                "Accept": JSON_TYPE
+            },
+            data="\r\n".join(lines).encode("utf-8"),
+            timeout=BATCH_TIMEOUT
+        )
+
+        results = parse_batch_response(
+            response.headers.get("Content-Type", ""), response.content
+        )
+
+        if response.status_code not in (200, 202) or len(results) != len(changes) or any(
+            status >= 300 for status, _ in results
+        ):
+            raise RequestException(f"Status: {response.status_code} | Lote recusado.")
+
+        for (key, item_id, values), (_, body) in zip(changes, results):
+            item_id = item_id or body.get("Id", body.get("ID"))
+            self.__snapshot[key] = {"id": item_id, "values": values}
+
+    def __save(self) -> None:
+        """
+            Grava o snapshot publicado, de forma atômica.
+        """
+
+        descriptor, temp_path = tempfile.mkstemp(dir=SNAPSHOT_PATH.parent, suffix=".tmp")
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            json.dump(self.__snapshot, file, ensure_ascii=False)
+        os.replace(temp_path, SNAPSHOT_PATH)
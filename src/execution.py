@@ -0,0 +1,256 @@
+"""
+    Módulo com o estado de uma execução da coleta (WebExtractor.get_info).
+
+    Inclui:
+    - Resultado da execução (ResultSet), alimentado pelas threads de leitura.
+    - Ligação com o estado local (src/state.py), o diário da execução (src/checkpoint.py),
+      as regras de seleção e o orçamento de tempo (src/selection.py).
+    - Plano da execução: o que é retomado do diário, o que é reaproveitado do estado e o que
+      precisa ser lido, na ordem de prioridade.
+"""
+
+import threading
+import time
+
+from src.checkpoint import Checkpoint
+from src.dates import capture_time
+from src.extract import UNKNOWN_DATE, build_execution_data
+from src.metrics import METRICS
+from src.records import ResultSet
+from src.selection import RunBudget, WorkspaceRules
+from src.setup import Logger
+from src.state import StateStore
+
+# linha publicada para uma workspace que ficou para a próxima execução sem dados salvos
+SKIPPED_NAME = "Não lida (orçamento de tempo esgotado)"
+SKIPPED_TYPE = "Workspace"
+
+def skipped_data(workspace_name: str) -> dict:
+    """
+        Retorna o dicionário {workspace: {artefato: dados}} com uma única linha que indica que a
+        workspace não foi lida. Sem ela, uma workspace nunca lida antes sumiria do arquivo.
+
+        Parâmetros:
+        - workspace_name (str): Nome da workspace.
+    """
+
+    return {workspace_name: {SKIPPED_NAME: {
+        "id": None,
+        "tipo": SKIPPED_TYPE,
+        "last_update": UNKNOWN_DATE,
+        "atualizado_hoje": False,
+        "update_success": True, # não houve falha de atualização, só a leitura ficou para depois
+        "next_update": UNKNOWN_DATE,
+        "agendamento_cancelado": False
+    }}}
+
+class Execution:
+    """
+        Classe que reúne o que muda a cada execução da coleta, fora dos navegadores.
+        As workspaces são identificadas pelo ID (sem a url do Power BI).
+
+        Métodos:
+        - start(): Começa uma execução nova ou retoma a interrompida (diário).
+        - select(groups): Aplica as regras de seleção às workspaces da API.
+        - plan(workspace_ids, done): Junta o que não precisa ser lido e retorna o resto.
+        - name(workspace_id): Nome da workspace.
+        - over_budget(workspace_id): Se o tempo acabou, reaproveita a workspace e retorna True.
+        - fail(workspace_id): Registra a workspace que esgotou as tentativas.
+        - merge(execution_data, workspace_id): Junta dados no formato legado.
+        - merge_rows(workspace_id, workspace_name, rows): Junta as linhas lidas da tela.
+        - finish(): Remove o diário (execução concluída).
+        - close(): Fecha o diário e grava o estado local.
+    """
+
+    def __init__(self) -> None:
+        self.results = ResultSet(capture_time())
+
+        self.__groups = {} # ID da workspace: workspace retornada pela API (/groups)
+        self.__rules = WorkspaceRules()
+        self.__budget = RunBudget()
+        self.__state = StateStore()
+        self.__checkpoint = Checkpoint()
+        self.__lock = threading.Lock()
+
+    @property
+    def captured_at(self) -> str:
+        """
+            Data hora da execução, no formato 'dd/mm/aaaa - HH:MM:SS'.
+        """
+
+        return self.results.captured_at
+
+    def start(self) -> dict:
+        """
+            Começa uma execução. Se houver uma interrompida (diário dentro de CHECKPOINT_TTL),
+            mantém a data hora dela. Retorna as workspaces já lidas: {ID: {read_at, data}}.
+        """
+
+        self.__groups = {}
+        self.__budget = RunBudget()
+        captured_at = capture_time()
+
+        # execução anterior interrompida: mantém a data hora dela e pula o que já foi lido
+        resumed = self.__checkpoint.resume()
+        done = None
+        if resumed:
+            captured_at, done = resumed
+            Logger.info(
+                "[Checkpoint] Retomando a execução de %s: %s workspaces já lidas.",
+                captured_at, len(done)
+            )
+
+        self.results = ResultSet(captured_at)
+        self.__checkpoint.start(captured_at, done)
+        return done or {}
+
+    def select(self, groups: list[dict]) -> list[str]:
+        """
+            Aplica as regras de seleção e retorna os IDs das workspaces escolhidas.
+
+            Parâmetros:
+            - groups (list[dict]): Workspaces retornadas pela API (/groups).
+        """
+
+        for group in self.__rules.select(groups):
+            self.__groups[group["id"]] = group
+        return list(self.__groups)
+
+    def name(self, workspace_id: str) -> str:
+        """
+            Retorna o nome da workspace (ou o ID, se a API não informou o nome).
+
+            Parâmetros:
+            - workspace_id (str): ID da workspace.
+        """
+
+        return self.__groups.get(workspace_id, {}).get("name", workspace_id)
+
+    def plan(self, workspace_ids: list[str], done: dict) -> list[str]:
+        """
+            Junta ao resultado as workspaces retomadas do diário e as que não mudaram desde
+            a última leitura. Retorna os IDs que precisam ser lidos: críticas primeiro e,
+            depois, as que venceram há mais tempo.
+
+            Parâmetros:
+            - workspace_ids (list[str]): IDs das workspaces selecionadas (ver select).
+            - done (dict): Workspaces retomadas do diário (ver start).
+        """
+
+        due = []
+
+        for workspace_id in workspace_ids:
+            if workspace_id in done:
+                self.__resume(workspace_id, done[workspace_id])
+                METRICS.count("workspaces_total", result="resumed")
+            elif self.__state.is_due(workspace_id):
+                due.append(self.__groups.get(workspace_id, {"id": workspace_id}))
+            else:
+                self.merge(self.__state.carried(workspace_id, self.captured_at))
+                METRICS.count("workspaces_total", result="carried")
+
+        groups = self.__rules.order(due, self.__state.due_at)
+        Logger.info("[Estado] %s workspaces serão lidas nesta execução.", len(groups))
+
+        return [group["id"] for group in groups]
+
+    def over_budget(self, workspace_id: str) -> bool:
+        """
+            Se o orçamento de tempo acabou, reaproveita os dados salvos da workspace e retorna
+            True: a leitura fica para a próxima execução. Sem dados salvos, publica uma linha
+            que indica que a workspace não foi lida (ver skipped_data).
+
+            Parâmetros:
+            - workspace_id (str): ID da workspace que seria lida.
+        """
+
+        if not self.__budget.expired():
+            return False
+
+        Logger.info("[Seleção] Orçamento de tempo esgotado. %s fica para a próxima.", workspace_id)
+        carried = self.__state.carried(workspace_id, self.captured_at)
+        self.merge(carried or skipped_data(self.name(workspace_id)))
+        METRICS.count("workspaces_total", result="skipped")
+        return True
+
+    def fail(self, workspace_id: str) -> None:
+        """
+            Registra a workspace que esgotou as tentativas. Os dados salvos dela (se houver)
+            são reaproveitados e ela vence no estado local: a próxima execução a lê primeiro.
+
+            Parâmetros:
+            - workspace_id (str): ID da workspace que não foi lida.
+        """
+
+        METRICS.count("workspaces_total", result="failed")
+        carried = self.__state.carried(workspace_id, self.captured_at)
+
+        with self.__lock:
+            self.__state.fail(workspace_id)
+            self.results.add_json(carried)
+
+    def merge(self, execution_data: dict, workspace_id: str | None = None) -> None:
+        """
+            Junta os dados de uma workspace ao resultado da execução (seguro entre threads).
+
+            Parâmetros:
+            - execution_data (dict): Dicionário {workspace: {artefato: dados}}.
+            - workspace_id (str | None): ID da workspace lida. Se informado, o estado local é
+              atualizado e a workspace é gravada no diário da execução.
+        """
+
+        read_at = time.time()
+
+        with self.__lock:
+            if workspace_id:
+                self.__state.update(workspace_id, execution_data, read_at)
+                self.__checkpoint.record(workspace_id, execution_data, read_at)
+            self.results.add_json(execution_data)
+
+    def merge_rows(self, workspace_id: str, workspace_name: str, rows: list[dict]) -> None:
+        """
+            Junta as linhas lidas de uma workspace ao resultado e atualiza o estado local.
+
+            Parâmetros:
+            - workspace_id (str): ID da workspace lida.
+            - workspace_name (str): Nome da workspace.
+            - rows (list[dict]): Linhas extraídas (ver src/extract.py).
+        """
+
+        execution_data = build_execution_data(workspace_name, rows, self.captured_at)
+        read_at = time.time()
+
+        with self.__lock:
+            self.__state.update(workspace_id, execution_data, read_at)
+            self.__checkpoint.record(workspace_id, execution_data, read_at)
+            self.results.add_rows(workspace_name, rows)
+
+    def __resume(self, workspace_id: str, entry: dict) -> None:
+        """
+            Junta uma workspace retomada do diário, sem gravá-la de novo. O estado local fica
+            com a hora da leitura original, e não a da retomada.
+
+            Parâmetros:
+            - workspace_id (str): ID da workspace.
+            - entry (dict): Linha do diário: {"read_at": ..., "data": ...}.
+        """
+
+        with self.__lock:
+            self.__state.update(workspace_id, entry["data"], entry["read_at"])
+            self.results.add_json(entry["data"])
+
+    def finish(self) -> None:
+        """
+            Remove o diário: a execução terminou e não há o que retomar. As workspaces que
+            falharam não dependem dele (ver fail).
+        """
+
+        self.__checkpoint.clear()
+
+    def close(self) -> None:
+        """
+            Fecha o diário (mantido em disco, se a execução não terminou) e grava o estado.
+        """
+
+        self.__checkpoint.close()
+        self.__state.save()
@@ -0,0 +1,126 @@
+"""
+    Módulo com a extração das linhas da lista de artefatos de uma workspace.
+
+    Inclui:
+    - Extração rápida dentro do navegador: um único 'execute_script' devolve as linhas já em
+      JSON, sem trafegar o 'page_source' inteiro (vários MB de DOM do Angular).
+    - Conversão das linhas para o dicionário usado na tela de monitoramento.
+
+    A extração retorna (nome_da_workspace, linhas), em que cada linha é um dicionário com:
+    'id', 'name', 'type', 'last_refresh', 'next_refresh' e 'failed'.
+    Os parsers de HTML salvo (usados só na comparação do benchmark) ficam em
+    benchmarks/parsers.py.
+"""
+
+from typing import TYPE_CHECKING
+
+from src.dates import same_day
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+UNKNOWN_NAME = "Desconhecido (a)"
+UNKNOWN_TYPE = "Desconhecido"
+UNKNOWN_DATE = "Desconhecida."
+
+# função JS que converte uma linha (div[role='row']) no dicionário descrito acima
+EXTRACT_ROW_JS = """
+    (row) => {
+        const title = (cell, fallback) => {
+            const span = row.querySelector(`span[data-testid='fluentListCell.${cell}']`);
+            return (span && span.getAttribute("title")) || fallback;
+        };
+        const container = row.querySelector("span.name-container");
+        const link = container && container.querySelector(
+            "a.name, a.trimmedTextWithEllipsis, a.ng-star-inserted"
+        );
+        const icons = row.querySelector("span.dataflow-refresh-icons");
+        const name = link && link.textContent.trim();
+        return {
+            id: (link && link.getAttribute("href")) || null,
+            name: name || "%s",
+            type: title("type", "%s"),
+            last_refresh: title("lastRefresh", "%s"),
+            next_refresh: title("nextRefresh", "%s"),
+            failed: Boolean(
+                row.querySelector("i.warning, i.glyphicon, i.pbi-glyph-warning, i.glyph-small")
+                || (icons && icons.querySelector(
+                    "button.glyphicon, button.pbi-glyph-warning, button.ng-star-inserted"
+                ))
+            )
+        };
+    }
+""" % (UNKNOWN_NAME, UNKNOWN_TYPE, UNKNOWN_DATE, UNKNOWN_DATE)
+
+# função JS que retorna o nome da workspace exibido no cabeçalho
+WORKSPACE_NAME_JS = """
+    () => {
+        const title = document.querySelector(
+            "h1.workspace-name, h1.tri-text-overflow-ellipsis, h1.tri-subtitle1"
+        );
+        return (title && title.textContent.trim()) || "%s";
+    }
+""" % UNKNOWN_NAME
+
+VISIBLE_ROWS_JS = f"""
+    const extract = {EXTRACT_ROW_JS};
+    const workspaceName = ({WORKSPACE_NAME_JS})();
+    const wrapper = document.querySelector(
+        "cdk-virtual-scroll-viewport#artifactContentView .cdk-virtual-scroll-content-wrapper"
+    );
+    if (!wrapper) {{ return null; }}
+    return [workspaceName, [...wrapper.querySelectorAll("div[role='row']")].map(extract)];
+"""
+
+def read_rows(driver: "webdriver") -> tuple[str, list[dict]] | None:
+    """
+        Extrai, dentro do navegador, as linhas visíveis da lista de artefatos.
+        Retorna None se a lista não existir na página.
+
+        Parâmetros:
+        - driver (webdriver): Instância do WebDriver do Selenium. É a instância do navegador ativo.
+    """
+
+    result = driver.execute_script(VISIBLE_ROWS_JS)
+    return tuple(result) if result else None
+
+def build_execution_data(workspace_name: str, rows: list[dict], current_date: str) -> dict:
+    """
+        Converte as linhas extraídas no dicionário {workspace: {artefato: dados}}.
+        Pastas são ignoradas.
+
+        Parâmetros:
+        - workspace_name (str): Nome da workspace.
+        - rows (list[dict]): Linhas retornadas por uma das formas de extração.
+        - current_date (str): Data hora da execução, no formato 'dd/mm/aaaa - HH:MM:SS'.
+    """
+
+    execution_data = {}
+
+    for row in rows:
+        file_type = row["type"]
+
+        if file_type == "Pasta":
+            continue
+
+        if workspace_name not in execution_data:
+            execution_data[workspace_name] = {}
+
+        name = row["name"]
+        if name in execution_data[workspace_name]:
+            name = name + " " + file_type
+
+        last_refresh = row["last_refresh"]
+        next_upt = row["next_refresh"]
+
+        execution_data[workspace_name][name] = {
+            "id": row.get("id"),
+            "tipo": file_type,
+            "last_update": last_refresh,
+            "atualizado_hoje": same_day(last_refresh, current_date),
+            "update_success": not row["failed"], # inverte: se tiver valor, deu erro
+            "next_update": next_upt,
+            "agendamento_cancelado": next_upt == "N/D"
+        }
+
+    return execution_data
@@ -0,0 +1,161 @@
+"""
+    Módulo que detalha as falhas de atualização pela API REST do Power BI.
+
+    A tela só mostra um ícone de alerta; aqui, somente os artefatos marcados com falha têm o
+    histórico de atualizações consultado (código e mensagem do erro, duração e tentativas).
+    O custo acompanha a quantidade de falhas, e não a de artefatos.
+
+    Inclui:
+    - Conversão do link do artefato (ID da linha) para o caminho na API.
+    - Leitura do histórico ('refreshes' dos modelos semânticos e 'transactions' dos fluxos de
+      dados) em lotes de FAILURE_BATCH, em paralelo pela camada HTTP (client.fan_out).
+"""
+
+import datetime
+import json
+import re
+from requests.exceptions import RequestException
+
+from src import client
+from src.api import API_URL
+from src.client import TIMEOUT
+from src.metrics import METRICS
+from src.records import FailureDetail, ResultSet
+from src.setup import Config, Logger
+
+ENRICH_FAILURES = Config.get("INIT", "ENRICH_FAILURES", fallback="true").lower() == "true"
+FAILURE_BATCH = max(1, Config.getint("INIT", "FAILURE_BATCH", fallback=50)) # artefatos por lote
+
+HISTORY_TOP = 5 # atualizações lidas do histórico de cada artefato
+FAILED_STATUS = ("Failed", "Cancelled")
+
+# ex.: /groups/{workspace}/datasets/{id}/details?experience=power-bi
+HREF_PATTERN = re.compile(
+    r"/groups/(?P<group>[^/?#]+)/(?P<kind>datasets|dataflows)/(?P<artifact>[^/?#]+)"
+)
+
+def history_path(href: str) -> str | None:
+    """
+        Retorna o caminho do histórico de atualizações do artefato na API, a partir do link
+        exibido na lista. Retorna None para artefatos sem histórico (relatórios, painéis...).
+
+        Parâmetros:
+        - href (str): Link do artefato (ID da linha no ResultSet).
+    """
+
+    match = HREF_PATTERN.search(href or "")
+    if not match:
+        return None
+
+    group = match["group"]
+    if group == "me" and match["kind"] == "dataflows":
+        return None # a API de fluxos de dados não atende o Meu workspace
+
+    base = "" if group == "me" else f"/groups/{group}" # 'me' = Meu workspace
+    endpoint = "refreshes" if match["kind"] == "datasets" else "transactions"
+
+    return f"{base}/{match['kind']}/{match['artifact']}/{endpoint}?$top={HISTORY_TOP}"
+
+def parse_iso(value: str | None) -> datetime.datetime | None:
+    """
+        Converte uma data ISO 8601 da API (ex.: '2025-01-31T10:00:00.123Z') para datetime.
+
+        Parâmetros:
+        - value (str | None): Data retornada pela API.
+    """
+
+    try:
+        return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+
+def failure_detail(history: list[dict]) -> FailureDetail | None:
+    """
+        Monta o detalhe a partir da atualização com falha mais recente do histórico.
+        Retorna None se nenhuma atualização do histórico falhou.
+
+        Parâmetros:
+        - history (list[dict]): Histórico retornado pela API, do mais recente ao mais antigo.
+    """
+
+    refresh = next((item for item in history if item.get("status") in FAILED_STATUS), None)
+    if refresh is None:
+        return None
+
+    try:
+        error = json.loads(refresh.get("serviceExceptionJson") or "{}")
+    except ValueError:
+        error = {}
+    if not isinstance(error, dict):
+        error = {}
+
+    start = parse_iso(refresh.get("startTime"))
+    end = parse_iso(refresh.get("endTime"))
+    attempts = refresh.get("refreshAttempts")
+
+    return FailureDetail(
+        code=error.get("errorCode") or refresh["status"],
+        message=error.get("errorDescription") or error.get("message") or "",
+        duration=(end - start).total_seconds() if start and end else None,
+        attempts=len(attempts) if attempts else None
+    )
+
+def fetch_detail(path: str, headers: dict) -> FailureDetail | None:
+    """
+        Lê o histórico de um artefato e retorna o detalhe da falha.
+        Erros da API são registrados e não interrompem os demais artefatos.
+
+        Parâmetros:
+        - path (str): Caminho do histórico (ver history_path).
+        - headers (dict): Cabeçalhos com o token de acesso.
+    """
+
+    try:
+        response = client.get(url=API_URL + path, headers=headers, timeout=TIMEOUT)
+        response.raise_for_status()
+        return failure_detail(response.json().get("value", []))
+    except (RequestException, ValueError) as error:
+        Logger.info("[Falhas] Sem histórico em %s: %s", path, error)
+        return None
+
+def enrich_failures(results: ResultSet, access_token: str, batch: int = FAILURE_BATCH) -> int:
+    """
+        Detalha os artefatos com falha do resultado. Retorna quantos foram detalhados.
+
+        Parâmetros:
+        - results (ResultSet): Resultado da execução. Os detalhes são guardados nele.
+        - access_token (str): Token de acesso do escopo do Power BI (o mesmo da coleta).
+        - batch (int, opcional): Artefatos por lote.
+    """
+
+    targets = []
+    for tenant, artifact_id in results.failures():
+        path = history_path(artifact_id)
+        if path:
+            targets.append((tenant, artifact_id, path))
+        else:
+            METRICS.count("failures_enriched_total", result="unsupported")
+
+    if not targets:
+        return 0
+
+    Logger.info("[Falhas] Detalhando %s artefatos com falha...", len(targets))
+    headers = {"Authorization": f"Bearer {access_token}"}
+    enriched = 0
+
+    # lotes limitados: a concorrência e o limite de requisições ficam com a camada HTTP
+    for start in range(0, len(targets), batch):
+        chunk = targets[start:start + batch]
+        details = client.fan_out(lambda target: fetch_detail(target[2], headers), chunk)
+
+        for (tenant, artifact_id, _), detail in zip(chunk, details):
+            if detail is None:
+                METRICS.count("failures_enriched_total", result="missing")
+                continue
+
+            results.attach(tenant, artifact_id, detail)
+            METRICS.count("failures_enriched_total", result="enriched")
+            enriched += 1
+
+    Logger.info("[Falhas] %s de %s falhas detalhadas.", enriched, len(targets))
+    return enriched
@@ -0,0 +1,153 @@
+"""
+    Módulo com os indicadores de atualização (frescor) de uma execução, calculados de uma vez
+    sobre todas as linhas (NumPy/pandas), a partir das datas numéricas do ResultSet.
+
+    Inclui:
+    - Defasagem (staleness): horas desde a última atualização.
+    - Atraso (lateness): minutos desde a próxima atualização agendada, se ela já passou.
+    - Violação de SLA: falha na última atualização, defasagem acima de SLA_HOURS ou atraso
+      acima de LATE_TOLERANCE (settings.ini).
+    - Colunas numéricas por artefato (ARTIFACT_COLUMNS), acrescentadas à aba principal do
+      arquivo Excel: datas como datetime e os indicadores acima como números.
+    - Resumo por workspace, publicado na aba SLA_SHEET do arquivo Excel.
+"""
+
+import math
+from typing import TYPE_CHECKING, Iterator
+
+from src.dates import now, to_excel
+from src.records import TIME_COLUMNS, RefreshStatus, ResultSet
+from src.setup import Config, Logger
+
+if TYPE_CHECKING:
+    import pandas
+
+SLA_HOURS = Config.getint("INIT", "SLA_HOURS", fallback=24) # defasagem máxima, em horas
+LATE_TOLERANCE = Config.getint("INIT", "LATE_TOLERANCE", fallback=30) # atraso máximo, em minutos
+
+SLA_SHEET = "SLA"
+SLA_COLUMNS = [
+    "Tenant", "Workspace", "Artefatos", "Com Falha", "Sem Data", "Atrasados",
+    "Maior Defasagem (h)", "Maior Atraso (min)", "Violações de SLA"
+]
+ARTIFACT_COLUMNS = [*TIME_COLUMNS, "Defasagem (h)", "Atraso (min)", "Violação de SLA"]
+
+def artifact_frame(
+    results: ResultSet,
+    current: float | None = None,
+    sla_hours: float = SLA_HOURS,
+    late_tolerance: float = LATE_TOLERANCE
+) -> "pandas.DataFrame":
+    """
+        Retorna um DataFrame com uma linha por artefato e os indicadores numéricos.
+        Datas desconhecidas ficam como NaN e não contam como defasagem nem atraso.
+
+        Parâmetros:
+        - results (ResultSet): Resultado da execução.
+        - current (float | None, opcional): Momento de referência, em segundos desde 1970.
+        - sla_hours (float, opcional): Defasagem máxima, em horas.
+        - late_tolerance (float, opcional): Atraso máximo, em minutos.
+    """
+
+    import numpy # pylint: disable=import-outside-toplevel
+    import pandas # pylint: disable=import-outside-toplevel
+
+    current = now().timestamp() if current is None else current
+
+    last_update = numpy.asarray(results.column("last_update_at"), dtype=numpy.float64)
+    next_update = numpy.asarray(results.column("next_update_at"), dtype=numpy.float64)
+    status = numpy.asarray(results.column("status"), dtype=numpy.int8)
+
+    staleness = (current - last_update) / 3600
+    overdue = (current - next_update) / 60
+    lateness = numpy.where(overdue > 0, overdue, 0.0)
+    lateness[numpy.isnan(next_update)] = numpy.nan
+
+    failed = status == RefreshStatus.FAILED
+    stale = staleness > sla_hours # NaN > x é False
+    late = lateness > late_tolerance
+
+    return pandas.DataFrame({
+        "tenant": pandas.Categorical(results.column("tenant")),
+        "workspace": pandas.Categorical(results.column("workspace")),
+        "name": results.column("name"),
+        "failed": failed,
+        "unknown": numpy.isnan(last_update),
+        "staleness_hours": staleness,
+        "lateness_minutes": lateness,
+        "late": late,
+        "sla_breach": failed | stale | late
+    })
+
+def workspace_sla(frame: "pandas.DataFrame") -> "pandas.DataFrame":
+    """
+        Agrupa os indicadores de artifact_frame por tenant e workspace.
+
+        Parâmetros:
+        - frame (pandas.DataFrame): Retorno de artifact_frame.
+    """
+
+    summary = frame.groupby(["tenant", "workspace"], observed=True, sort=True).agg(
+        artifacts=("name", "size"),
+        failed=("failed", "sum"),
+        unknown=("unknown", "sum"),
+        late=("late", "sum"),
+        max_staleness_hours=("staleness_hours", "max"),
+        max_lateness_minutes=("lateness_minutes", "max"),
+        sla_breaches=("sla_breach", "sum")
+    )
+    return summary.reset_index()
+
+def artifact_rows(results: ResultSet, frame: "pandas.DataFrame") -> Iterator[list]:
+    """
+        Gera as colunas numéricas de cada artefato (ordem de ARTIFACT_COLUMNS), na mesma ordem
+        de results.iter_rows(). Datas e indicadores desconhecidos viram células vazias.
+
+        Parâmetros:
+        - results (ResultSet): Resultado da execução.
+        - frame (pandas.DataFrame): Retorno de artifact_frame para results.
+    """
+
+    # tolist(): números do NumPy viram números do Python (openpyxl)
+    staleness = frame["staleness_hours"].round(1).tolist()
+    lateness = frame["lateness_minutes"].round().tolist()
+
+    for last_update, next_update, hours, minutes, breach in zip(
+        results.column("last_update_at"), results.column("next_update_at"),
+        staleness, lateness, frame["sla_breach"].tolist()
+    ):
+        yield [
+            to_excel(last_update), to_excel(next_update),
+            None if math.isnan(hours) else hours,
+            None if math.isnan(minutes) else int(minutes),
+            breach
+        ]
+
+def sla_rows(frame: "pandas.DataFrame") -> Iterator[list]:
+    """
+        Calcula o resumo por workspace e gera as linhas da aba SLA (ordem de SLA_COLUMNS).
+
+        Parâmetros:
+        - frame (pandas.DataFrame): Retorno de artifact_frame.
+    """
+
+    if frame.empty:
+        return
+
+    summary = workspace_sla(frame)
+
+    breaches = int(summary["sla_breaches"].sum())
+    Logger.info(
+        "[SLA] %s violações em %s de %s workspaces.",
+        breaches, int((summary["sla_breaches"] > 0).sum()), len(summary)
+    )
+
+    # NaN vira célula vazia; números do NumPy viram números do Python (openpyxl)
+    for row in summary.astype(object).where(summary.notna(), None).itertuples(index=False):
+        yield [
+            row.tenant, row.workspace, int(row.artifacts), int(row.failed), int(row.unknown),
+            int(row.late),
+            None if row.max_staleness_hours is None else round(float(row.max_staleness_hours), 1),
+            None if row.max_lateness_minutes is None else round(float(row.max_lateness_minutes)),
+            int(row.sla_breaches)
+        ]
@@ -0,0 +1,77 @@
+"""
+    Módulo responsável por colher todas as linhas da lista virtual de artefatos.
+
+    A lista do Power BI (cdk-virtual-scroll-viewport) só renderiza as linhas visíveis.
+    Aqui, a rolagem é feita dentro do navegador, em uma única chamada: a cada passo as linhas
+    novas são extraídas (sem repetir artefatos) e a rolagem para quando nada novo aparece.
+"""
+
+from typing import TYPE_CHECKING
+
+from src.extract import EXTRACT_ROW_JS, WORKSPACE_NAME_JS
+from src.setup import Config, Logger
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+FULL_SCROLL = Config.get("INIT", "FULL_SCROLL", fallback="true").lower() == "true"
+
+STEP_RATIO = 0.9 # fração da altura visível rolada a cada passo
+SETTLE_TIME = 150 # milissegundos esperando o Angular renderizar as linhas após rolar
+MAX_STEPS = 500 # limite de passos por workspace
+
+HARVEST_JS = """
+    const [stepRatio, settle, maxSteps, done] = arguments;
+    const extract = %s;
+    const workspaceName = (%s)();
+    const viewport = document.getElementById("artifactContentView");
+    if (!viewport) { done(null); return; }
+
+    const rows = new Map();
+    const collect = () => {
+        let added = 0;
+        viewport.querySelectorAll("div[role='row']").forEach((row) => {
+            const link = row.querySelector("span.name-container a");
+            const key = (link && link.getAttribute("href")) || row.innerText;
+            if (!rows.has(key)) { rows.set(key, extract(row)); added++; }
+        });
+        return added;
+    };
+
+    let steps = 0;
+    let idle = 0;
+    const step = () => {
+        const added = collect();
+        const bottom = viewport.scrollTop + viewport.clientHeight >= viewport.scrollHeight - 1;
+        idle = added ? 0 : idle + 1;
+
+        if ((bottom && idle > 0) || idle >= 3 || ++steps >= maxSteps) {
+            viewport.scrollTop = 0;
+            done([workspaceName, [...rows.values()]]);
+            return;
+        }
+
+        viewport.scrollTop += viewport.clientHeight * stepRatio;
+        setTimeout(step, settle);
+    };
+    step();
+""" % (EXTRACT_ROW_JS, WORKSPACE_NAME_JS)
+
+def harvest_rows(driver: "webdriver", timeout: float) -> tuple[str, list[dict]] | None:
+    """
+        Rola a lista de artefatos até o fim e retorna o nome da workspace e todas as linhas,
+        já extraídas (ver src/extract.py), sem repetições. Retorna None se a lista não existir.
+        As linhas são identificadas pelo link do artefato (que contém o ID dele).
+
+        Parâmetros:
+        - driver (webdriver): Instância do WebDriver do Selenium. É a instância do navegador ativo.
+        - timeout (float): Tempo extra de espera, em segundos, além do tempo dos passos.
+    """
+
+    driver.set_script_timeout(timeout + MAX_STEPS * SETTLE_TIME / 1000)
+    result = driver.execute_async_script(HARVEST_JS, STEP_RATIO, SETTLE_TIME, MAX_STEPS)
+    if not result:
+        return None
+
+    Logger.info("[Selenium] %s linhas colhidas na lista virtual.", len(result[1]))
+    return tuple(result)
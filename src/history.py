@@ -0,0 +1,257 @@
+"""
+    Módulo com o histórico local das execuções (SQLite), ao qual cada execução acrescenta linhas.
+
+    Inclui:
+    - Formato das linhas publicadas (COLUMNS) e o gerador que achata o JSON extraído.
+    - Armazenamento append-only, com índices por tenant, workspace, artefato e data hora.
+    - Compactação: remove o que passou da retenção; o arquivo só é reorganizado (VACUUM) quando
+      as páginas livres passam de VACUUM_FREE_RATIO.
+    - Exportação de uma janela móvel (últimos N dias) para .xlsx, com memória constante.
+"""
+
+import datetime
+import sqlite3
+import tempfile
+from typing import IO, Iterable, Iterator
+
+from src.metrics import stage
+from src.setup import Config, ENV_PATH, Logger
+
+HISTORY_PATH = ENV_PATH.parent / "history.sqlite3"
+
+HISTORY_DAYS = Config.getint("INIT", "HISTORY_DAYS", fallback=30) # janela exportada
+HISTORY_RETENTION = Config.getint("INIT", "HISTORY_RETENTION", fallback=180) # dias guardados
+
+DATE_FORMAT = "%d/%m/%Y - %H:%M:%S" # formato da data hora da execução
+SPOOL_SIZE = 8 * 1024 ** 2 # bytes do arquivo mantidos em memória antes de ir para o disco
+VACUUM_FREE_RATIO = 0.25 # fração de páginas livres a partir da qual o banco é reorganizado
+
+COLUMNS = [
+    "Data e Hora", "Workspace", "Relatório", "Tipo", "Última Atualização", "Atualizado Hoje",
+    "Sucesso na Atualização", "Próxima Atualização", "Agendamento Cancelado", "Tenant",
+    "Código do Erro", "Mensagem do Erro", "Duração (s)", "Tentativas"
+]
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS snapshots (
+        captured_at TEXT NOT NULL,
+        workspace TEXT NOT NULL,
+        artifact TEXT NOT NULL,
+        tipo TEXT,
+        last_update TEXT,
+        atualizado_hoje INTEGER,
+        update_success INTEGER,
+        next_update TEXT,
+        agendamento_cancelado INTEGER,
+        tenant TEXT,
+        error_code TEXT,
+        error_message TEXT,
+        duration REAL,
+        attempts INTEGER
+    );
+    CREATE INDEX IF NOT EXISTS idx_snapshots_captured ON snapshots (captured_at);
+"""
+
+# criados depois de MIGRATIONS: dependem de colunas que bancos antigos não tinham
+INDEXES = """
+    DROP INDEX IF EXISTS idx_snapshots_artifact;
+    CREATE INDEX IF NOT EXISTS idx_snapshots_tenant_artifact
+        ON snapshots (tenant, workspace, artifact, captured_at);
+"""
+
+# colunas criadas depois da primeira versão do banco
+MIGRATIONS = {
+    "tenant": "TEXT DEFAULT ''",
+    "error_code": "TEXT DEFAULT ''",
+    "error_message": "TEXT DEFAULT ''",
+    "duration": "REAL",
+    "attempts": "INTEGER"
+}
+
+def iter_rows(json) -> Iterator[list]:
+    """
+        Percorre o JSON (data hora -> workspace -> relatório) gerando uma linha por vez,
+        na ordem de COLUMNS, sem montar a tabela inteira em memória.
+
+        Parâmetros:
+        - json (dict | ResultSet): Dados extraídos. Um ResultSet (src/records.py) já gera
+        as próprias linhas.
+    """
+
+    if hasattr(json, "iter_rows"):
+        yield from json.iter_rows()
+        return
+
+    for timestamp, workspaces in json.items():
+        for workspace, reports in workspaces.items():
+            for report_name, report_data in reports.items():
+                yield [
+                    timestamp,
+                    workspace,
+                    report_name,
+                    report_data["tipo"],
+                    report_data["last_update"],
+                    report_data["atualizado_hoje"],
+                    report_data["update_success"],
+                    report_data["next_update"],
+                    report_data["agendamento_cancelado"],
+                    report_data.get("tenant", ""), # preenchido no modo multi-tenant
+                    # preenchidos só para falhas detalhadas (src/failures.py)
+                    report_data.get("error_code", ""),
+                    report_data.get("error_message", ""),
+                    report_data.get("duration"),
+                    report_data.get("attempts")
+                ]
+
+def write_xlsx(
+    rows: Iterable[list], sheets: dict | None = None, header: list | None = None
+) -> IO[bytes]:
+    """
+        Escreve as linhas (ordem de COLUMNS) em um .xlsx, uma a uma (workbook 'write-only').
+        O arquivo temporário só vai para o disco se passar de SPOOL_SIZE.
+
+        Parâmetros:
+        - rows (Iterable[list]): Linhas na ordem do cabeçalho.
+        - sheets (dict | None, opcional): Abas extras, {nome: (cabeçalho, linhas)}.
+        - header (list | None, opcional): Cabeçalho da aba principal (padrão: COLUMNS).
+    """
+
+    import openpyxl # pylint: disable=import-outside-toplevel
+
+    workbook = openpyxl.Workbook(write_only=True)
+
+    for title, (header, sheet_rows) in {None: (header or COLUMNS, rows), **(sheets or {})}.items():
+        sheet = workbook.create_sheet(title)
+        sheet.append(header)
+        for row in sheet_rows:
+            sheet.append(row)
+
+    # o arquivo é devolvido aberto: quem o recebe (ex.: upload) é que o fecha
+    excel_file = tempfile.SpooledTemporaryFile( # pylint: disable=consider-using-with
+        max_size=SPOOL_SIZE
+    )
+    with stage("serialize"):
+        workbook.save(excel_file)
+    excel_file.seek(0)
+
+    return excel_file
+
+def to_iso(timestamp: str) -> str:
+    """
+        Converte a data hora da execução ('dd/mm/aaaa - HH:MM:SS') para ISO, que é ordenável.
+
+        Parâmetros:
+        - timestamp (str): Data hora no formato DATE_FORMAT.
+    """
+
+    return datetime.datetime.strptime(timestamp, DATE_FORMAT).isoformat(sep=" ")
+
+class HistoryStore:
+    """
+        Classe que guarda todas as execuções em um banco SQLite local.
+
+        Métodos:
+        - append(json): Acrescenta as linhas de uma execução.
+        - compact(retention): Remove execuções antigas e, se preciso, reorganiza o arquivo.
+        - export_xlsx(days): Gera um .xlsx com os últimos N dias.
+        - close(): Fecha a conexão.
+    """
+
+    def __init__(self, path=HISTORY_PATH) -> None:
+        """
+            Parâmetros:
+            - path (Path | str, opcional): Caminho do banco SQLite.
+        """
+
+        self.__connection = sqlite3.connect(path)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.executescript(SCHEMA)
+
+        # bancos criados antes das colunas de MIGRATIONS
+        columns = [row[1] for row in self.__connection.execute("PRAGMA table_info(snapshots)")]
+        for column, definition in MIGRATIONS.items():
+            if column not in columns:
+                self.__connection.execute(
+                    f"ALTER TABLE snapshots ADD COLUMN {column} {definition}"
+                )
+
+        # um artefato é identificado por tenant + workspace + relatório (modo multi-tenant)
+        self.__connection.executescript(INDEXES)
+
+    def __enter__(self) -> "HistoryStore":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def append(self, json: dict) -> int:
+        """
+            Acrescenta ao histórico as linhas do JSON. Retorna a quantidade de linhas inseridas.
+
+            Parâmetros:
+            - json (dict | ResultSet): Dados extraídos (ver src/records.py).
+        """
+
+        with self.__connection:
+            cursor = self.__connection.executemany(
+                f"INSERT INTO snapshots VALUES ({', '.join('?' * len(COLUMNS))})",
+                ([to_iso(row[0]), *row[1:]] for row in iter_rows(json))
+            )
+
+        Logger.info("[Histórico] %s linhas acrescentadas.", cursor.rowcount)
+        return cursor.rowcount
+
+    def compact(self, retention: int = HISTORY_RETENTION) -> None:
+        """
+            Remove as execuções mais antigas que a retenção. O espaço liberado é reutilizado
+            pelas próximas inserções; o VACUUM, que reescreve o arquivo inteiro, só roda quando
+            as páginas livres passam de VACUUM_FREE_RATIO do banco.
+
+            Parâmetros:
+            - retention (int): Dias de histórico mantidos (0 = mantém tudo).
+        """
+
+        if retention > 0:
+            limit = datetime.datetime.now() - datetime.timedelta(days=retention)
+            with self.__connection:
+                cursor = self.__connection.execute(
+                    "DELETE FROM snapshots WHERE captured_at < ?", (limit.isoformat(sep=" "),)
+                )
+            Logger.info("[Histórico] %s linhas antigas removidas.", cursor.rowcount)
+
+        pages = self.__connection.execute("PRAGMA page_count").fetchone()[0]
+        free = self.__connection.execute("PRAGMA freelist_count").fetchone()[0]
+        if pages and free / pages >= VACUUM_FREE_RATIO:
+            Logger.info("[Histórico] Reorganizando o banco (%s de %s páginas livres).", free, pages)
+            self.__connection.execute("VACUUM")
+
+        self.__connection.execute("PRAGMA optimize")
+
+    def export_xlsx(self, days: int = HISTORY_DAYS) -> IO[bytes]:
+        """
+            Gera um .xlsx (mesmas colunas do arquivo publicado) com os últimos N dias.
+            As linhas são lidas do banco e escritas uma a uma (workbook 'write-only').
+
+            Parâmetros:
+            - days (int): Tamanho da janela, em dias.
+        """
+
+        limit = datetime.datetime.now() - datetime.timedelta(days=days)
+        cursor = self.__connection.execute(
+            "SELECT * FROM snapshots WHERE captured_at >= ? ORDER BY captured_at",
+            (limit.isoformat(sep=" "),)
+        )
+
+        def rows() -> Iterator[list]:
+            for captured_at, *row in cursor:
+                row[4], row[5], row[7] = bool(row[4]), bool(row[5]), bool(row[7]) # SQLite: 0/1
+                yield [datetime.datetime.fromisoformat(captured_at).strftime(DATE_FORMAT), *row]
+
+        return write_xlsx(rows())
+
+    def close(self) -> None:
+        """
+            Fecha a conexão com o banco.
+        """
+
+        self.__connection.close()
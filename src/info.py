@@ -5,24 +5,34 @@
 """
 
 import sys
-import datetime
 import time
-import requests
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from requests.exceptions import RequestException
 
-from bs4 import BeautifulSoup
-from bs4.element import Tag
-from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.common.exceptions import WebDriverException, NoSuchElementException
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 
-from src.common import CHROME_SERVICE, WEBDRIVER_OPTIONS, TIMEOUT
-from src.common import get_access_token, get_device_code, interact_with_ui, wait, wait_loading
-from src.setup import Logger, get_env_values
-
-BASE_URL = "https://app.powerbi.com/groups/"
+from src import client
+from src.api import API_URL, ApiExtractor
+from src.auth import get_token
+from src.common import TIMEOUT, network_options, new_driver, quit_driver
+from src.common import LOAD_TIME, interact_with_ui, wait, wait_loading
+from src.execution import Execution
+from src.extract import read_rows
+from src.failures import ENRICH_FAILURES, enrich_failures
+from src.harvest import FULL_SCROLL, harvest_rows
+from src.metrics import METRICS, stage, timed
+from src.navigation import NAVIGATION, navigate_spa
+from src.pool import DriverPool
+from src.readiness import WaitTimes, discard_network_log, wait_network_idle, wait_rows_stable
+from src.records import ResultSet
+from src.setup import Config, Logger, get_env_values
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+APP_URL = "https://app.powerbi.com/"
+BASE_URL = APP_URL + "groups/"
 LOGIN_WORDS = ("singleSignOn", "signin", "login")
 
 MAX_RETRIES = 3
@@ -30,6 +40,9 @@ RETRY_DELAY = 5
 
 SCOPE = "https://analysis.windows.net/powerbi/api/.default" # escopo de permissividade
 
+WORKERS = max(1, Config.getint("INIT", "WORKERS", fallback=1))
+BACKEND = Config.get("INIT", "BACKEND", fallback="selenium").lower() # 'selenium' ou 'api'
+
 class WebExtractor:
     """
         Classe responsável por coletar os dados do Power BI Online.
@@ -38,23 +51,62 @@ class WebExtractor:
         Métodos:
         - get_workspaces(): Pega todos os workspaces existentes em um diretório Azure.
         - get_info(): Método principal que executa a coleta dos dados.
+        - close(): Encerra os navegadores abertos.
+
+        OBS.: Se WORKERS (settings.ini) for maior que 1, as workspaces são lidas em paralelo.
+        OBS. 2: Se STATE_TTL (settings.ini) for maior que 0, só lê as workspaces que mudaram.
+        OBS. 3: Se BACKEND (settings.ini) for 'api', os dados vêm da API REST, sem webscrapping.
+        OBS. 4: As regras WORKSPACE_* (settings.ini) filtram e priorizam as workspaces. Se
+        RUN_BUDGET for maior que 0, o que não começar no prazo fica para a próxima execução.
+        OBS. 5: Com keep_alive, os navegadores continuam abertos entre as execuções de get_info()
+        (modo daemon) e só são encerrados em close().
+        OBS. 6: Cada workspace lida é gravada num diário (src/checkpoint.py). Se a execução cair,
+        a próxima, dentro de CHECKPOINT_TTL minutos, continua de onde parou. Uma workspace que
+        esgotar as tentativas é lida de novo na próxima execução (ver StateStore.is_due).
+        OBS. 7: As sessões do Chrome ficam num pool (src/pool.py) que substitui as que caírem,
+        recicla as que passarem de SESSION_MAX_PAGES páginas e autentica as novas de novo.
+        OBS. 8: O estado de cada execução (resultado, diário, regras e orçamento) fica em
+        src/execution.py; esta classe cuida dos navegadores e da leitura.
     """
 
-    def __init__(self) -> None:
-        self.__options = WEBDRIVER_OPTIONS
+    def __init__(self, keep_alive: bool = False) -> None:
+        """
+            Parâmetros:
+            - keep_alive (bool, opcional): Mantém os navegadores abertos entre execuções.
+        """
+
+        # as leituras esperam pela rede (wait_network_idle): as sessões precisam do log de rede
+        self.__options = network_options()
+        self.__keep_alive = keep_alive
+        self.__pool = None
 
         self.__access_token = None
         self.__driver = None
 
-        self.__json = {}
-        self.__current_date = datetime.datetime.today().strftime("%d/%m/%Y - %H:%M:%S")
+        self.__run = Execution()
+
+    def __sign_in(self, driver: "webdriver") -> None:
+        """
+            Abre o Power BI na sessão principal e autentica, se solicitado. Assim, os cookies
+            copiados pelo pool (src/pool.py) já são de uma sessão logada, mesmo quando o token
+            vem do cache e o fluxo no navegador não acontece.
+
+            Parâmetros:
+            - driver (webdriver): Sessão do navegador que deve ser autenticada.
+        """
+
+        driver.get(APP_URL)
+        wait_loading(driver)
+        self.__login(driver.current_url, driver)
 
-    def __login(self, url: str) -> None:
+    @timed("login")
+    def __login(self, url: str, driver: "webdriver") -> None:
         """
             Método usado para fazer a autenticação ao Power BI Online, caso solicitado.
 
             Parâmetros:
             - url (str): url que a autenticação foi solicitada.
+            - driver (webdriver): Sessão do navegador que deve ser autenticada.
         """
 
         if not any(word in url for word in LOGIN_WORDS):
@@ -62,27 +114,22 @@ class WebExtractor:
 
         for attempt in range(1, MAX_RETRIES + 1, 1):
             try:
-                if not self.__driver:
-                    service = Service(ChromeDriverManager().install())
-                    self.__driver = webdriver.Chrome(service=service, options=self.__options)
-                elif not any(word in url for word in ["singleSignOn", "signin", "login"]):
-                    return
-                self.__driver.get(url)
+                driver.get(url)
 
                 interact_with_ui(
-                    driver=self.__driver,
+                    driver=driver,
                     css="[id='email']",
                     value=get_env_values().get('EMAIL')
                 )
                 interact_with_ui(
-                    driver=self.__driver,
+                    driver=driver,
                     css="[id='i0118']",
                     value=get_env_values().get('PASSWORD')
                 )
 
                 try:
-                    interact_with_ui(driver=self.__driver, css="[id='idSIButton9']")
-                    interact_with_ui(driver=self.__driver, css="[id='idBtn_Back']")
+                    interact_with_ui(driver=driver, css="[id='idSIButton9']")
+                    interact_with_ui(driver=driver, css="[id='idBtn_Back']")
                 except NoSuchElementException:
                     Logger.info("[Selenium] Sem tela de 'Continuar conectado'.")
 
@@ -90,139 +137,139 @@ class WebExtractor:
             except WebDriverException as error:
                 Logger.error("[Selenium] Tentativa %s. Erro: %s", attempt, error)
                 if attempt < MAX_RETRIES:
+                    METRICS.count("retries_total", stage="login")
                     Logger.info("[Selenium] Tentando novamente em %s segundos...", RETRY_DELAY)
                     time.sleep(RETRY_DELAY)
                 else:
                     Logger.critical("[Selenium] Todas as tentativas de login falharam!")
-                    sys.exit()
+                    sys.exit(1)
 
-    def __read_info(self, url: str) -> None:
+    def __read_info(self, url: str, pool: DriverPool) -> None:
         """
             Método responsável por fazer a leitura, workspace por workspace.
             Os dados recolhidos serão utilizados posteriormente na tela de monitoramento.
+            Cada tentativa empresta uma sessão do pool: se o navegador cair, a workspace é
+            lida de novo numa sessão nova (ver src/pool.py).
 
             Parâmetros:
             - url (str): url do workspace que deve ser feita a leitura dos dados.
+            - pool (DriverPool): Pool de sessões autenticadas.
         """
 
+        workspace_id = url.removeprefix(BASE_URL)
+        if self.__run.over_budget(workspace_id):
+            return
+
         for attempt in range(1, MAX_RETRIES + 1, 1):
             try:
-                wait_loading(self.__driver)
-
-                if any(word in self.__driver.current_url for word in LOGIN_WORDS):
-                    self.__login(url)
-
-                Logger.info("Acessando %s...", url)
-                self.__driver.get(url)
-                wait_loading(self.__driver)
-
-                wait(self.__driver).until(EC.presence_of_element_located(
-                    (By.TAG_NAME, "cdk-virtual-scroll-viewport")
-                ))
+                with pool.session() as driver:
+                    result = self.__read_page(url, driver)
 
-                soup = BeautifulSoup(self.__driver.page_source, "html.parser")
-
-                # achando o nome da workspace
+                if not result:
+                    METRICS.count("workspaces_total", result="empty")
+                    return
 
-                workspace_name = self.__safe_get_text(
-                    soup,
-                    (
-                        "h1",
-                        {"class": ["workspace-name", "tri-text-overflow-ellipsis", "tri-subtitle1"]}
-                    )
-                )
+                self.__run.merge_rows(workspace_id, *result)
+                METRICS.count("workspaces_total", result="read")
+                return
+            except WebDriverException as error:
+                Logger.error("[Selenium] Tentativa %s falhou - %s. Erro: %s", attempt, url, error)
+                if attempt < MAX_RETRIES:
+                    METRICS.count("retries_total", stage="read_info")
+                    Logger.info("[Selenium] Tentando novamente em %s segundos...", RETRY_DELAY)
+                    time.sleep(RETRY_DELAY)
+                else:
+                    self.__run.fail(workspace_id)
+                    Logger.critical("[Selenium] Todas as tentativas falharam para: %s", url)
 
-                if info := soup.find("cdk-virtual-scroll-viewport", {"id": "artifactContentView"}):
-                    info = info.find(
-                        "div", 
-                        {"class": "cdk-virtual-scroll-content-wrapper"}
-                    )
-                if not info:
-                    return
+    def __read_page(self, url: str, driver: "webdriver") -> tuple[str, list[dict]] | None:
+        """
+            Abre a workspace na sessão e retorna (nome da workspace, linhas), ou None se a
+            lista estiver vazia.
 
-                # começando a pegar os dados linha a linha
+            Parâmetros:
+            - url (str): url do workspace que deve ser feita a leitura dos dados.
+            - driver (webdriver): Sessão do navegador emprestada pelo pool.
+        """
 
-                execution_data = {}
+        # pylint: disable=import-outside-toplevel
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
 
-                for row in info.find_all("div", {"role": "row"}):
-                    # Logger.debug(row.prettify()) --> somente usado para testes
+        wait_loading(driver)
 
-                    name = self.__safe_get_text(
-                        row.find("span", {"class": "name-container"}),
-                        ("a", {"class": ["name", "trimmedTextWithEllipsis", "ng-star-inserted"]})
-                    )
+        if any(word in driver.current_url for word in LOGIN_WORDS):
+            self.__login(driver.current_url, driver)
 
-                    file_type = (
-                        row.find("span", {"data-testid": "fluentListCell.type"}) or {}
-                    ).get("title", "Desconhecido")
+        Logger.info("Acessando %s...", url)
+        times = WaitTimes()
 
-                    if file_type == "Pasta":
-                        continue
+        # eventos de rede da página anterior: a rota não os lê, e a recarga começa do zero
+        discard_network_log(driver)
 
-                    last_refresh = (
-                        row.find("span", {"data-testid": "fluentListCell.lastRefresh"}) or {}
-                    ).get("title", "Desconhecida.")
+        # com o app já aberto, só a rota muda e a espera é pela nova lista
+        if NAVIGATION == "spa" and times.measure(
+            "rota", navigate_spa, driver, url, timeout=LOAD_TIME
+        ):
+            METRICS.count("navigations_total", mode="spa")
+        else:
+            METRICS.count("navigations_total", mode="reload")
+            times.measure("navegação", driver.get, url)
+            times.measure("carregamento", wait_loading, driver)
 
-                    update_check = {
-                        "button": row.find("span", {"class": "dataflow-refresh-icons"}).find(
-                            "button",
-                            {"class": ["glyphicon", "pbi-glyph-warning", "ng-star-inserted"]}
-                        ) if row.find("span", {"class": "dataflow-refresh-icons"}) else None,
-                        "icon": row.find(
-                            "i",
-                            {"class": ["warning", "glyphicon", "pbi-glyph-warning", "glyph-small"]}
-                        )
-                    }
+            # sessão nova (cookies vencidos) ou desconectada: autentica e abre a workspace de novo
+            if any(word in driver.current_url for word in LOGIN_WORDS):
+                self.__login(driver.current_url, driver)
+                times.measure("navegação", driver.get, url)
+                times.measure("carregamento", wait_loading, driver)
 
-                    update_check = bool(update_check["icon"] or update_check["button"])
+            times.measure("rede", wait_network_idle, driver, timeout=LOAD_TIME)
 
-                    # implementar lógica de atualizar automaticamente no futuro
+            times.measure("lista", wait(driver).until, EC.presence_of_element_located(
+                (By.TAG_NAME, "cdk-virtual-scroll-viewport")
+            ))
+        times.measure("linhas", wait_rows_stable, driver, timeout=LOAD_TIME)
+        times.report(url)
 
-                    next_upt = (
-                        row.find("span", {"data-testid": "fluentListCell.nextRefresh"}) or {}
-                    ).get("title", "Desconhecida.")
+        with stage("parse"):
+            if FULL_SCROLL:
+                # a lista virtual só renderiza as linhas visíveis: colhe rolando a lista
+                return harvest_rows(driver, LOAD_TIME)
+            return read_rows(driver)
 
-                    if workspace_name not in execution_data:
-                        execution_data[workspace_name] = {}
+    def __read_api(self, url: str, extractor: ApiExtractor) -> None:
+        """
+            Método que lê uma workspace pela API REST, com as mesmas tentativas do Selenium.
 
-                    if name in execution_data[workspace_name]:
-                        name = name + " " + file_type
+            Parâmetros:
+            - url (str): url do workspace que deve ser feita a leitura dos dados.
+            - extractor (ApiExtractor): Backend de API já autenticado.
+        """
 
-                    execution_data[workspace_name][name] = {
-                        "tipo": file_type,
-                        "last_update": last_refresh,
-                        "atualizado_hoje": last_refresh[0:9] == self.__current_date[0:9],
-                        "update_success": not update_check, # inverte: se tiver valor, deu erro
-                        "next_update": next_upt,
-                        "agendamento_cancelado": next_upt == "N/D"
-                    }
+        workspace_id = url.removeprefix(BASE_URL)
+        if self.__run.over_budget(workspace_id):
+            return
 
-                if self.__current_date not in self.__json:
-                    self.__json[self.__current_date] = {}
-                self.__json[self.__current_date].update(execution_data)
+        for attempt in range(1, MAX_RETRIES + 1, 1):
+            try:
+                Logger.info("[Requests] Lendo %s pela API...", url)
+                self.__run.merge(
+                    extractor.read(workspace_id, self.__run.name(workspace_id)), workspace_id
+                )
+                METRICS.count("workspaces_total", result="read")
                 return
-            except WebDriverException as error:
-                Logger.error("[Selenium] Tentativa %s falhou - %s. Erro: %s", attempt, url, error)
+            except RequestException as error:
+                Logger.error("[Requests] Tentativa %s falhou - %s. Erro: %s", attempt, url, error)
                 if attempt < MAX_RETRIES:
-                    Logger.info("[Selenium] Tentando novamente em %s segundos...", RETRY_DELAY)
+                    METRICS.count("retries_total", stage="read_api")
+                    Logger.info("[Requests] Tentando novamente em %s segundos...", RETRY_DELAY)
                     time.sleep(RETRY_DELAY)
                 else:
-                    Logger.critical("[Selenium] Todas as tentativas falharam para: %s", url)
-
-    def __safe_get_text(self, parent: Tag, selector: tuple[str, dict] | None) -> str:
-        """
-            Função que realiza a sanitização: verifica se existe ou não o elemento.
-            Caso não existir, retorna "Desconhecido".
-
-            Parâmetros:
-            - parent (Tag): Elemento pai do elemento a ser procurado, "selector".
-            - selector (tuple[str, dict] | None): Elemento a ser pego o texto.
-        """
-
-        tag = parent.find(*selector) if parent else None
-        return tag.get_text(strip=True) if tag else "Desconhecido (a)"
+                    self.__run.fail(workspace_id)
+                    Logger.critical("[Requests] Todas as tentativas falharam para: %s", url)
 
     @property
+    @timed("workspaces")
     def workspaces(self) -> list:
         """
             Função responsável por pegar os workspaces do diretório.
@@ -231,51 +278,131 @@ class WebExtractor:
 
         for attempt in range(1, MAX_RETRIES + 1, 1):
             try:
-                workspaces_url = "https://api.powerbi.com/v1.0/myorg/groups"
-
-                code = get_device_code(
-                    get_env_values().get('TENANT_ID'),
-                    get_env_values().get('CLIENT_ID'),
-                    SCOPE
-                )
+                workspaces_url = API_URL + "/groups"
 
-                self.__driver = webdriver.Chrome(service=CHROME_SERVICE, options=self.__options)
+                # só o backend Selenium precisa da sessão principal (depois, ela passa ao pool);
+                # com BACKEND 'api', get_token só abre um navegador se o fluxo for necessário
+                if BACKEND != "api" and self.__driver is None and self.__pool is None:
+                    self.__driver = new_driver(self.__options)
+                    self.__sign_in(self.__driver)
 
-                self.__access_token = get_access_token(driver=self.__driver, device_code_json=code)
+                self.__access_token = get_token(SCOPE, driver=self.__driver)
 
                 headers = {
                     "Authorization": f"Bearer {self.__access_token}" 
                 }
 
-                response = requests.get(url=workspaces_url, headers=headers, timeout=TIMEOUT)
+                response = client.get(url=workspaces_url, headers=headers, timeout=TIMEOUT)
                 response.raise_for_status()
                 response = response.json()
 
-                all_workspaces = set()
-                for workspace in response.get("value", []):
-                    workspace_id = workspace.get("id")
-                    if workspace_id:
-                        all_workspaces.add(BASE_URL + workspace_id)
-                return list(all_workspaces)
+                groups = [group for group in response.get("value", []) if group.get("id")]
+                return [BASE_URL + workspace_id for workspace_id in self.__run.select(groups)]
             except WebDriverException as error:
                 Logger.error("[Selenium] Tentativa %s. Erro: %s", attempt, error)
+                self.close()
                 if attempt < MAX_RETRIES:
+                    METRICS.count("retries_total", stage="workspaces")
                     Logger.info("[Selenium] Tentando novamente em %s segundos...", RETRY_DELAY)
                     time.sleep(RETRY_DELAY)
                 else:
                     Logger.critical("[Selenium] Não foi possível pegar as workspaces!")
-                    sys.exit()
+                    sys.exit(1)
         return []
 
-    def get_info(self) -> dict:
+    def get_info(self) -> ResultSet:
         """
             Método que gerencia toda a classe.
             Faz login quando necessário, pega as workspaces e coleta dos dados.
+            Pode ser chamado várias vezes: cada chamada é uma nova execução.
+            Retorna um ResultSet (src/records.py), aceito por put_in_sharepoint.
         """
 
-        for url in self.workspaces:
-            self.__read_info(url)
+        done = self.__run.start()
+        workspace_ids = [url.removeprefix(BASE_URL) for url in self.workspaces]
+        urls = [BASE_URL + workspace_id for workspace_id in self.__run.plan(workspace_ids, done)]
+
+        try:
+            with stage("collect"):
+                data = self.__collect(urls)
+
+            # só os artefatos com falha: consultas proporcionais à quantidade de falhas
+            if ENRICH_FAILURES and self.__access_token:
+                with stage("enrich"):
+                    enrich_failures(data, self.__access_token)
+            METRICS.count("artifacts_total", len(data))
+
+            # execução concluída: não há o que retomar
+            self.__run.finish()
+            return data
+        finally:
+            self.__run.close()
+
+    def __collect(self, urls: list) -> ResultSet:
+        """
+            Lê as workspaces informadas com o backend configurado (Selenium ou API).
+
+            Parâmetros:
+            - urls (list): urls das workspaces que devem ser lidas.
+        """
+
+        if BACKEND == "api":
+            if not self.__keep_alive:
+                self.close()
+
+            extractor = ApiExtractor(self.__access_token, self.__run.captured_at)
+            with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+                futures = [executor.submit(self.__read_api, url, extractor) for url in urls]
+
+            raise_errors(futures)
+            return self.__run.results
+
+        if self.__pool is None and urls:
+            # o pool passa a ser o dono da sessão principal: é ele quem a encerra em close()
+            size = WORKERS if self.__keep_alive else min(WORKERS, len(urls))
+            self.__pool = DriverPool(size=size, source=self.__driver, options=self.__options)
+            self.__driver = None
+
+        try:
+            if len(urls) <= 1 or len(self.__pool) == 1:
+                for url in urls:
+                    self.__read_info(url, self.__pool)
+            else:
+                with ThreadPoolExecutor(max_workers=len(self.__pool)) as executor:
+                    futures = [
+                        executor.submit(self.__read_info, url, self.__pool) for url in urls
+                    ]
+
+                # as demais workspaces já foram lidas e gravadas no diário
+                raise_errors(futures)
+        finally:
+            if not self.__keep_alive:
+                self.close()
+
+        return self.__run.results
+
+    def close(self) -> None:
+        """
+            Encerra os navegadores abertos (sessão principal e pool).
+        """
+
+        if self.__pool is not None:
+            self.__pool.close()
+        if self.__driver is not None:
+            quit_driver(self.__driver)
+
+        self.__pool = None
+        self.__driver = None
+
+def raise_errors(futures: list[Future]) -> None:
+    """
+        Repassa o primeiro erro das tarefas (inclusive sys.exit() do login) à thread principal.
+        Sem isso, o ThreadPoolExecutor guarda o erro na tarefa e a execução segue como se
+        tivesse terminado.
+
+        Parâmetros:
+        - futures (list[Future]): Tarefas já concluídas.
+    """
 
-        self.__driver.quit()
-        return self.__json
-    
\ No newline at end of file
+    for future in futures:
+        future.result()
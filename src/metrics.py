@@ -0,0 +1,290 @@
+"""
+    Módulo com as métricas de execução (tempos por etapa, tentativas e bytes transferidos).
+
+    Inclui:
+    - Registro único (METRICS), seguro entre threads, com contadores e cronômetros por rótulo.
+    - Decorador e context manager para cronometrar etapas (timed / stage).
+    - Exportação no formato texto do Prometheus (arquivo para o textfile collector do
+      node_exporter ou endpoint local /metrics) e resumo da execução em JSON.
+"""
+
+import functools
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.setup import Config, ENV_PATH, Logger
+
+METRICS_PATH = ENV_PATH.parent / "metrics.prom"
+SUMMARY_PATH = ENV_PATH.parent / "run_summary.json"
+
+METRICS_PORT = Config.getint("INIT", "METRICS_PORT", fallback=0) # 0 = sem endpoint
+
+PREFIX = "pbi_"
+
+HELP = {
+    "stage_seconds": "Tempo gasto em cada etapa da execução.",
+    "page_seconds": "Tempo gasto em cada espera da leitura de uma página.",
+    "retries_total": "Novas tentativas feitas, por etapa.",
+    "http_requests_total": "Requisições HTTP feitas, por método e status.",
+    "http_bytes_total": "Bytes transferidos pela camada HTTP (sent / received).",
+    "upload_bytes_total": "Bytes do arquivo Excel enviados ao SharePoint.",
+    "tokens_total": "Tokens de acesso obtidos, por origem (cache, refresh, device_code).",
+    "workspaces_total": (
+        "Workspaces processadas, por resultado "
+        "(read, empty, carried, resumed, skipped, failed)."
+    ),
+    "artifacts_total": "Artefatos coletados na execução.",
+    "navigations_total": "Workspaces abertas, por modo (spa: rota do app; reload: página).",
+    "cycles_failed_total": "Ciclos do daemon que terminaram com erro.",
+    "tenants_failed_total": "Perfis (tenants) cuja extração falhou no modo multi-tenant.",
+    "failures_enriched_total": "Artefatos com falha detalhados pela API, por resultado.",
+    "sessions_total": "Sessões do Chrome do pool, por evento (created, recycled, crashed)."
+}
+
+def escape(value) -> str:
+    """
+        Escapa o valor de um rótulo (barra invertida, aspas e quebra de linha).
+
+        Parâmetros:
+        - value (Any): Valor do rótulo.
+    """
+
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def format_labels(labels: tuple) -> str:
+    """
+        Formata os rótulos no padrão do Prometheus: {nome="valor",...}.
+
+        Parâmetros:
+        - labels (tuple): Pares (nome, valor), já ordenados.
+    """
+
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{name}="{escape(value)}"' for name, value in labels) + "}"
+
+class Metrics:
+    """
+        Registro das métricas de uma execução.
+
+        Métodos:
+        - count(name, value, **labels): Soma 'value' a um contador.
+        - observe(name, seconds, **labels): Registra uma duração.
+        - timer(name, **labels): Context manager que cronometra o bloco.
+        - reset(): Zera as métricas (início de um ciclo do daemon).
+        - to_prometheus(): Métricas no formato texto do Prometheus.
+        - summary(): Resumo da execução (dict serializável em JSON).
+        - export(): Grava o arquivo .prom e o resumo JSON.
+        - serve(port): Publica /metrics em um servidor HTTP local.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__started = time.time()
+        self.__counters = {}
+        self.__timers = {}
+
+    def reset(self) -> None:
+        """
+            Zera contadores e cronômetros.
+        """
+
+        with self.__lock:
+            self.__started = time.time()
+            self.__counters = {}
+            self.__timers = {}
+
+    def count(self, name: str, value: float = 1, **labels) -> None:
+        """
+            Soma 'value' ao contador.
+
+            Parâmetros:
+            - name (str): Nome da métrica, sem o prefixo (ex.: 'retries_total').
+            - value (float, opcional): Valor somado.
+            - labels: Rótulos da métrica (ex.: stage='upload').
+        """
+
+        key = (name, tuple(sorted(labels.items())))
+        with self.__lock:
+            self.__counters[key] = self.__counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels) -> None:
+        """
+            Registra uma duração (quantidade, soma e máximo).
+
+            Parâmetros:
+            - name (str): Nome da métrica, sem o prefixo (ex.: 'stage_seconds').
+            - seconds (float): Duração, em segundos.
+            - labels: Rótulos da métrica (ex.: stage='build').
+        """
+
+        key = (name, tuple(sorted(labels.items())))
+        with self.__lock:
+            count, total, maximum = self.__timers.get(key, (0, 0.0, 0.0))
+            self.__timers[key] = (count + 1, total + seconds, max(maximum, seconds))
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """
+            Cronometra o bloco, mesmo que ele termine com exceção.
+
+            Parâmetros:
+            - name (str): Nome da métrica, sem o prefixo.
+            - labels: Rótulos da métrica.
+        """
+
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start_time, **labels)
+
+    def to_prometheus(self) -> str:
+        """
+            Retorna as métricas no formato texto do Prometheus (OpenMetrics compatível).
+        """
+
+        lines = []
+
+        with self.__lock:
+            counters = sorted(self.__counters.items())
+            timers = sorted(self.__timers.items())
+
+        described = set()
+        for (name, labels), value in counters:
+            if name not in described:
+                described.add(name)
+                lines.append(f"# HELP {PREFIX}{name} {HELP.get(name, name)}")
+                lines.append(f"# TYPE {PREFIX}{name} counter")
+            lines.append(f"{PREFIX}{name}{format_labels(labels)} {value}")
+
+        for (name, labels), (count, total, _) in timers:
+            if name not in described:
+                described.add(name)
+                lines.append(f"# HELP {PREFIX}{name} {HELP.get(name, name)}")
+                lines.append(f"# TYPE {PREFIX}{name} summary")
+            lines.append(f"{PREFIX}{name}_count{format_labels(labels)} {count}")
+            lines.append(f"{PREFIX}{name}_sum{format_labels(labels)} {total:.6f}")
+
+        lines.append(f"# TYPE {PREFIX}last_run_timestamp_seconds gauge")
+        lines.append(f"{PREFIX}last_run_timestamp_seconds {self.__started:.0f}")
+
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> dict:
+        """
+            Retorna o resumo da execução: duração total, etapas e contadores.
+        """
+
+        with self.__lock:
+            counters = sorted(self.__counters.items())
+            timers = sorted(self.__timers.items())
+
+        def label(name: str, labels: tuple) -> str:
+            return name + "".join(f"[{value}]" for _, value in labels)
+
+        return {
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.__started)),
+            "seconds": round(time.time() - self.__started, 3),
+            "timers": {
+                label(name, labels): {
+                    "count": count, "total": round(total, 3), "max": round(maximum, 3)
+                }
+                for (name, labels), (count, total, maximum) in timers
+            },
+            "counters": {label(name, labels): value for (name, labels), value in counters}
+        }
+
+    def export(self, textfile=METRICS_PATH, summary_path=SUMMARY_PATH) -> None:
+        """
+            Grava as métricas (formato Prometheus) e o resumo JSON, de forma atômica.
+
+            Parâmetros:
+            - textfile (Path | str, opcional): Arquivo .prom (textfile collector).
+            - summary_path (Path | str, opcional): Arquivo JSON com o resumo.
+        """
+
+        for path, content in (
+            (textfile, self.to_prometheus()),
+            (summary_path, json.dumps(self.summary(), indent=2, ensure_ascii=False))
+        ):
+            try:
+                descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+                with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                    file.write(content)
+                os.replace(temp_path, path)
+            except OSError as error:
+                Logger.error("[Métricas] Não foi possível gravar %s. Erro: %s", path, error)
+
+        Logger.info("[Métricas] Resumo da execução gravado em %s.", summary_path)
+
+    def serve(self, port: int = METRICS_PORT) -> ThreadingHTTPServer:
+        """
+            Publica as métricas em http://localhost:{port}/metrics, em thread própria.
+
+            Parâmetros:
+            - port (int, opcional): Porta do servidor.
+        """
+
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Responde /metrics; qualquer outro caminho retorna 404."""
+
+            def do_GET(self) -> None: # pylint: disable=invalid-name
+                """Trata as requisições GET."""
+
+                if self.path.rstrip("/") != "/metrics":
+                    self.send_error(404)
+                    return
+
+                body = metrics.to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_) -> None: # pylint: disable=arguments-differ
+                """Silencia o log padrão do http.server."""
+
+        httpd = ThreadingHTTPServer(("localhost", port), Handler)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        Logger.info("[Métricas] Endpoint em http://localhost:%s/metrics", port)
+
+        return httpd
+
+METRICS = Metrics()
+
+def stage(name: str):
+    """
+        Context manager que cronometra uma etapa da execução (métrica 'stage_seconds').
+
+        Parâmetros:
+        - name (str): Nome da etapa (ex.: 'workspaces', 'build', 'upload').
+    """
+
+    return METRICS.timer("stage_seconds", stage=name)
+
+def timed(name: str):
+    """
+        Decorador que cronometra todas as chamadas da função como a etapa 'name'.
+
+        Parâmetros:
+        - name (str): Nome da etapa.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
@@ -0,0 +1,180 @@
+"""
+    Módulo com um servidor HTTP local que imita a API REST do Power BI.
+    Usado para testar o backend de API sem acessar o tenant real.
+    Também responde ao endpoint de token do login da Microsoft e aceita uploads (PUT) do
+    SharePoint, para os benchmarks (benchmarks/run.py).
+
+    Uso:
+    - python -m src.mock_server [porta]
+    - Depois, alterar API_URL no settings.ini para http://localhost:{porta}/v1.0/myorg
+"""
+
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+PREFIX = "/v1.0/myorg"
+TOKEN_PATH = "/oauth2/v2.0/token"
+
+TOKEN_RESPONSE = {
+    "token_type": "Bearer",
+    "access_token": "token-local",
+    "refresh_token": "refresh-local",
+    "expires_in": 3600
+}
+
+def sample_routes(workspaces: int = 3, artifacts: int = 5) -> dict[str, dict]:
+    """
+        Gera respostas fictícias para N workspaces com M artefatos de cada tipo.
+
+        Parâmetros:
+        - workspaces (int): Quantidade de workspaces.
+        - artifacts (int): Quantidade de modelos semânticos (e de fluxos de dados) por workspace.
+    """
+
+    routes = {"/groups": {"value": []}}
+
+    for index in range(workspaces):
+        group = f"00000000-0000-0000-0000-{index:012d}"
+        routes["/groups"]["value"].append({"id": group, "name": f"Workspace {index}"})
+
+        datasets = []
+        dataflows = []
+        for item in range(artifacts):
+            dataset = f"{group[:-6]}{item:06d}"
+            datasets.append({"id": dataset, "name": f"Modelo {item}", "isRefreshable": True})
+            dataflows.append({"objectId": dataset, "name": f"Fluxo {item}"})
+
+            status = "Failed" if item % 4 == 0 else "Completed"
+            refresh = {"value": [{
+                "status": status,
+                "startTime": "2025-01-31T09:00:00Z",
+                "endTime": "2025-01-31T09:05:00Z"
+            }]}
+            if status == "Failed": # detalhe lido por src/failures.py
+                refresh["value"][0]["serviceExceptionJson"] = json.dumps({
+                    "errorCode": "ModelRefresh_ShortMessage_ProcessingError",
+                    "errorDescription": "Fonte de dados indisponível."
+                })
+                refresh["value"][0]["refreshAttempts"] = [{"attemptId": 1}, {"attemptId": 2}]
+
+            routes[f"/groups/{group}/datasets/{dataset}/refreshes"] = refresh
+            routes[f"/groups/{group}/datasets/{dataset}/refreshSchedule"] = {
+                "enabled": item % 3 != 0,
+                "days": ["Monday", "Wednesday", "Friday"],
+                "times": ["07:00", "13:00"],
+                "localTimeZoneId": "UTC"
+            }
+            routes[f"/groups/{group}/dataflows/{dataset}/transactions"] = refresh
+
+        routes[f"/groups/{group}/datasets"] = {"value": datasets}
+        routes[f"/groups/{group}/dataflows"] = {"value": dataflows}
+
+    return routes
+
+class MockServer:
+    """
+        Servidor HTTP local, em thread própria, que responde JSON a partir de um dicionário.
+
+        Métodos:
+        - start(): Inicia o servidor e retorna a url base (equivalente a API_URL).
+        - url: Url base do servidor, sem o prefixo da API.
+        - stop(): Encerra o servidor.
+    """
+
+    def __init__(self, routes: dict[str, dict], port: int = 0) -> None:
+        """
+            Parâmetros:
+            - routes (dict[str, dict]): Caminho (sem PREFIX e sem query) -> JSON da resposta.
+            - port (int): Porta do servidor. Se 0, o sistema escolhe uma livre.
+        """
+
+        self.routes = routes
+        self.hits = 0
+        self.uploaded = 0 # bytes recebidos em PUT
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Responde as rotas cadastradas; qualquer outra retorna 404."""
+
+            def do_GET(self) -> None: # pylint: disable=invalid-name
+                """Trata as requisições GET."""
+
+                server.hits += 1
+                path = urlsplit(self.path).path.removeprefix(PREFIX).rstrip("/")
+
+                if path not in server.routes:
+                    self.send_error(404)
+                    return
+
+                self.__send_json(server.routes[path])
+
+            def do_POST(self) -> None: # pylint: disable=invalid-name
+                """Responde ao endpoint de token (qualquer tenant) com um token fictício."""
+
+                server.hits += 1
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+                if not self.path.endswith(TOKEN_PATH):
+                    self.send_error(404)
+                    return
+
+                self.__send_json(TOKEN_RESPONSE)
+
+            def do_PUT(self) -> None: # pylint: disable=invalid-name
+                """Aceita qualquer upload, contando os bytes recebidos."""
+
+                server.hits += 1
+                server.uploaded += len(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+
+                self.send_response(204)
+                self.end_headers()
+
+            def __send_json(self, data: dict) -> None:
+                """Envia um JSON com status 200."""
+
+                body = json.dumps(data).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_) -> None: # pylint: disable=arguments-differ
+                """Silencia o log padrão do http.server."""
+
+        self.__httpd = ThreadingHTTPServer(("localhost", port), Handler)
+        self.__thread = None
+
+    @property
+    def url(self) -> str:
+        """
+            Url base do servidor (equivalente a LOGIN_URL e SHAREPOINT_URL).
+        """
+
+        return f"http://localhost:{self.__httpd.server_port}"
+
+    def start(self) -> str:
+        """
+            Inicia o servidor em segundo plano e retorna a url base da API.
+        """
+
+        self.__thread = threading.Thread(target=self.__httpd.serve_forever, daemon=True)
+        self.__thread.start()
+        return self.url + PREFIX
+
+    def stop(self) -> None:
+        """
+            Encerra o servidor.
+        """
+
+        self.__httpd.shutdown()
+        self.__httpd.server_close()
+
+if __name__ == "__main__":
+    mock = MockServer(sample_routes(), port=int(sys.argv[1]) if len(sys.argv) > 1 else 8765)
+    print(f"API fictícia em {mock.start()}")
+    threading.Event().wait()
@@ -0,0 +1,99 @@
+"""
+    Módulo com a navegação entre workspaces dentro do próprio app do Power BI (SPA).
+
+    Em vez de 'driver.get' (que reinicia todo o app Angular a cada workspace), a rota é trocada
+    pela History API (pushState + popstate, que o roteador do Angular escuta) e a espera é só
+    pela workspace de destino aparecer: rota, cabeçalho e artefatos (ou o aviso de lista vazia).
+    Se o shell ainda não estiver carregado ou a workspace não aparecer a tempo, quem chamou
+    deve voltar ao 'driver.get'.
+"""
+
+from urllib.parse import urlsplit
+from typing import TYPE_CHECKING
+
+from selenium.common.exceptions import WebDriverException
+
+from src.setup import Config, Logger
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+# 'spa' troca de workspace pelo roteador do app; 'reload' recarrega a página inteira
+NAVIGATION = Config.get("INIT", "NAVIGATION", fallback="spa").lower()
+
+POLL_TIME = 50 # milissegundos entre verificações, dentro do navegador
+
+# aviso exibido pelo app no lugar da lista quando a workspace não tem artefatos
+EMPTY_SELECTORS = ".empty-state, .emptyState, [data-testid*='empty-state'], empty-state"
+
+# a lista virtual (cdkVirtualFor) reaproveita as linhas ao trocar de workspace: a espera não
+# pode depender de linhas novas. A workspace aberta é reconhecida pela rota, pelo cabeçalho e
+# pelo href dos artefatos, que aponta para a workspace (/groups/{id}/...)
+SPA_NAVIGATE_JS = """
+    const [path, timeout, poll, emptySelectors, done] = arguments;
+    const headerSelector = "h1.workspace-name, h1.tri-text-overflow-ellipsis, h1.tri-subtitle1";
+    const linkSelector = "#artifactContentView div[role='row'] span.name-container a[href]";
+    const title = () => {
+        const header = document.querySelector(headerSelector);
+        return header && header.textContent.trim();
+    };
+
+    if (!document.getElementById("artifactContentView") && !title()) {
+        done("sem-shell"); return;
+    }
+
+    const group = path.split("/").slice(0, 3).join("/").toLowerCase() + "/"; // /groups/{id}/
+    const previousTitle = title();
+
+    history.pushState(history.state, "", path);
+    window.dispatchEvent(new PopStateEvent("popstate", { state: history.state }));
+
+    const started = Date.now();
+    const check = () => {
+        const routed = (location.pathname + "/").toLowerCase().startsWith(group);
+        const links = [...document.querySelectorAll(linkSelector)].map(
+            (link) => link.getAttribute("href").toLowerCase()
+        );
+        const groupLinks = links.filter((href) => href.includes("/groups/"));
+
+        // linhas: todas já apontam para a workspace de destino (nenhuma da anterior)
+        const listReady = groupLinks.length > 0 && groupLinks.every((href) => href.includes(group));
+        // workspace vazia: sem linhas, com o aviso e o cabeçalho já trocado
+        const emptyReady = links.length === 0 && document.querySelector(emptySelectors)
+            && title() && title() !== previousTitle;
+
+        if (routed && (listReady || emptyReady)) { done("ok"); return; }
+        if (Date.now() - started > timeout) { done("tempo-esgotado"); return; }
+        setTimeout(check, poll);
+    };
+    check();
+"""
+
+def navigate_spa(driver: "webdriver", url: str, timeout: float) -> bool:
+    """
+        Troca para a workspace 'url' pelo roteador do app, sem recarregar a página.
+        Retorna False se não for possível (shell não carregado, outro domínio ou a workspace
+        não apareceu a tempo); nesse caso, a página deve ser carregada com 'driver.get'.
+
+        Parâmetros:
+        - driver (webdriver): Instância do WebDriver do Selenium. É a instância do navegador ativo.
+        - url (str): url do workspace de destino.
+        - timeout (float): Tempo máximo de espera pela workspace de destino, em segundos.
+    """
+
+    target = urlsplit(url)
+    if urlsplit(driver.current_url).netloc != target.netloc:
+        return False
+
+    try:
+        driver.set_script_timeout(timeout + 1)
+        result = driver.execute_async_script(
+            SPA_NAVIGATE_JS, target.path, int(timeout * 1000), POLL_TIME, EMPTY_SELECTORS
+        )
+    except WebDriverException as error:
+        Logger.info("[Selenium] Navegação pelo app falhou. Erro: %s", error)
+        return False
+
+    if result != "ok":
+        Logger.info("[Selenium] Navegação pelo app indisponível (%s) para %s.", result, url)
+    return result == "ok"
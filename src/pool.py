@@ -0,0 +1,213 @@
+"""
+    Módulo com o pool de sessões do Chrome usado na extração.
+
+    Inclui:
+    - Classe que cria N navegadores headless compartilhando os cookies autenticados.
+    - Métodos para emprestar e devolver as sessões entre as threads de trabalho.
+    - Verificação de saúde a cada empréstimo: uma sessão que caiu (navegador fechado, sessão
+      inválida) é encerrada e substituída por uma nova, com os cookies da última autenticação.
+    - Reciclagem das sessões após SESSION_MAX_PAGES páginas, limitando o crescimento da
+      memória do Chrome em execuções longas (modo daemon).
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from selenium.common.exceptions import WebDriverException
+
+from src.common import new_driver, quit_driver
+from src.metrics import METRICS
+from src.setup import Config, Logger
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+# páginas (workspaces) lidas por uma sessão antes de ela ser reciclada (0 = nunca)
+SESSION_MAX_PAGES = max(0, Config.getint("INIT", "SESSION_MAX_PAGES", fallback=50))
+
+def is_alive(driver: "webdriver") -> bool:
+    """
+        Indica se a sessão ainda responde. Um navegador que caiu ou uma sessão encerrada
+        pelo ChromeDriver levantam WebDriverException em qualquer comando.
+
+        Parâmetros:
+        - driver (webdriver): Instância do WebDriver do Selenium. É a instância do navegador ativo.
+    """
+
+    try:
+        driver.execute_script("return document.readyState")
+        return True
+    except WebDriverException:
+        return False
+
+class DriverPool:
+    """
+        Pool limitado de sessões do Chrome.
+        Todas as sessões recebem os cookies da sessão já autenticada, evitando novos logins.
+        O pool passa a ser o dono da sessão de origem: ela é encerrada em close().
+
+        Métodos:
+        - session(): Context manager que empresta uma sessão saudável e a devolve ao final.
+        - close(): Encerra todas as sessões criadas pelo pool.
+    """
+
+    def __init__(
+        self, size: int, source: "webdriver", options: "webdriver.ChromeOptions | None" = None,
+        max_pages: int = SESSION_MAX_PAGES
+    ) -> None:
+        """
+            Parâmetros:
+            - size (int): Quantidade de sessões do pool.
+            - source (webdriver): Sessão autenticada, de onde os cookies são copiados.
+            - options (webdriver.ChromeOptions | None, opcional): Opções das sessões novas.
+            - max_pages (int, opcional): Páginas por sessão antes da reciclagem (0 = nunca).
+        """
+
+        self.__options = options
+        self.__max_pages = max_pages
+        self.__lock = threading.Lock()
+
+        self.__drivers = {source: 0} # sessão: páginas lidas
+        self.__idle = queue.Queue()
+        self.__idle.put(source)
+
+        self.__cookies = source.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+
+        for _ in range(1, size, 1):
+            try:
+                driver = self.__spawn()
+            except WebDriverException as error:
+                Logger.error("[Selenium] Não foi possível criar sessão extra. Erro: %s", error)
+                break
+
+            self.__idle.put(driver)
+
+        self.__size = len(self.__drivers) # vagas: sessões substituídas ocupam a mesma vaga
+        Logger.info("[Selenium] Pool criado com %s sessões.", len(self.__drivers))
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __enter__(self) -> "DriverPool":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    @contextmanager
+    def session(self):
+        """
+            Empresta uma sessão livre do pool, bloqueando até que alguma seja devolvida.
+            A sessão é verificada antes do empréstimo e, se a leitura falhar com o navegador
+            fora do ar, é substituída: a nova tentativa da workspace recebe uma sessão nova.
+            Levanta WebDriverException se não for possível abrir a sessão substituta; a vaga
+            continua no pool e a próxima tentativa abre o navegador de novo.
+        """
+
+        driver = self.__checkout(self.__idle.get())
+        try:
+            if driver is None:
+                driver = self.__spawn()
+
+            with self.__lock:
+                self.__drivers[driver] += 1
+            yield driver
+        except WebDriverException:
+            if driver is not None and not is_alive(driver):
+                Logger.error("[Selenium] Sessão caiu. Ela será substituída por uma nova.")
+                METRICS.count("sessions_total", event="crashed")
+                self.__discard(driver)
+                driver = None
+            raise
+        finally:
+            self.__idle.put(driver) # None = vaga sem sessão, aberta no próximo empréstimo
+
+    def __checkout(self, driver: "webdriver | None") -> "webdriver | None":
+        """
+            Verifica a sessão antes do empréstimo. Retorna a própria sessão ou None, se ela
+            foi encerrada (caiu ou atingiu o limite de páginas) e precisa ser substituída.
+
+            Parâmetros:
+            - driver (webdriver | None): Sessão retirada da fila.
+        """
+
+        if driver is None:
+            return None
+
+        if self.__max_pages and self.__drivers[driver] >= self.__max_pages:
+            Logger.info("[Selenium] Sessão reciclada após %s páginas.", self.__drivers[driver])
+            METRICS.count("sessions_total", event="recycled")
+            self.__keep_cookies(driver)
+            self.__discard(driver)
+            return None
+
+        if not is_alive(driver):
+            Logger.error("[Selenium] Sessão sem resposta. Ela será substituída por uma nova.")
+            METRICS.count("sessions_total", event="crashed")
+            self.__discard(driver)
+            return None
+
+        return driver
+
+    def __spawn(self) -> "webdriver":
+        """
+            Abre uma nova sessão com os cookies da última autenticação conhecida.
+            Se os cookies tiverem expirado, o Power BI redireciona para o login e a leitura
+            autentica a sessão de novo (ver WebExtractor.__read_info).
+        """
+
+        driver = new_driver(self.__options)
+        try:
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": self.__cookies})
+        except WebDriverException:
+            quit_driver(driver)
+            raise
+
+        with self.__lock:
+            self.__drivers[driver] = 0
+        METRICS.count("sessions_total", event="created")
+        return driver
+
+    def __keep_cookies(self, driver: "webdriver") -> None:
+        """
+            Guarda os cookies de uma sessão saudável, que podem ter sido renovados desde a
+            criação do pool (ex.: novo login). As próximas sessões nascem com eles.
+
+            Parâmetros:
+            - driver (webdriver): Sessão de onde os cookies são copiados.
+        """
+
+        try:
+            cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+        except WebDriverException as error:
+            Logger.info("[Selenium] Cookies da sessão indisponíveis. Erro: %s", error)
+            return
+
+        with self.__lock:
+            self.__cookies = cookies
+
+    def __discard(self, driver: "webdriver") -> None:
+        """
+            Retira a sessão do pool e a encerra.
+
+            Parâmetros:
+            - driver (webdriver): Sessão que deve ser encerrada.
+        """
+
+        with self.__lock:
+            self.__drivers.pop(driver, None)
+        quit_driver(driver)
+
+    def close(self) -> None:
+        """
+            Encerra todas as sessões do pool, inclusive a sessão de origem e as substitutas.
+        """
+
+        with self.__lock:
+            drivers = list(self.__drivers)
+            self.__drivers.clear()
+
+        for driver in drivers:
+            quit_driver(driver)
@@ -0,0 +1,186 @@
+"""
+    Módulo com as esperas por sinais concretos de que a página está pronta.
+
+    Inclui:
+    - Espera por ociosidade de rede, usando os eventos do Chrome DevTools Protocol (CDP).
+      Só as requisições em voo contam: conexões longas (long-poll, WebSocket, telemetria)
+      são ignoradas, senão a rede nunca fica ociosa.
+    - Descarte dos eventos de rede acumulados, nas páginas que não esperam pela rede.
+    - Espera, via MutationObserver, até as linhas de 'artifactContentView' pararem de mudar.
+    - Medição do tempo gasto em cada espera, por página.
+"""
+
+import json
+import time
+from typing import TYPE_CHECKING
+
+from selenium.common.exceptions import WebDriverException
+
+from src.metrics import METRICS
+from src.setup import Logger
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+POLL_INTERVAL = 0.1 # segundos entre leituras do estado do navegador
+NETWORK_IDLE = 0.5 # segundos sem requisições em voo para considerar a rede ociosa
+ROWS_QUIET = 500 # milissegundos sem mutações para considerar as linhas estáveis
+
+NETWORK_START = "Network.requestWillBeSent"
+NETWORK_END = ("Network.loadingFinished", "Network.loadingFailed")
+
+# requisições que ficam abertas enquanto a página existe e não indicam carregamento
+LONG_LIVED_TYPES = ("EventSource", "WebSocket", "Ping")
+LONG_LIVED_URLS = ("signalr", "longpoll", "heartbeat", "/notifications", "telemetry")
+
+ROWS_OBSERVER_JS = """
+    const [quiet, timeout, done] = arguments;
+    const target = document.getElementById("artifactContentView");
+    if (!target) { done("missing"); return; }
+
+    let timer = null;
+    const finish = (result) => { observer.disconnect(); clearTimeout(limit); done(result); };
+    const observer = new MutationObserver(() => {
+        clearTimeout(timer);
+        timer = setTimeout(() => finish("stable"), quiet);
+    });
+    const limit = setTimeout(() => finish("timeout"), timeout);
+
+    observer.observe(target, {childList: true, subtree: true, attributes: true});
+    timer = setTimeout(() => finish("stable"), quiet);
+"""
+
+class WaitTimes:
+    """
+        Acumula o tempo de cada espera de uma página, para saber onde os segundos são gastos.
+
+        Métodos:
+        - measure(stage, func, *args): Executa a espera e guarda a duração dela.
+        - report(url): Registra no log os tempos da página.
+    """
+
+    def __init__(self) -> None:
+        self.stages = {}
+
+    def measure(self, stage: str, func, *args, **kwargs):
+        """
+            Executa 'func' e guarda quanto tempo ela levou, com o nome 'stage'.
+
+            Parâmetros:
+            - stage (str): Nome da etapa (ex.: 'carregamento', 'rede', 'linhas').
+            - func (Callable): Função de espera.
+        """
+
+        start_time = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start_time
+            self.stages[stage] = self.stages.get(stage, 0) + seconds
+            METRICS.observe("page_seconds", seconds, stage=stage)
+
+    def report(self, url: str) -> None:
+        """
+            Registra no log o tempo de cada etapa e o total.
+
+            Parâmetros:
+            - url (str): Página a que os tempos se referem.
+        """
+
+        stages = ", ".join(f"{stage}: {seconds:.2f}s" for stage, seconds in self.stages.items())
+        Logger.info("[Espera] %s - %s (total: %.2fs)", url, stages, sum(self.stages.values()))
+
+def is_long_lived(params: dict) -> bool:
+    """
+        Indica se a requisição fica aberta enquanto a página existe (long-poll, WebSocket,
+        telemetria). Ela não entra na contagem de requisições em voo.
+
+        Parâmetros:
+        - params (dict): Parâmetros do evento 'Network.requestWillBeSent'.
+    """
+
+    url = params.get("request", {}).get("url", "").lower()
+    return params.get("type") in LONG_LIVED_TYPES or any(part in url for part in LONG_LIVED_URLS)
+
+def wait_network_idle(driver: "webdriver", timeout: float, idle: float = NETWORK_IDLE) -> bool:
+    """
+        Espera até não existir nenhuma requisição em voo por 'idle' segundos.
+        Usa os eventos de rede do CDP (log 'performance' do ChromeDriver), lidos sem busy loop.
+        Só o início e o fim das requisições contam; os demais eventos do log são ignorados.
+        Retorna False se o tempo limite for atingido.
+        A sessão precisa ter o log habilitado (ver network_options em src/common.py).
+
+        Parâmetros:
+        - driver (webdriver): Instância do WebDriver do Selenium. É a instância do navegador ativo.
+        - timeout (float): Tempo máximo de espera, em segundos.
+        - idle (float): Segundos sem requisições para considerar a rede ociosa.
+    """
+
+    in_flight = set()
+    deadline = time.monotonic() + timeout
+    idle_since = time.monotonic()
+
+    while time.monotonic() < deadline:
+        try:
+            entries = driver.get_log("performance")
+        except WebDriverException:
+            Logger.info("[Espera] Log de performance indisponível; ignorando espera de rede.")
+            return True
+
+        changed = False
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            params = message.get("params", {})
+            request_id = params.get("requestId")
+
+            if message["method"] == NETWORK_START and not is_long_lived(params):
+                in_flight.add(request_id)
+                changed = True
+            elif message["method"] in NETWORK_END and request_id in in_flight:
+                in_flight.discard(request_id)
+                changed = True
+
+        if changed or in_flight:
+            idle_since = time.monotonic()
+        elif time.monotonic() - idle_since >= idle:
+            return True
+
+        time.sleep(POLL_INTERVAL)
+
+    Logger.info("[Espera] Rede não ficou ociosa em %ss (%s em voo).", timeout, len(in_flight))
+    return False
+
+def discard_network_log(driver: "webdriver") -> None:
+    """
+        Lê e descarta os eventos de rede acumulados no log 'performance'. O ChromeDriver os
+        guarda em memória até alguém lê-los: sem o descarte, a navegação pelo app (que não
+        chama wait_network_idle) os acumularia por todas as páginas da sessão, e a primeira
+        recarga contaria requisições antigas como em voo.
+
+        Parâmetros:
+        - driver (webdriver): Instância do WebDriver do Selenium. É a instância do navegador ativo.
+    """
+
+    try:
+        driver.get_log("performance")
+    except WebDriverException:
+        pass # sessão sem o log: não há o que descartar (uma sessão caída falha no próximo comando)
+
+def wait_rows_stable(driver: "webdriver", timeout: float, quiet: int = ROWS_QUIET) -> bool:
+    """
+        Espera até as linhas de 'artifactContentView' ficarem 'quiet' ms sem mudanças.
+        A espera acontece dentro do navegador (MutationObserver), em uma única chamada.
+        Retorna False se o tempo limite for atingido ou a lista não existir.
+
+        Parâmetros:
+        - driver (webdriver): Instância do WebDriver do Selenium. É a instância do navegador ativo.
+        - timeout (float): Tempo máximo de espera, em segundos.
+        - quiet (int): Milissegundos sem mutações para considerar as linhas estáveis.
+    """
+
+    driver.set_script_timeout(timeout + 1)
+    result = driver.execute_async_script(ROWS_OBSERVER_JS, quiet, int(timeout * 1000))
+
+    if result != "stable":
+        Logger.info("[Espera] Linhas não estabilizaram (%s).", result)
+    return result == "stable"
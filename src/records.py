@@ -0,0 +1,418 @@
+"""
+    Módulo com o contêiner colunar dos artefatos coletados em uma execução.
+
+    Inclui:
+    - Estados tipados (enums) para o resultado da atualização e para o agendamento.
+    - ResultSet: uma lista por coluna (booleanos e datas em 'array'), chave por ID do artefato,
+      textos repetidos (workspace, tipo, datas) internados e a data hora da execução guardada
+      uma vez. As datas exibidas também ficam como números (segundos desde 1970, UTC).
+    - Conversão direta para linhas (COLUMNS), pandas e .xlsx, sem achatar dicionários.
+    - Conversão de/para o dicionário legado {workspace: {artefato: dados}} (estado local e API).
+    - Detalhes das falhas (src/failures.py) guardados à parte, só para as linhas com falha.
+"""
+
+import enum
+import sys
+from array import array
+from typing import IO, Iterator, NamedTuple
+
+from src.dates import NO_SCHEDULE, parse_title, same_day, to_epoch
+from src.history import COLUMNS, write_xlsx
+
+class RefreshStatus(enum.IntEnum):
+    """Resultado da última atualização do artefato."""
+
+    FAILED = 0
+    SUCCEEDED = 1
+
+class Schedule(enum.IntEnum):
+    """Situação do agendamento de atualização do artefato."""
+
+    ACTIVE = 0
+    CANCELLED = 1
+
+class FailureDetail(NamedTuple):
+    """Detalhe da última atualização com falha, lido do histórico da API."""
+
+    code: str
+    message: str
+    duration: float | None # segundos
+    attempts: int | None
+
+NO_DETAIL = FailureDetail("", "", None, None)
+
+class Artifact(NamedTuple):
+    """Artefato a acrescentar ao ResultSet, com os textos exibidos (ver ResultSet.append)."""
+
+    id: str
+    workspace: str
+    name: str
+    type: str
+    last_update: str
+    next_update: str
+    failed: bool
+    tenant: str = ""
+
+class ArtifactRecord(NamedTuple):
+    """
+        Uma linha do ResultSet (tupla: sem dicionário por instância).
+        As datas '_at' estão em segundos desde 1970 (UTC); NaN quando não há data.
+    """
+
+    id: str
+    workspace: str
+    name: str
+    type: str
+    last_update: str
+    next_update: str
+    updated_today: bool
+    status: RefreshStatus
+    schedule: Schedule
+    tenant: str
+    last_update_at: float
+    next_update_at: float
+    detail: FailureDetail | None
+
+FOLDER_TYPE = "Pasta" # pastas aparecem na lista, mas não são artefatos
+# só em to_pandas
+TIME_COLUMNS = ["Última Atualização (data)", "Próxima Atualização (data)"]
+
+def intern(value: str | None) -> str:
+    """
+        Interna o texto (uma única cópia em memória para valores repetidos).
+
+        Parâmetros:
+        - value (str | None): Texto a internar. None vira "".
+    """
+
+    return sys.intern(value or "")
+
+def artifact_key(workspace: str, name: str, file_type: str) -> str:
+    """
+        Chave de um artefato sem ID: workspace + nome exibido + tipo. É a mesma em add_rows e
+        add_json, para que a linha lida da tela substitua a reaproveitada do estado local.
+
+        Parâmetros:
+        - workspace (str): Nome da workspace.
+        - name (str): Nome exibido do artefato (com o tipo, se o nome for repetido).
+        - file_type (str): Tipo do artefato.
+    """
+
+    return f"{workspace}|{name}|{file_type}"
+
+class ResultSet:
+    """
+        Contêiner colunar dos artefatos de uma execução, indexado pelo ID do artefato.
+        Ler o mesmo artefato de novo substitui a linha, em vez de duplicá-la.
+
+        Métodos:
+        - add_rows(workspace, rows): Acrescenta as linhas extraídas de uma workspace.
+        - add_json(data): Acrescenta dados no formato legado ({workspace: {artefato: dados}}).
+        - append(artifact): Acrescenta (ou substitui) um artefato.
+        - failures(): Percorre (tenant, ID) dos artefatos com falha.
+        - attach(tenant, artifact_id, detail): Guarda o detalhe da falha de um artefato.
+        - records(): Percorre as linhas como ArtifactRecord.
+        - iter_rows(): Percorre as linhas na ordem de COLUMNS.
+        - column(name): Retorna uma coluna (ver ArtifactRecord).
+        - to_json(workspace): Dicionário legado, de todas as workspaces ou de uma só.
+        - to_pandas(), to_xlsx(): Conversões diretas.
+    """
+
+    def __init__(self, captured_at: str) -> None:
+        """
+            Parâmetros:
+            - captured_at (str): Data hora da execução, no formato 'dd/mm/aaaa - HH:MM:SS'.
+        """
+
+        self.captured_at = intern(captured_at)
+
+        self.__index = {} # tenant -> {ID do artefato: posição da linha}
+        self.__details = {} # posição da linha -> FailureDetail (só linhas com falha)
+        self.__columns = {
+            "id": [], "workspace": [], "name": [], "type": [], "last_update": [],
+            "next_update": [], "tenant": []
+        }
+        self.__arrays = {
+            "updated_today": array("b"), "status": array("b"), "schedule": array("b"),
+            "last_update_at": array("d"), "next_update_at": array("d")
+        }
+
+    def __len__(self) -> int:
+        return len(self.__columns["id"])
+
+    def append(self, artifact: Artifact) -> None:
+        """
+            Acrescenta um artefato, ou substitui a linha se o ID já existir no tenant.
+
+            Parâmetros:
+            - artifact (Artifact): ID (link na lista do Power BI), workspace, nome, tipo,
+              datas exibidas, se a última atualização falhou e o perfil de origem.
+        """
+
+        index = self.__index.setdefault(artifact.tenant, {})
+        row = index.get(artifact.id)
+
+        values = {
+            "id": artifact.id,
+            "workspace": intern(artifact.workspace),
+            "name": artifact.name,
+            "type": intern(artifact.type),
+            "last_update": intern(artifact.last_update),
+            "next_update": intern(artifact.next_update),
+            "tenant": intern(artifact.tenant)
+        }
+        numbers = {
+            "updated_today": same_day(artifact.last_update, self.captured_at),
+            "status": RefreshStatus.FAILED if artifact.failed else RefreshStatus.SUCCEEDED,
+            "schedule": (
+                Schedule.CANCELLED if artifact.next_update == NO_SCHEDULE else Schedule.ACTIVE
+            ),
+            "last_update_at": to_epoch(parse_title(artifact.last_update)),
+            "next_update_at": to_epoch(parse_title(artifact.next_update))
+        }
+
+        if row is None:
+            index[artifact.id] = len(self.__columns["id"])
+            for column, value in values.items():
+                self.__columns[column].append(value)
+            for column, value in numbers.items():
+                self.__arrays[column].append(value)
+            return
+
+        for column, value in values.items():
+            self.__columns[column][row] = value
+        for column, value in numbers.items():
+            self.__arrays[column][row] = value
+        self.__details.pop(row, None) # leitura nova: o detalhe antigo não vale mais
+
+    def failures(self) -> Iterator[tuple[str, str]]:
+        """
+            Percorre (tenant, ID do artefato) das linhas cuja última atualização falhou.
+        """
+
+        status = self.__arrays["status"]
+
+        for tenant, index in self.__index.items():
+            for artifact_id, row in index.items():
+                if status[row] == RefreshStatus.FAILED:
+                    yield tenant, artifact_id
+
+    def attach(self, tenant: str, artifact_id: str, detail: FailureDetail) -> None:
+        """
+            Guarda o detalhe da falha de um artefato já incluído.
+
+            Parâmetros:
+            - tenant (str): Perfil de origem ("" fora do modo multi-tenant).
+            - artifact_id (str): ID do artefato.
+            - detail (FailureDetail): Detalhe da falha.
+        """
+
+        row = self.__index.get(tenant, {}).get(artifact_id)
+        if row is not None:
+            self.__details[row] = detail
+
+    def add_rows(self, workspace: str, rows: list[dict], tenant: str = "") -> None:
+        """
+            Acrescenta as linhas extraídas de uma workspace (ver src/extract.py). Pastas são
+            ignoradas e nomes repetidos recebem o tipo no nome, como em build_execution_data.
+            Linhas sem ID usam artifact_key como chave.
+
+            Parâmetros:
+            - workspace (str): Nome da workspace.
+            - rows (list[dict]): Linhas retornadas por uma das formas de extração.
+            - tenant (str, opcional): Perfil de origem (modo multi-tenant).
+        """
+
+        names = set()
+
+        for row in rows:
+            if row["type"] == FOLDER_TYPE:
+                continue
+
+            name = row["name"]
+            if name in names:
+                name = f"{name} {row['type']}"
+            names.add(name)
+
+            self.append(Artifact(
+                row.get("id") or artifact_key(workspace, name, row["type"]),
+                workspace, name, row["type"], row["last_refresh"], row["next_refresh"],
+                row["failed"], tenant
+            ))
+
+    def add_json(self, data: dict, tenant: str = "") -> None:
+        """
+            Acrescenta dados no formato legado ({workspace: {artefato: dados}}), usado pelo
+            estado local e pelo backend de API. Sem ID, a chave é a de artifact_key.
+
+            Parâmetros:
+            - data (dict): Dicionário {workspace: {artefato: dados}}.
+            - tenant (str, opcional): Perfil de origem, se os dados não trouxerem um.
+        """
+
+        for workspace, artifacts in data.items():
+            for name, artifact in artifacts.items():
+                artifact_id = artifact.get("id") or artifact_key(workspace, name, artifact["tipo"])
+                artifact_tenant = artifact.get("tenant") or tenant
+
+                self.append(Artifact(
+                    artifact_id, workspace, name, artifact["tipo"], artifact["last_update"],
+                    artifact["next_update"], not artifact["update_success"], artifact_tenant
+                ))
+                if artifact.get("error_code") or artifact.get("error_message"):
+                    self.attach(artifact_tenant, artifact_id, FailureDetail(
+                        artifact.get("error_code", ""), artifact.get("error_message", ""),
+                        artifact.get("duration"), artifact.get("attempts")
+                    ))
+
+    def column(self, name: str) -> list | array:
+        """
+            Retorna uma coluna (não copia: não deve ser alterada).
+
+            Parâmetros:
+            - name (str): Nome do campo de ArtifactRecord.
+        """
+
+        return self.__columns[name] if name in self.__columns else self.__arrays[name]
+
+    def records(self) -> Iterator[ArtifactRecord]:
+        """
+            Percorre as linhas como ArtifactRecord.
+        """
+
+        columns = self.__columns
+        arrays = self.__arrays
+        details = self.__details
+
+        # textos (ID, workspace, nome, tipo e datas exibidas) e datas numéricas, em grupos
+        texts = zip(
+            columns["id"], columns["workspace"], columns["name"], columns["type"],
+            columns["last_update"], columns["next_update"]
+        )
+        times = zip(arrays["last_update_at"], arrays["next_update_at"])
+
+        for row, (text, updated_today, status, schedule, tenant, epochs) in enumerate(zip(
+            texts, arrays["updated_today"], arrays["status"], arrays["schedule"],
+            columns["tenant"], times
+        )):
+            yield ArtifactRecord(
+                *text, bool(updated_today), RefreshStatus(status), Schedule(schedule), tenant,
+                *epochs, details.get(row)
+            )
+
+    def iter_rows(self) -> Iterator[list]:
+        """
+            Percorre as linhas na ordem de COLUMNS (mesmo formato de src/history.iter_rows).
+        """
+
+        columns = self.__columns
+        flags = self.__arrays
+        details = self.__details
+
+        # direto das colunas, sem criar um ArtifactRecord por linha
+        for row, values in enumerate(zip(
+            columns["workspace"], columns["name"], columns["type"], columns["last_update"],
+            flags["updated_today"], flags["status"], columns["next_update"], flags["schedule"],
+            columns["tenant"]
+        )):
+            (workspace, name, file_type, last_update, updated_today, status, next_update,
+             schedule, tenant) = values
+            yield [
+                self.captured_at,
+                workspace,
+                name,
+                file_type,
+                last_update,
+                updated_today == 1,
+                status == RefreshStatus.SUCCEEDED,
+                next_update,
+                schedule == Schedule.CANCELLED,
+                tenant,
+                *details.get(row, NO_DETAIL)
+            ]
+
+    def to_json(self, workspace: str | None = None) -> dict:
+        """
+            Retorna o dicionário legado {workspace: {artefato: dados}} (sem a data hora).
+
+            Parâmetros:
+            - workspace (str | None, opcional): Se informado, só essa workspace.
+        """
+
+        data = {}
+
+        for record in self.records():
+            if workspace is not None and record.workspace != workspace:
+                continue
+
+            artifact = data.setdefault(record.workspace, {})[record.name] = {
+                "id": record.id,
+                "tipo": record.type,
+                "last_update": record.last_update,
+                "atualizado_hoje": record.updated_today,
+                "update_success": record.status == RefreshStatus.SUCCEEDED,
+                "next_update": record.next_update,
+                "agendamento_cancelado": record.schedule == Schedule.CANCELLED
+            }
+            if record.tenant:
+                artifact["tenant"] = record.tenant
+            if record.detail:
+                artifact.update({
+                    "error_code": record.detail.code,
+                    "error_message": record.detail.message,
+                    "duration": record.detail.duration,
+                    "attempts": record.detail.attempts
+                })
+
+        return data
+
+    def to_pandas(self):
+        """
+            Retorna um DataFrame do pandas com as colunas de COLUMNS e as datas como
+            datetime com fuso (TIME_COLUMNS; NaT quando não há data).
+        """
+
+        import pandas # pylint: disable=import-outside-toplevel
+
+        columns = self.__columns
+        arrays = self.__arrays
+        size = len(columns["id"])
+        codes, messages, durations, attempts = self.__detail_columns()
+
+        def times(values: array) -> "pandas.Series":
+            return pandas.to_datetime(pandas.Series(values, dtype=float), unit="s", utc=True)
+
+        return pandas.DataFrame({
+            COLUMNS[0]: [self.captured_at] * size,
+            COLUMNS[1]: pandas.Categorical(columns["workspace"]),
+            COLUMNS[2]: columns["name"],
+            COLUMNS[3]: pandas.Categorical(columns["type"]),
+            COLUMNS[4]: columns["last_update"],
+            COLUMNS[5]: pandas.array(arrays["updated_today"], dtype=bool),
+            COLUMNS[6]: pandas.array(arrays["status"], dtype=bool),
+            COLUMNS[7]: columns["next_update"],
+            COLUMNS[8]: pandas.array(arrays["schedule"], dtype=bool),
+            COLUMNS[9]: pandas.Categorical(columns["tenant"]),
+            COLUMNS[10]: codes,
+            COLUMNS[11]: messages,
+            COLUMNS[12]: pandas.array(durations, dtype="Float64"),
+            COLUMNS[13]: pandas.array(attempts, dtype="Int64"),
+            TIME_COLUMNS[0]: times(arrays["last_update_at"]),
+            TIME_COLUMNS[1]: times(arrays["next_update_at"])
+        })
+
+    def __detail_columns(self) -> list[list]:
+        """
+            Retorna as colunas dos detalhes das falhas (código, mensagem, duração, tentativas),
+            com valores vazios nas linhas sem detalhe.
+        """
+
+        rows = [self.__details.get(row, NO_DETAIL) for row in range(len(self))]
+        return [list(column) for column in zip(*rows)] if rows else [[], [], [], []]
+
+    def to_xlsx(self) -> IO[bytes]:
+        """
+            Gera o .xlsx (mesmas colunas do arquivo publicado), linha a linha.
+        """
+
+        return write_xlsx(self.iter_rows())
@@ -0,0 +1,143 @@
+"""
+    Módulo com as regras de seleção e a prioridade das workspaces lidas em cada execução.
+
+    Inclui:
+    - Filtros de inclusão e exclusão por nome (padrões com * e ?), ID ou capacidade.
+    - Ordenação por criticidade e pela próxima atualização agendada dos artefatos.
+    - Orçamento de tempo por execução: o que não começou a tempo fica para a próxima.
+"""
+
+import datetime
+import fnmatch
+import time
+from typing import Callable
+
+from src.setup import Config, Logger
+
+def parse_list(value: str) -> tuple[str, ...]:
+    """
+        Converte uma lista do settings.ini ('a, b*, c') em uma tupla de valores em minúsculas.
+
+        Parâmetros:
+        - value (str): Valores separados por vírgula.
+    """
+
+    return tuple(item.strip().lower() for item in value.split(",") if item.strip())
+
+INCLUDE = parse_list(Config.get("INIT", "WORKSPACE_INCLUDE", fallback=""))
+EXCLUDE = parse_list(Config.get("INIT", "WORKSPACE_EXCLUDE", fallback=""))
+CAPACITIES = parse_list(Config.get("INIT", "WORKSPACE_CAPACITIES", fallback=""))
+CRITICAL = parse_list(Config.get("INIT", "WORKSPACE_CRITICAL", fallback=""))
+
+RUN_BUDGET = Config.getint("INIT", "RUN_BUDGET", fallback=0) # minutos (0 = sem limite)
+
+def matches(group: dict, patterns: tuple[str, ...]) -> bool:
+    """
+        Indica se a workspace corresponde a algum padrão (ID exato ou nome com * e ?).
+
+        Parâmetros:
+        - group (dict): Workspace retornada pela API (/groups).
+        - patterns (tuple[str, ...]): Padrões em minúsculas.
+    """
+
+    workspace_id = group.get("id", "").lower()
+    name = group.get("name", "").lower()
+
+    return any(
+        pattern == workspace_id or fnmatch.fnmatchcase(name, pattern) for pattern in patterns
+    )
+
+class WorkspaceRules:
+    """
+        Regras que decidem quais workspaces são lidas e em que ordem.
+
+        Métodos:
+        - select(groups): Filtra as workspaces pelas regras de inclusão, exclusão e capacidade.
+        - order(groups, due_at): Ordena por criticidade e pela próxima atualização.
+    """
+
+    def __init__(
+        self,
+        include: tuple[str, ...] = INCLUDE,
+        exclude: tuple[str, ...] = EXCLUDE,
+        capacities: tuple[str, ...] = CAPACITIES,
+        critical: tuple[str, ...] = CRITICAL
+    ) -> None:
+        """
+            Parâmetros:
+            - include (tuple[str, ...], opcional): Se preenchido, só lê o que corresponder.
+            - exclude (tuple[str, ...], opcional): Nunca lê o que corresponder.
+            - capacities (tuple[str, ...], opcional): Se preenchido, só lê essas capacidades.
+            - critical (tuple[str, ...], opcional): Workspaces lidas antes de todas as outras.
+        """
+
+        self.__include = include
+        self.__exclude = exclude
+        self.__capacities = capacities
+        self.__critical = critical
+
+    def select(self, groups: list[dict]) -> list[dict]:
+        """
+            Retorna somente as workspaces permitidas pelas regras, na ordem original.
+
+            Parâmetros:
+            - groups (list[dict]): Workspaces retornadas pela API (/groups).
+        """
+
+        selected = []
+
+        for group in groups:
+            if self.__include and not matches(group, self.__include):
+                continue
+            if self.__exclude and matches(group, self.__exclude):
+                continue
+            capacity = (group.get("capacityId") or "").lower()
+            if self.__capacities and capacity not in self.__capacities:
+                continue
+            selected.append(group)
+
+        if len(selected) < len(groups):
+            Logger.info("[Seleção] %s de %s workspaces selecionadas.", len(selected), len(groups))
+
+        return selected
+
+    def order(
+        self, groups: list[dict], due_at: Callable[[str], datetime.datetime]
+    ) -> list[dict]:
+        """
+            Ordena as workspaces: críticas primeiro e, dentro de cada grupo, a que tem a
+            atualização agendada mais antiga (ou mais próxima) primeiro.
+
+            Parâmetros:
+            - groups (list[dict]): Workspaces já selecionadas.
+            - due_at (Callable): Recebe o ID da workspace e retorna quando ela vence.
+        """
+
+        return sorted(
+            groups,
+            key=lambda group: (not matches(group, self.__critical), due_at(group["id"]))
+        )
+
+# uma classe: o prazo é fixado quando a execução começa e consultado por todas as threads
+class RunBudget: # pylint: disable=too-few-public-methods
+    """
+        Orçamento de tempo de uma execução.
+
+        Métodos:
+        - expired(): Indica se o tempo acabou.
+    """
+
+    def __init__(self, minutes: int = RUN_BUDGET) -> None:
+        """
+            Parâmetros:
+            - minutes (int, opcional): Duração do orçamento (0 = sem limite).
+        """
+
+        self.__deadline = time.monotonic() + minutes * 60 if minutes > 0 else None
+
+    def expired(self) -> bool:
+        """
+            Indica se o orçamento de tempo acabou.
+        """
+
+        return self.__deadline is not None and time.monotonic() >= self.__deadline
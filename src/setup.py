@@ -5,17 +5,15 @@
     - Funções para configuração básica da biblioteca logging.
     - Funções para pegar os valores da .env.
     - Funções para inserir valores na .env.
+    - Perfis (tenants) com .env e arquivos locais próprios, usados no modo multi-tenant.
 """
 
 import configparser
+import multiprocessing
 import os
 import sys
 import logging
 from pathlib import Path
-from tkinter import messagebox
-
-import ttkbootstrap as ttk
-from ttkbootstrap.constants import SUCCESS
 
 from dotenv import dotenv_values, load_dotenv, set_key
 
@@ -25,7 +23,7 @@ logging.basicConfig(
     level=logging.INFO, # dá de reduzir, ou aumentar nível de logging
     format="%(asctime)s - %(levelname)s - %(message)s",
     filename="logger.log",
-    filemode="w"
+    filemode="a" if multiprocessing.parent_process() else "w" # processos filhos acrescentam
 )
 
 Logger = logging.getLogger()
@@ -43,6 +41,45 @@ else:
 
 Config.read(CONFIG_BASE_PATH)
 
+# perfil (tenant) ativo neste processo; None = .env padrão (ver src/tenants.py)
+PROFILE = None
+
+ENV_KEYS = ("TENANT_ID", "CLIENT_ID", "EMAIL", "PASSWORD")
+
+def use_profile(name: str | None) -> None:
+    """
+        Ativa um perfil neste processo: credenciais de '.env.{nome}' e arquivos locais
+        (cache de tokens, estado) em 'profiles/{nome}'.
+
+        Parâmetros:
+        - name (str | None): Nome do perfil. None volta ao .env padrão.
+    """
+
+    global PROFILE # pylint: disable=global-statement
+    PROFILE = name or None
+
+def profile_env_path(name: str) -> Path:
+    """
+        Caminho da .env de um perfil.
+
+        Parâmetros:
+        - name (str): Nome do perfil.
+    """
+
+    return ENV_PATH.parent / f".env.{name}"
+
+def data_dir() -> Path:
+    """
+        Pasta dos arquivos locais do perfil ativo (a pasta da .env, se não houver perfil).
+    """
+
+    if PROFILE is None:
+        return ENV_PATH.parent
+
+    path = ENV_PATH.parent / "profiles" / PROFILE
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
 def env_has_values() -> bool:
     """
         Função que analisa se a .env já tem valores ou não.
@@ -56,7 +93,11 @@ def env_has_values() -> bool:
     return False
 
 def get_env_values() -> dict[str, str]:
-    """Função para atualizar valores das variáveis vindas da .env."""
+    """Função para atualizar valores das variáveis vindas da .env (ou do perfil ativo)."""
+
+    if PROFILE is not None:
+        values = dotenv_values(profile_env_path(PROFILE))
+        return {key: values.get(key) for key in ENV_KEYS}
 
     load_dotenv()
 
@@ -79,6 +120,13 @@ def insert_env_variables() -> None:
     if env_has_values():
         return
 
+    # a interface só é carregada quando a .env precisa ser preenchida
+    # pylint: disable=import-outside-toplevel
+    from tkinter import messagebox
+
+    import ttkbootstrap as ttk
+    from ttkbootstrap.constants import SUCCESS
+
     app = ttk.Window(title="Informações essenciais", themename="darkly")
 
     window_width = 500
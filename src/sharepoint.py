@@ -4,40 +4,106 @@
     Utiliza a API do SharePoint para realizar o upload do arquivo.
 """
 
-import io
+import os
+import re
+import time
+import uuid
+from typing import IO, TYPE_CHECKING
 from urllib.parse import quote
-import pandas
-import requests
 from requests.exceptions import RequestException
 
-from selenium import webdriver
+from src import client
+from src.auth import get_token
+from src.client import TIMEOUT
+from src.delta import LIST_NAME, ListPublisher
+from src.freshness import ARTIFACT_COLUMNS, SLA_COLUMNS, SLA_SHEET, artifact_frame
+from src.freshness import artifact_rows, sla_rows
+from src.history import COLUMNS, HistoryStore, iter_rows, write_xlsx
+from src.metrics import METRICS, stage, timed
+from src.records import ResultSet
+from src.setup import Config, Logger
 
-from src.common import CHROME_SERVICE, WEBDRIVER_OPTIONS, TIMEOUT
-from src.common import get_access_token, get_device_code
-from src.setup import Config, Logger, get_env_values
+if TYPE_CHECKING:
+    import pandas
 
 nome_site = Config.get("INIT", "SITE_NAME")
 nome_dominio = Config.get("INIT", "DOMAIN_NAME")
 
-if nome_site == "none":
-    Logger.critical("Nome de site não existe!")
-    raise ValueError("Nome do site não existe! (none)")
-if nome_dominio == "none":
-    Logger.critical("Nome do domínio não existe!")
-    raise ValueError("Nome do domínio não existe! (none)")
-
 # criar pasta e arquivo no sharepoint
 # caso modificar o caminho, mudar as variáveis abaixo
 FILE_PATH = (
     f"/sites/{nome_site}/Shared Documents/"
     "Configurações - Monitoramento BIs/update-pbis-log.xlsx"
 )
-FILE_URL = (
-    f"https://{nome_dominio}.sharepoint.com/sites/{nome_site}/_api/web/"
-    f"GetFileByServerRelativeUrl('{quote((FILE_PATH), safe='/')}')/$value"
+# SHAREPOINT_URL só deve ser alterada em testes (ex.: servidor local dos benchmarks)
+SHAREPOINT_URL = Config.get(
+    "INIT", "SHAREPOINT_URL", fallback=f"https://{nome_dominio}.sharepoint.com"
+)
+FILE_API = (
+    f"{SHAREPOINT_URL}/sites/{nome_site}/_api/web/"
+    f"GetFileByServerRelativeUrl('{quote((FILE_PATH), safe='/')}')"
 )
+FILE_URL = f"{FILE_API}/$value"
 SCOPE = f"https://{nome_dominio}.sharepoint.com/.default" # escopo de permissividade
 
+# 'run' publica somente a execução atual; 'history' publica a janela móvel do histórico local
+PUBLISH = Config.get("INIT", "PUBLISH", fallback="run").lower()
+
+# arquivos maiores que CHUNK_SIZE são enviados em partes (StartUpload/ContinueUpload/FinishUpload)
+CHUNK_SIZE = Config.getint("INIT", "UPLOAD_CHUNK_MB", fallback=4) * 1024 ** 2
+UPLOAD_TIMEOUT = 120 # segundos por envio (arquivo inteiro ou uma parte)
+MAX_RETRIES = 3
+RETRY_DELAY = 5
+
+# offset esperado pela sessão, na mensagem de offset inválido (ex.: "Expected offset: 8388608")
+EXPECTED_OFFSET = re.compile(r"(?:expected|esperado)\D{0,20}?(\d+)", re.IGNORECASE)
+def check_config() -> None:
+    """
+        Valida o site e o domínio do SharePoint (settings.ini).
+        Roda ao criar UpdateSharepointFile, e não ao importar o módulo.
+    """
+
+    if nome_site == "none":
+        Logger.critical("Nome de site não existe!")
+        raise ValueError("Nome do site não existe! (none)")
+    if nome_dominio == "none":
+        Logger.critical("Nome do domínio não existe!")
+        raise ValueError("Nome do domínio não existe! (none)")
+
+def expected_offset(response) -> int | None:
+    """
+        Retorna o offset esperado pela sessão de upload, informado na recusa de uma parte: no
+        campo 'expectedOffset' do erro, se houver, ou na mensagem de offset inválido.
+        Retorna None se a recusa não informar o offset (ex.: outro tipo de erro).
+
+        Parâmetros:
+        - response (Response): Resposta de erro de ContinueUpload/StartUpload.
+    """
+
+    try:
+        error = response.json()["odata.error"]
+        offset = error.get("expectedOffset", error.get("ExpectedOffset"))
+        if offset is not None:
+            return int(offset)
+        message = error["message"]["value"]
+    except (ValueError, KeyError, TypeError, AttributeError):
+        message = response.text
+
+    match = EXPECTED_OFFSET.search(message or "")
+    return int(match.group(1)) if match else None
+
+def chunk_accepted(response, end: int) -> bool:
+    """
+        Indica se a recusa de uma parte informa que a sessão já espera o offset 'end', isto é,
+        que a parte reenviada já tinha sido aceita numa tentativa cuja resposta se perdeu.
+
+        Parâmetros:
+        - response (Response): Resposta de erro de ContinueUpload/StartUpload.
+        - end (int): Offset do fim da parte reenviada.
+    """
+
+    return expected_offset(response) == end
+
 class UpdateSharepointFile:
     """
         Classe responsável por atualizar o arquivo Excel no SharePoint.
@@ -46,79 +112,269 @@ class UpdateSharepointFile:
         Métodos:
         - get_data(): Retorna o dataframe com os dados que serão enviados para o SharePoint.
         - put_in_sharepoint(json): Publica o arquivo Excel atualizado no SharePoint.
+        - build_file(json): Monta o arquivo Excel linha a linha, com memória constante.
+        - upload(excel_file, access_token): Envia o arquivo montado para o SharePoint.
     """
 
     def __init__(self) -> None:
-        self.__options = WEBDRIVER_OPTIONS
-
-        self.__driver = None
+        check_config()
+        self.__file = None
 
-        self.__data = {}
-
-    def get_data(self) -> dict:
+    def get_data(self) -> "pandas.DataFrame":
         """
             Retorna o dataframe com os dados que serão enviados para o SharePoint.
             Útil para verificar os dados antes do envio.
+
+            OBS.: O dataframe é lido do arquivo gerado, somente quando este método é chamado.
         """
 
-        return self.__data
+        import pandas # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+        if self.__file is None:
+            return pandas.DataFrame(columns=COLUMNS)
+
+        position = self.__file.tell()
+        self.__file.seek(0)
+        data = pandas.read_excel(self.__file)
+        self.__file.seek(position)
+
+        return data
 
     def put_in_sharepoint(self, json: dict) -> None:
         """
             Envia o arquivo Excel com os dados para o SharePoint.
             O arquivo é gerado a partir do JSON fornecido.
+            Se LIST_NAME (settings.ini) estiver preenchido, publica só a diferença na lista e
+            monta e envia o arquivo completo somente se a publicação na lista falhar.
 
             Parâmetros:
-            - json (dict): Dicionário contendo os dados a serem enviados.    
+            - json (dict | ResultSet): Dados a serem enviados (ver src/records.py).
         """
 
-        rows = []
+        # toda execução é acrescentada ao histórico local, mesmo que não seja publicada
+        with HistoryStore() as history:
+            with stage("history"):
+                history.append(json)
+                history.compact()
 
-        response = get_device_code(
-            get_env_values().get('TENANT_ID'),
-            get_env_values().get('CLIENT_ID'),
-            SCOPE
-        )
-        print(response)
+        # o navegador só é aberto se não houver refresh token válido no cache
+        with stage("sharepoint_token"):
+            access_token = get_token(SCOPE)
 
-        self.__driver = webdriver.Chrome(service=CHROME_SERVICE, options=self.__options)
+        if LIST_NAME:
+            publisher = ListPublisher(f"{SHAREPOINT_URL}/sites/{nome_site}")
+            with stage("publish_list"):
+                published = publisher.publish(json, access_token)
+            if published:
+                return
+            Logger.info("[Delta] Publicando o arquivo completo como alternativa.")
 
-        access_token = get_access_token(driver=self.__driver, device_code_json=response)
+        # o arquivo só é montado quando vai ser enviado
+        self.upload(self.__workbook(json), access_token)
 
-        for timestamp, workspaces in json.items():
-            for workspace, reports in workspaces.items():
-                for report_name, report_data in reports.items():
-                    rows.append({
-                        "Data e Hora": timestamp,
-                        "Workspace": workspace,
-                        "Relatório": report_name,
-                        "Tipo": report_data["tipo"],
-                        "Última Atualização": report_data["last_update"],
-                        "Atualizado Hoje": report_data["atualizado_hoje"],
-                        "Sucesso na Atualização": report_data["update_success"],
-                        "Próxima Atualização": report_data["next_update"],
-                        "Agendamento Cancelado": report_data["agendamento_cancelado"]
-                    })
+    def __workbook(self, json: dict) -> IO[bytes]:
+        """
+            Monta o arquivo que será enviado: a execução atual ou, com PUBLISH = 'history',
+            a janela dos últimos HISTORY_DAYS dias do histórico local.
+
+            Parâmetros:
+            - json (dict | ResultSet): Dados a serem enviados (ver src/records.py).
+        """
+
+        if PUBLISH != "history":
+            return self.build_file(json)
+
+        with HistoryStore() as history, stage("build"):
+            self.__file = history.export_xlsx()
+        return self.__file
+
+    @timed("build")
+    def build_file(self, json: dict) -> IO[bytes]:
+        """
+            Monta o arquivo Excel a partir do JSON fornecido, linha a linha.
+            Usa um workbook 'write-only' do openpyxl e um arquivo temporário que só vai para o
+            disco se passar de SPOOL_SIZE: a memória não cresce com a quantidade de artefatos.
+            Com um ResultSet, a aba principal ganha as colunas numéricas de ARTIFACT_COLUMNS e o
+            arquivo inclui a aba SLA_SHEET com o resumo por workspace (src/freshness.py).
 
-        self.__data = pandas.DataFrame(rows)
+            Parâmetros:
+            - json (dict | ResultSet): Dados a serem enviados (ver src/records.py).
+        """
+
+        rows, sheets, header = iter_rows(json), None, None
+        if isinstance(json, ResultSet):
+            with stage("freshness"):
+                frame = artifact_frame(json)
+                sheets = {SLA_SHEET: (SLA_COLUMNS, list(sla_rows(frame)))}
+            rows = (row + extra for row, extra in zip(rows, artifact_rows(json, frame)))
+            header = COLUMNS + ARTIFACT_COLUMNS
+
+        excel_file = write_xlsx(rows, sheets, header)
+
+        self.__file = excel_file
+        return excel_file
+
+    @timed("upload")
+    def upload(self, excel_file: IO[bytes], access_token: str) -> None:
+        """
+            Publica o arquivo Excel no SharePoint, substituindo o anterior.
+            O arquivo é enviado em streaming, sem ser copiado para a memória.
+
+            Parâmetros:
+            - excel_file (IO[bytes]): Arquivo gerado por build_file.
+            - access_token (str): Token de acesso do escopo do SharePoint.
+        """
 
-        excel_buffer = io.BytesIO()
-        self.__data.to_excel(excel_buffer, index=False)
-        excel_buffer.seek(0)
+        size = excel_file.seek(0, os.SEEK_END)
+        excel_file.seek(0)
+        start_time = time.perf_counter()
 
         try:
-            request = requests.put(
-                url=FILE_URL,
-                headers={
-                    "Authorization": f"Bearer {access_token}",
-                },
-                data=excel_buffer.getvalue(),
-                timeout=TIMEOUT
-            )
+            if size <= CHUNK_SIZE:
+                request = client.put(
+                    url=FILE_URL,
+                    headers={
+                        "Authorization": f"Bearer {access_token}",
+                    },
+                    data=excel_file,
+                    timeout=UPLOAD_TIMEOUT
+                )
+
+                if request.status_code not in (200, 201, 204):
+                    raise RequestException(
+                        f"Status: {request.status_code} | Resposta: {request.text}"
+                    )
+            else:
+                self.__upload_chunks(excel_file, size, access_token)
 
-            if request.status_code not in (200, 201, 204):
-                raise RequestException(f"Status: {request.status_code} | Resposta: {request.text}")
-            Logger.info("[Requests] Arquivo atualizado com sucesso no SharePoint.")
+            elapsed = time.perf_counter() - start_time
+            METRICS.count("upload_bytes_total", size)
+            Logger.info(
+                "[Requests] Arquivo atualizado com sucesso no SharePoint "
+                "(%.1f MB em %.1fs, %.2f MB/s).",
+                size / 1024 ** 2, elapsed, size / 1024 ** 2 / max(elapsed, 1e-6)
+            )
         except RequestException as error:
             Logger.error("[Requests] Erro: %s", error)
-        
\ No newline at end of file
+
+    def __upload_chunks(self, excel_file: IO[bytes], size: int, access_token: str) -> None:
+        """
+            Envia o arquivo em partes de CHUNK_SIZE, em uma sessão de upload do SharePoint.
+            Cada parte é repetida até MAX_RETRIES vezes (ver __send_chunk).
+            Se a parte não for aceita, a sessão é cancelada e o erro é propagado.
+
+            Parâmetros:
+            - excel_file (IO[bytes]): Arquivo a enviar.
+            - size (int): Tamanho do arquivo, em bytes.
+            - access_token (str): Token de acesso do escopo do SharePoint.
+        """
+
+        upload_id = f"guid'{uuid.uuid4()}'"
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Accept": "application/json;odata=nometadata"
+        }
+        offset = 0 # último offset confirmado pelo SharePoint
+
+        while offset < size:
+            excel_file.seek(offset)
+            chunk = excel_file.read(CHUNK_SIZE)
+
+            if offset == 0:
+                url = f"{FILE_API}/StartUpload(uploadId={upload_id})"
+            elif offset + len(chunk) >= size:
+                url = f"{FILE_API}/FinishUpload(uploadId={upload_id},fileOffset={offset})"
+            else:
+                url = f"{FILE_API}/ContinueUpload(uploadId={upload_id},fileOffset={offset})"
+
+            try:
+                offset = self.__send_chunk(url, headers, chunk, offset + len(chunk))
+            except RequestException:
+                self.__cancel_upload(upload_id, headers)
+                raise
+
+            Logger.info(
+                "[Requests] %.1f de %.1f MB enviados.", offset / 1024 ** 2, size / 1024 ** 2
+            )
+
+    def __send_chunk(self, url: str, headers: dict, chunk: bytes, end: int) -> int:
+        """
+            Envia uma parte, com até MAX_RETRIES tentativas, e retorna o offset confirmado.
+            Se a resposta de uma tentativa se perder (ex.: timeout), a parte pode já ter sido
+            aceita: reenviá-la no mesmo offset é recusado pelo SharePoint. Antes de desistir,
+            a recusa é conferida (ver chunk_accepted e __file_size) e, se a parte já estava
+            no servidor, o envio continua da parte seguinte.
+
+            Parâmetros:
+            - url (str): Endpoint da parte (StartUpload, ContinueUpload ou FinishUpload).
+            - headers (dict): Cabeçalhos com o token de acesso.
+            - chunk (bytes): Conteúdo da parte.
+            - end (int): Offset do fim da parte (o esperado depois que ela for aceita).
+        """
+
+        finish = "FinishUpload" in url
+        error = None
+
+        for attempt in range(1, MAX_RETRIES + 1, 1):
+            try:
+                request = client.post(url=url, headers=headers, data=chunk, timeout=UPLOAD_TIMEOUT)
+                if request.status_code in (200, 201, 204):
+                    return end if finish else int(request.json().get("value", end))
+
+                # só uma tentativa anterior sem resposta pode ter entregado a parte
+                if error is not None and (
+                    self.__file_size(headers) == end if finish else chunk_accepted(request, end)
+                ):
+                    Logger.info("[Requests] A parte até %s já tinha sido aceita.", end)
+                    return end
+
+                raise RequestException(
+                    f"Status: {request.status_code} | Resposta: {request.text}"
+                )
+            except RequestException as failure:
+                error = failure
+                Logger.error(
+                    "[Requests] Parte até %s, tentativa %s falhou: %s", end, attempt, failure
+                )
+                if attempt < MAX_RETRIES:
+                    METRICS.count("retries_total", stage="upload")
+                    time.sleep(RETRY_DELAY)
+
+        raise error
+
+    def __file_size(self, headers: dict) -> int | None:
+        """
+            Retorna o tamanho do arquivo publicado no SharePoint (None se não for possível ler).
+            Confirma um FinishUpload cuja resposta se perdeu: a sessão já não existe, mas o
+            arquivo tem o tamanho novo.
+
+            Parâmetros:
+            - headers (dict): Cabeçalhos com o token de acesso.
+        """
+
+        try:
+            request = client.get(url=f"{FILE_API}?$select=Length", headers=headers, timeout=TIMEOUT)
+            request.raise_for_status()
+            return int(request.json().get("Length"))
+        except (RequestException, TypeError, ValueError) as error:
+            Logger.error("[Requests] Não foi possível ler o tamanho do arquivo: %s", error)
+            return None
+
+    def __cancel_upload(self, upload_id: str, headers: dict) -> None:
+        """
+            Cancela a sessão de upload. Uma falha aqui é só registrada: o erro do envio, que
+            motivou o cancelamento, é o que deve chegar a quem chamou.
+
+            Parâmetros:
+            - upload_id (str): ID da sessão de upload.
+            - headers (dict): Cabeçalhos com o token de acesso.
+        """
+
+        try:
+            client.post(
+                url=f"{FILE_API}/CancelUpload(uploadId={upload_id})",
+                headers=headers,
+                timeout=TIMEOUT
+            )
+        except RequestException as error:
+            Logger.error("[Requests] Não foi possível cancelar o upload: %s", error)
@@ -0,0 +1,178 @@
+"""
+    Módulo com o estado local da última execução, usado na coleta incremental.
+
+    Inclui:
+    - Armazenamento em disco dos artefatos lidos, por ID de workspace e nome de artefato.
+    - Regra que decide quais workspaces precisam ser lidas novamente.
+    - Reaproveitamento (carry forward) dos dados das workspaces que não mudaram.
+"""
+
+import datetime
+import json
+import os
+import tempfile
+import time
+
+from src.dates import now, parse_title, same_day
+from src.setup import Config, Logger, data_dir
+
+STATE_NAME = "state.json" # na pasta do perfil ativo (ver src/setup.py)
+
+# minutos até o estado de uma workspace expirar (0 = sempre lê tudo)
+STATE_TTL = Config.getint("INIT", "STATE_TTL", fallback=0)
+
+# limites usados na prioridade (due_at); com fuso, como as datas lidas
+EARLIEST = datetime.datetime.min.replace(tzinfo=datetime.timezone.utc)
+LATEST = datetime.datetime.max.replace(tzinfo=datetime.timezone.utc)
+
+def read_time(saved: dict) -> datetime.datetime:
+    """
+        Retorna a data hora (com fuso) da última leitura salva de uma workspace.
+
+        Parâmetros:
+        - saved (dict): Estado da workspace.
+    """
+
+    return datetime.datetime.fromtimestamp(saved["read_at"], datetime.timezone.utc)
+
+class StateStore:
+    """
+        Classe que guarda o estado da última leitura de cada workspace.
+
+        Métodos:
+        - is_due(workspace_id): Se a workspace precisa ser lida nesta execução.
+        - due_at(workspace_id): Quando a workspace vence (usado na prioridade).
+        - carried(workspace_id, current_date): Dados salvos, prontos para o resultado.
+        - update(workspace_id, execution_data, read_at): Atualiza o estado com uma leitura.
+        - fail(workspace_id): Marca a workspace para ser lida na próxima execução.
+        - save(): Grava o estado em disco.
+    """
+
+    def __init__(self, ttl: int = STATE_TTL) -> None:
+        """
+            Parâmetros:
+            - ttl (int): Minutos até o estado de uma workspace expirar (0 = desativado).
+        """
+
+        self.__ttl = ttl * 60
+        self.__state = {}
+        self.__path = data_dir() / STATE_NAME
+
+        if self.__ttl > 0:
+            try:
+                with open(self.__path, "r", encoding="utf-8") as file:
+                    self.__state = json.load(file)
+            except (OSError, ValueError):
+                Logger.info("[Estado] Sem estado anterior. Todas as workspaces serão lidas.")
+
+    def is_due(self, workspace_id: str) -> bool:
+        """
+            Indica se a workspace deve ser lida: sem estado, leitura anterior com falha, estado
+            expirado (TTL) ou com alguma atualização agendada que já passou desde a última
+            leitura.
+
+            Parâmetros:
+            - workspace_id (str): ID da workspace.
+        """
+
+        saved = self.__state.get(workspace_id)
+
+        if self.__ttl <= 0 or not saved or saved.get("failed"):
+            return True
+
+        if time.time() - saved["read_at"] > self.__ttl:
+            return True
+
+        current = now()
+        read_at = read_time(saved)
+
+        for artifacts in saved["data"].values():
+            for artifact in artifacts.values():
+                next_update = parse_title(artifact.get("next_update"))
+                if next_update and read_at < next_update <= current:
+                    return True
+
+        return False
+
+    def due_at(self, workspace_id: str) -> datetime.datetime:
+        """
+            Retorna a primeira atualização agendada depois da última leitura da workspace.
+            Workspaces nunca lidas ou com falha vencem antes de todas; sem agendamento, depois
+            de todas.
+
+            Parâmetros:
+            - workspace_id (str): ID da workspace.
+        """
+
+        saved = self.__state.get(workspace_id)
+        if not saved or saved.get("failed"):
+            return EARLIEST
+
+        read_at = read_time(saved)
+        due = LATEST
+
+        for artifacts in saved["data"].values():
+            for artifact in artifacts.values():
+                next_update = parse_title(artifact.get("next_update"))
+                if next_update and next_update > read_at:
+                    due = min(due, next_update)
+
+        return due
+
+    def carried(self, workspace_id: str, current_date: str) -> dict:
+        """
+            Retorna os dados salvos da workspace, com 'atualizado_hoje' recalculado.
+
+            Parâmetros:
+            - workspace_id (str): ID da workspace.
+            - current_date (str): Data hora da execução, no formato 'dd/mm/aaaa - HH:MM:SS'.
+        """
+
+        data = self.__state.get(workspace_id, {}).get("data", {})
+
+        for artifacts in data.values():
+            for artifact in artifacts.values():
+                artifact["atualizado_hoje"] = same_day(artifact["last_update"], current_date)
+
+        return data
+
+    def update(
+        self, workspace_id: str, execution_data: dict, read_at: float | None = None
+    ) -> None:
+        """
+            Substitui o estado da workspace pelos dados lidos.
+
+            Parâmetros:
+            - workspace_id (str): ID da workspace.
+            - execution_data (dict): Dicionário {workspace: {artefato: dados}}.
+            - read_at (float | None, opcional): Hora da leitura (segundos desde 1970). Se None,
+              agora; uma retomada informa a hora gravada no diário.
+        """
+
+        read_at = time.time() if read_at is None else read_at
+        self.__state[workspace_id] = {"read_at": read_at, "data": execution_data}
+
+    def fail(self, workspace_id: str) -> None:
+        """
+            Marca a workspace que esgotou as tentativas: os dados salvos continuam disponíveis
+            (ver carried), mas ela vence na próxima execução, antes das demais.
+
+            Parâmetros:
+            - workspace_id (str): ID da workspace.
+        """
+
+        if workspace_id in self.__state:
+            self.__state[workspace_id]["failed"] = True
+
+    def save(self) -> None:
+        """
+            Grava o estado em disco, de forma atômica.
+        """
+
+        if self.__ttl <= 0:
+            return
+
+        descriptor, temp_path = tempfile.mkstemp(dir=self.__path.parent, suffix=".tmp")
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            json.dump(self.__state, file, ensure_ascii=False)
+        os.replace(temp_path, self.__path)
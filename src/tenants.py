@@ -0,0 +1,98 @@
+"""
+    Módulo com o modo multi-tenant: vários perfis de credenciais lidos na mesma execução.
+
+    Inclui:
+    - Lista de perfis (PROFILES, settings.ini), cada um com a sua '.env.{perfil}'.
+    - Extração de cada perfil em um processo próprio (pool de processos), com cache de tokens,
+      estado e sessões do navegador isolados (ver use_profile em src/setup.py).
+    - Junção dos resultados em um único ResultSet, com o tenant (perfil) em cada artefato.
+      O nome da workspace não muda: o tenant fica na própria coluna e faz parte das chaves
+      da publicação incremental (src/delta.py) e do histórico (src/history.py).
+
+    O tempo total tende ao do tenant mais lento, e não à soma de todos.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.dates import capture_time
+from src.info import WebExtractor
+from src.metrics import METRICS
+from src.records import Artifact, RefreshStatus, ResultSet
+from src.setup import Config, Logger, data_dir, profile_env_path, use_profile
+
+PROFILES = tuple(
+    item.strip() for item in Config.get("INIT", "PROFILES", fallback="").split(",") if item.strip()
+)
+TENANT_WORKERS = Config.getint("INIT", "TENANT_WORKERS", fallback=0) # 0 = um por perfil
+
+def run_profile(name: str) -> ResultSet:
+    """
+        Executa a extração de um perfil. Roda dentro de um processo do pool.
+        Retorna o ResultSet de WebExtractor.get_info().
+
+        Parâmetros:
+        - name (str): Nome do perfil.
+    """
+
+    use_profile(name)
+    METRICS.reset()
+
+    Logger.info("[Tenants] Iniciando o perfil %s...", name)
+    try:
+        return WebExtractor().get_info()
+    finally:
+        METRICS.export(data_dir() / "metrics.prom", data_dir() / "run_summary.json")
+
+def merge_tenant(merged: ResultSet, tenant: str, data: ResultSet) -> None:
+    """
+        Junta o resultado de um perfil ao da execução, marcando o tenant em cada artefato.
+        Workspaces com o mesmo nome em tenants diferentes são separadas pela coluna do tenant,
+        e não pelo nome: o resultado não depende da ordem em que os perfis terminam.
+
+        Parâmetros:
+        - merged (ResultSet): Resultado da execução.
+        - tenant (str): Nome do perfil.
+        - data (ResultSet): Resultado retornado por run_profile.
+    """
+
+    for record in data.records():
+        merged.append(Artifact(
+            record.id, record.workspace, record.name, record.type, record.last_update,
+            record.next_update, record.status == RefreshStatus.FAILED, tenant
+        ))
+        if record.detail:
+            merged.attach(tenant, record.id, record.detail)
+
+def collect_tenants(profiles: tuple[str, ...] = PROFILES) -> ResultSet:
+    """
+        Extrai todos os perfis em paralelo e retorna um único ResultSet, como get_info().
+        Um perfil que falhar é registrado no log e não interrompe os demais.
+
+        Parâmetros:
+        - profiles (tuple[str, ...], opcional): Nomes dos perfis.
+    """
+
+    merged = ResultSet(capture_time())
+
+    for name in profiles:
+        if not profile_env_path(name).exists():
+            Logger.error("[Tenants] Arquivo %s não encontrado.", profile_env_path(name))
+
+    # 'spawn' em todos os sistemas: cada processo começa sem navegadores nem estado herdados
+    context = multiprocessing.get_context("spawn")
+    workers = TENANT_WORKERS if TENANT_WORKERS > 0 else len(profiles)
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = {executor.submit(run_profile, name): name for name in profiles}
+
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                merge_tenant(merged, name, future.result())
+                Logger.info("[Tenants] Perfil %s concluído.", name)
+            except (Exception, SystemExit) as error: # pylint: disable=broad-exception-caught
+                Logger.error("[Tenants] Perfil %s falhou. Erro: %r", name, error)
+                METRICS.count("tenants_failed_total", tenant=name)
+
+    return merged
@@ -0,0 +1,7 @@
+"""
+    Pacote com os testes do projeto (pytest).
+    Rodam offline: a API do Power BI é imitada por src/mock_server.py.
+
+    Uso:
+    - python -m pytest -q
+"""
@@ -0,0 +1,109 @@
+"""
+    Testes do backend de API (src/api.py): agendamento, datas e leitura de uma workspace
+    no servidor local que imita a API do Power BI.
+"""
+
+import datetime
+
+import pytest
+
+from src import api, dates
+from src.mock_server import MockServer, sample_routes
+
+UTC = datetime.timezone.utc
+
+def local(*args) -> str:
+    """Formata um instante UTC em hora local, como a tela (e o backend de API) exibe."""
+
+    return datetime.datetime(*args, tzinfo=UTC).astimezone().strftime(dates.FORMATS["pt-BR"][0])
+
+def schedule(times: list[str], days: list[str], zone: str | None = None) -> dict:
+    """Monta um retorno de 'refreshSchedule'."""
+
+    data = {"enabled": True, "days": days, "times": times}
+    if zone:
+        data["localTimeZoneId"] = zone
+    return data
+
+def test_next_schedule_disabled() -> None:
+    now = datetime.datetime(2025, 2, 3, 6, tzinfo=UTC)
+
+    assert api.next_schedule({"enabled": False, "times": ["07:00"]}, now) is None
+    assert api.next_schedule({"enabled": True, "times": []}, now) is None
+
+def test_next_schedule_same_day_utc() -> None:
+    now = datetime.datetime(2025, 2, 3, 6, tzinfo=UTC) # segunda-feira
+
+    result = api.next_schedule(schedule(["07:00", "13:00"], ["Monday"], "UTC"), now)
+
+    assert result == local(2025, 2, 3, 7)
+
+def test_next_schedule_skips_to_next_day() -> None:
+    now = datetime.datetime(2025, 2, 3, 14, tzinfo=UTC) # segunda-feira, depois do último horário
+
+    result = api.next_schedule(schedule(["07:00"], ["Monday", "Wednesday"]), now)
+
+    assert result == local(2025, 2, 5, 7)
+
+def test_next_schedule_uses_schedule_zone() -> None:
+    now = datetime.datetime(2025, 2, 3, 9, tzinfo=UTC) # 06:00 em São Paulo (UTC-3)
+
+    result = api.next_schedule(
+        schedule(["07:00"], ["Monday"], "E. South America Standard Time"), now
+    )
+
+    assert result == local(2025, 2, 3, 10)
+
+def test_next_schedule_day_in_schedule_zone() -> None:
+    # terça 01:00 UTC ainda é segunda 22:00 em São Paulo: o horário de segunda vale
+    now = datetime.datetime(2025, 2, 4, 1, tzinfo=UTC)
+
+    result = api.next_schedule(
+        schedule(["23:00"], ["Monday"], "E. South America Standard Time"), now
+    )
+
+    assert result == local(2025, 2, 4, 2)
+
+def test_schedule_zone_accepts_iana_and_unknown() -> None:
+    assert str(api.schedule_zone({"localTimeZoneId": "Europe/Paris"})) == "Europe/Paris"
+    assert str(api.schedule_zone({})) == "UTC"
+    assert api.schedule_zone({"localTimeZoneId": "Fuso Inexistente"}) is not None
+
+@pytest.mark.parametrize("value", [None, "", "ontem"])
+def test_format_api_date_invalid(value) -> None:
+    assert api.format_api_date(value) is None
+
+def test_format_api_date_converts_utc() -> None:
+    assert api.format_api_date("2025-01-31T10:00:00.123Z") == local(2025, 1, 31, 10)
+
+@pytest.fixture(name="mock_api")
+def fixture_mock_api(monkeypatch):
+    """Servidor local com 1 workspace e 2 artefatos de cada tipo."""
+
+    server = MockServer(sample_routes(workspaces=1, artifacts=2))
+    monkeypatch.setattr(api, "API_URL", server.start())
+    yield server
+    server.stop()
+
+def test_read_workspace_from_mock(mock_api) -> None:
+    group = mock_api.routes["/groups"]["value"][0]
+
+    data = api.ApiExtractor("token", "31/01/2025 - 12:00:00").read(group["id"], group["name"])
+    artifacts = data[group["name"]]
+
+    assert set(artifacts) == {"Modelo 0", "Modelo 1", "Fluxo 0", "Fluxo 1"}
+    assert artifacts["Modelo 0"]["update_success"] is False # item 0 falhou no mock
+    assert artifacts["Modelo 1"]["update_success"] is True
+    assert artifacts["Modelo 0"]["last_update"] == local(2025, 1, 31, 9, 5)
+    assert artifacts["Modelo 0"]["agendamento_cancelado"] is True # item 0: desativado
+    assert artifacts["Fluxo 1"]["next_update"] == "Desconhecida."
+
+def test_read_survives_missing_dataflow_history(mock_api) -> None:
+    group = mock_api.routes["/groups"]["value"][0]
+    dataflow = mock_api.routes[f"/groups/{group['id']}/dataflows"]["value"][0]
+    del mock_api.routes[f"/groups/{group['id']}/dataflows/{dataflow['objectId']}/transactions"]
+
+    data = api.ApiExtractor("token", "31/01/2025 - 12:00:00").read(group["id"], group["name"])
+
+    assert data[group["name"]]["Fluxo 0"]["last_update"] == "Desconhecida."
+    assert data[group["name"]]["Fluxo 1"]["last_update"] == local(2025, 1, 31, 9, 5)
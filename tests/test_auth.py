@@ -0,0 +1,117 @@
+"""
+    Testes do cache de tokens (src/auth.py): cache por tenant, client e escopo, renovação com o
+    refresh token no servidor local que imita o login da Microsoft e validade dos tokens.
+"""
+
+import json
+import time
+
+import pytest
+
+from src import auth
+from src.mock_server import MockServer, TOKEN_RESPONSE
+
+POWER_BI = "https://analysis.windows.net/powerbi/api/.default"
+SHAREPOINT = "https://contoso.sharepoint.com/.default"
+BROWSER_TOKEN = {
+    "access_token": "navegador", "refresh_token": "refresh-navegador", "expires_in": 3600
+}
+
+@pytest.fixture(name="login")
+def fixture_login(monkeypatch, tmp_path):
+    """Login local, cache numa pasta temporária e o fluxo no navegador registrado."""
+
+    server = MockServer({})
+    server.start()
+    account = {"TENANT_ID": "tenant", "CLIENT_ID": "client"}
+    flows = []
+    posts = []
+    post = auth.client.post
+
+    def recorded_post(url, data=None, **kwargs):
+        posts.append((url, data))
+        return post(url, data=data, **kwargs)
+
+    def device_flow(driver, device_code_json):
+        flows.append(device_code_json["scope"])
+        return dict(BROWSER_TOKEN)
+
+    monkeypatch.setattr(auth, "LOGIN_URL", server.url)
+    monkeypatch.setattr(auth, "data_dir", lambda: tmp_path)
+    monkeypatch.setattr(auth, "get_env_values", lambda: dict(account))
+    monkeypatch.setattr(auth.client, "post", recorded_post)
+    monkeypatch.setattr(auth, "get_device_code", lambda *args: {"scope": args[2]})
+    monkeypatch.setattr(auth, "get_token_response", device_flow)
+    monkeypatch.setattr(auth, "network_options", lambda: None)
+    monkeypatch.setattr(auth, "new_driver", lambda options: object())
+    monkeypatch.setattr(auth, "quit_driver", lambda driver: None)
+
+    yield {"server": server, "account": account, "flows": flows, "posts": posts, "dir": tmp_path}
+    server.stop()
+
+def cache(folder) -> dict:
+    """Conteúdo do cache gravado em disco."""
+
+    with open(folder / auth.CACHE_NAME, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+def test_first_token_uses_browser_then_cache(login) -> None:
+    assert auth.get_token(POWER_BI) == "navegador"
+    assert auth.get_token(POWER_BI) == "navegador"
+
+    assert login["flows"] == [f"{POWER_BI} offline_access"]
+    assert not login["posts"]
+    saved = cache(login["dir"])["tenant|client"]
+    assert saved["refresh_token"] == "refresh-navegador"
+    assert saved["scopes"][POWER_BI]["expires_at"] > time.time() + 3000
+
+def test_second_scope_uses_refresh_token(login) -> None:
+    auth.get_token(POWER_BI)
+
+    assert auth.get_token(SHAREPOINT) == TOKEN_RESPONSE["access_token"]
+
+    assert len(login["flows"]) == 1 # só o primeiro escopo abriu o navegador
+    (url, data), = login["posts"]
+    assert url == f"{login['server'].url}/tenant/oauth2/v2.0/token"
+    assert data == {
+        "grant_type": "refresh_token", "client_id": "client",
+        "refresh_token": "refresh-navegador", "scope": f"{SHAREPOINT} offline_access"
+    }
+    saved = cache(login["dir"])["tenant|client"]
+    assert set(saved["scopes"]) == {POWER_BI, SHAREPOINT}
+    assert saved["refresh_token"] == TOKEN_RESPONSE["refresh_token"] # o token renovado vale
+
+def test_token_near_expiry_is_refreshed(login) -> None:
+    auth.write_cache({"tenant|client": {"refresh_token": "antigo", "scopes": {POWER_BI: {
+        "access_token": "quase-vencido", "expires_at": time.time() + auth.EXPIRY_MARGIN - 1
+    }}}})
+
+    assert auth.get_token(POWER_BI) == TOKEN_RESPONSE["access_token"]
+    assert login["posts"][0][1]["refresh_token"] == "antigo"
+    assert not login["flows"]
+
+def test_cache_is_per_tenant_and_client(login) -> None:
+    auth.get_token(POWER_BI)
+    login["account"]["CLIENT_ID"] = "outro-client"
+
+    assert auth.get_token(POWER_BI) == "navegador"
+
+    assert len(login["flows"]) == 2
+    assert not login["posts"]
+    assert set(cache(login["dir"])) == {"tenant|client", "tenant|outro-client"}
+
+def test_refused_refresh_token_falls_back_to_browser(login, monkeypatch) -> None:
+    auth.write_cache({"tenant|client": {"refresh_token": "revogado", "scopes": {}}})
+
+    class Refused:
+        """Resposta do login para um refresh token revogado."""
+
+        def json(self) -> dict:
+            """Erro do OAuth."""
+
+            return {"error": "invalid_grant"}
+
+    monkeypatch.setattr(auth.client, "post", lambda *args, **kwargs: Refused())
+
+    assert auth.get_token(POWER_BI) == "navegador"
+    assert cache(login["dir"])["tenant|client"]["refresh_token"] == "refresh-navegador"
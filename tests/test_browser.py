@@ -0,0 +1,65 @@
+"""
+    Testes das sessões do perfil enxuto (src/common.py e src/browser.py) com um Chrome falso:
+    a pasta de usuário reservada volta a ficar livre no quit_driver, mesmo com referências vivas.
+"""
+
+import pytest
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+from src import browser, common
+
+class FakeChrome:
+    """Chrome falso: guarda as opções recebidas e pode falhar ao encerrar."""
+
+    def __init__(self, service=None, options=None) -> None:
+        self.service = service
+        self.options = options
+        self.broken = False
+
+    def quit(self) -> None:
+        """Encerra a sessão (ou falha, se o navegador já caiu)."""
+
+        if self.broken:
+            raise WebDriverException("chrome not reachable")
+
+@pytest.fixture(name="chrome")
+def fixture_chrome(monkeypatch):
+    """Troca o Chrome, o serviço e a pasta do perfil por versões locais, sem sessões abertas."""
+
+    monkeypatch.setattr(webdriver, "Chrome", FakeChrome)
+    monkeypatch.setattr(common, "get_chrome_service", lambda: None)
+    monkeypatch.setattr(common, "block_resources", lambda driver: None)
+    monkeypatch.setattr(common, "scrape_options", lambda options, slot: slot)
+    monkeypatch.setattr(browser, "SLOTS_IN_USE", set())
+    monkeypatch.setattr(common, "OPEN_DRIVERS", {})
+
+def test_quit_driver_releases_slot(chrome) -> None:
+    first = common.new_driver(object(), scrape=True)
+    second = common.new_driver(object(), scrape=True)
+    assert (first.options, second.options) == (0, 1)
+
+    common.quit_driver(first) # 'first' continua referenciado aqui
+    assert browser.SLOTS_IN_USE == {1}
+
+    third = common.new_driver(object(), scrape=True)
+    assert third.options == 0
+    common.quit_driver(second)
+    common.quit_driver(third)
+    assert not browser.SLOTS_IN_USE and not common.OPEN_DRIVERS
+
+def test_quit_driver_releases_slot_of_dead_session(chrome) -> None:
+    driver = common.new_driver(object(), scrape=True)
+    driver.broken = True
+
+    common.quit_driver(driver)
+    common.quit_driver(driver) # de novo (ex.: quit_all): não libera a pasta de outra sessão
+
+    assert not browser.SLOTS_IN_USE and not common.OPEN_DRIVERS
+
+def test_default_profile_reserves_no_slot(chrome) -> None:
+    driver = common.new_driver(object(), scrape=False)
+
+    assert common.OPEN_DRIVERS == {driver: None}
+    common.quit_driver(driver)
+    assert not common.OPEN_DRIVERS
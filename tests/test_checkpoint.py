@@ -0,0 +1,146 @@
+"""
+    Testes do diário da execução (src/checkpoint.py) e da retomada (src/execution.py): prazo
+    (CHECKPOINT_TTL), linhas incompletas, hora da leitura original e nova leitura, na próxima
+    execução, da workspace que esgotou as tentativas.
+"""
+
+import json
+
+import pytest
+
+from src import checkpoint, execution, state
+from src.checkpoint import Checkpoint
+from src.state import StateStore
+
+CAPTURED_AT = "03/02/2025 - 08:00:00"
+DATA = {"Vendas": {"Painel": {
+    "id": "/groups/g/reports/1", "tipo": "Relatório", "last_update": "03/02/2025, 07:00:00",
+    "atualizado_hoje": True, "update_success": True, "next_update": "N/D",
+    "agendamento_cancelado": True
+}}}
+
+@pytest.fixture(name="folder")
+def fixture_folder(monkeypatch, tmp_path):
+    """Pasta do perfil ativo num diretório temporário, com o relógio controlado."""
+
+    clock = {"now": 1_000_000.0}
+    monkeypatch.setattr(checkpoint, "data_dir", lambda: tmp_path)
+    monkeypatch.setattr(state, "data_dir", lambda: tmp_path)
+    monkeypatch.setattr(checkpoint.time, "time", lambda: clock["now"])
+    return tmp_path, clock
+
+def interrupted(read_at: float) -> None:
+    """Grava o diário de uma execução que caiu depois de ler uma workspace."""
+
+    journal = Checkpoint(ttl=60)
+    journal.start(CAPTURED_AT)
+    journal.record("g", DATA, read_at)
+    journal.close()
+
+def test_resume_returns_read_workspaces(folder) -> None:
+    _, clock = folder
+    interrupted(clock["now"] - 10)
+
+    captured_at, done = Checkpoint(ttl=60).resume()
+
+    assert captured_at == CAPTURED_AT
+    assert done == {"g": {"read_at": clock["now"] - 10, "data": DATA}}
+
+def test_resume_expires_after_ttl(folder) -> None:
+    _, clock = folder
+    interrupted(clock["now"])
+
+    clock["now"] += 61 * 60
+
+    assert Checkpoint(ttl=60).resume() is None
+
+def test_resume_keeps_original_start(folder) -> None:
+    _, clock = folder
+    interrupted(clock["now"])
+
+    # uma retomada não renova o prazo: a segunda queda vence pelo início da primeira
+    clock["now"] += 40 * 60
+    journal = Checkpoint(ttl=60)
+    journal.start(*journal.resume())
+    journal.close()
+    clock["now"] += 40 * 60
+
+    assert Checkpoint(ttl=60).resume() is None
+
+def test_resume_discards_incomplete_line(folder) -> None:
+    path, clock = folder
+    interrupted(clock["now"])
+    with open(path / checkpoint.CHECKPOINT_NAME, "a", encoding="utf-8") as file:
+        file.write('{"workspace_id": "h", "data": {')
+
+    _, done = Checkpoint(ttl=60).resume()
+
+    assert list(done) == ["g"]
+
+def test_resume_disabled(folder) -> None:
+    _, clock = folder
+    interrupted(clock["now"])
+
+    assert Checkpoint(ttl=0).resume() is None
+
+@pytest.fixture(name="run")
+def fixture_run(monkeypatch, folder):
+    """Cria execuções com estado local e diário ativos."""
+
+    monkeypatch.setattr(execution, "StateStore", lambda: StateStore(ttl=60))
+    monkeypatch.setattr(execution, "Checkpoint", lambda: Checkpoint(ttl=60))
+    return folder
+
+def saved_read_at(path) -> float:
+    """Hora da leitura gravada no estado local para a workspace 'g'."""
+
+    with open(path / state.STATE_NAME, "r", encoding="utf-8") as file:
+        return json.load(file)["g"]["read_at"]
+
+def test_resume_keeps_original_read_time(run) -> None:
+    path, clock = run
+    interrupted(clock["now"] - 600)
+
+    resumed = execution.Execution()
+    done = resumed.start()
+    resumed.select([{"id": "g", "name": "Vendas"}])
+
+    assert not resumed.plan(["g"], done)
+    resumed.finish()
+    resumed.close()
+
+    assert saved_read_at(path) == clock["now"] - 600
+    assert not (path / checkpoint.CHECKPOINT_NAME).exists()
+
+def finished_run(fail: str | None = None) -> execution.Execution:
+    """Executa (sem navegador) as workspaces 'g' e 'h'; 'fail' esgota as tentativas."""
+
+    run = execution.Execution()
+    done = run.start()
+    run.select([{"id": "g", "name": "Vendas"}, {"id": "h", "name": "Compras"}])
+    run.plan(["g", "h"], done)
+    run.merge(DATA, "g")
+    if fail:
+        run.fail(fail)
+    else:
+        run.merge({"Compras": DATA["Vendas"]}, "h")
+    run.finish()
+    run.close()
+    return run
+
+def test_failed_workspace_is_read_again_without_resume(run) -> None:
+    path, _ = run
+    finished_run()
+
+    failed = finished_run(fail="h")
+
+    # execução concluída: o diário sai, e a falha não congela as próximas execuções
+    assert not (path / checkpoint.CHECKPOINT_NAME).exists()
+    assert "Compras" in failed.results.to_json() # dados salvos reaproveitados
+
+    following = execution.Execution()
+    done = following.start()
+    following.select([{"id": "g", "name": "Vendas"}, {"id": "h", "name": "Compras"}])
+
+    assert not done
+    assert following.plan(["g", "h"], done) == ["h"]
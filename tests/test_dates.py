@@ -0,0 +1,117 @@
+"""
+    Testes das datas exibidas (src/dates.py): leitura em pt-BR e en-US, comparação com o dia
+    da execução no fuso configurado e datas do backend de API no mesmo formato da tela.
+"""
+
+import datetime
+import time
+import types
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from src import api, dates
+
+SAO_PAULO = ZoneInfo("America/Sao_Paulo")
+UTC = datetime.timezone.utc
+
+@pytest.fixture(name="settings")
+def fixture_settings(monkeypatch):
+    """Fuso de São Paulo e idioma detectado pelo texto, sem conversões em cache."""
+
+    def configure(locale: str = "auto") -> None:
+        monkeypatch.setattr(dates, "TIMEZONE", "America/Sao_Paulo")
+        monkeypatch.setattr(dates, "UI_LOCALE", locale)
+        for cached in (dates.zone, dates.parse_title, dates.parse_capture):
+            cached.cache_clear()
+
+    configure()
+    yield configure
+    for cached in (dates.zone, dates.parse_title, dates.parse_capture):
+        cached.cache_clear()
+
+class FrozenDatetime(datetime.datetime):
+    """Relógio parado em 31/01/2025 01:30 UTC (30/01/2025 22:30 em São Paulo)."""
+
+    @classmethod
+    def now(cls, tz=None):
+        moment = datetime.datetime(2025, 1, 31, 1, 30, tzinfo=UTC)
+        return moment.astimezone(tz) if tz else moment.astimezone().replace(tzinfo=None)
+
+@pytest.fixture(name="machine_utc")
+def fixture_machine_utc(monkeypatch):
+    """Computador em UTC (fuso diferente de TIMEZONE), com o relógio parado."""
+
+    monkeypatch.setenv("TZ", "UTC")
+    time.tzset()
+    monkeypatch.setattr(dates, "datetime", types.SimpleNamespace(
+        datetime=FrozenDatetime, tzinfo=datetime.tzinfo, timezone=datetime.timezone
+    ))
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+def test_capture_time_uses_timezone_not_machine(settings, machine_utc) -> None:
+    settings()
+
+    captured_at = dates.capture_time()
+
+    assert captured_at == "30/01/2025 - 22:30:00"
+    # atualizada 30 minutos antes, no mesmo dia em São Paulo
+    assert dates.same_day("30/01/2025, 22:00:00", captured_at)
+
+def test_parse_title_pt_br(settings) -> None:
+    settings()
+
+    assert dates.parse_title("31/01/2025, 07:00:00") == datetime.datetime(
+        2025, 1, 31, 7, tzinfo=SAO_PAULO
+    )
+    assert dates.parse_title("31/01/2025 07:00:00") == datetime.datetime(
+        2025, 1, 31, 7, tzinfo=SAO_PAULO
+    )
+
+def test_parse_title_en_us(settings) -> None:
+    settings()
+
+    assert dates.parse_title("1/31/2025, 7:00:00 PM") == datetime.datetime(
+        2025, 1, 31, 19, tzinfo=SAO_PAULO
+    )
+    assert dates.parse_title("03/02/2025, 10:00:00", locale="en-US") == datetime.datetime(
+        2025, 3, 2, 10, tzinfo=SAO_PAULO
+    )
+
+@pytest.mark.parametrize("value", [None, "", "N/D", "Desconhecida.", "ontem"])
+def test_parse_title_without_date(settings, value) -> None:
+    settings()
+
+    assert dates.parse_title(value) is None
+
+def test_same_day(settings) -> None:
+    settings()
+    captured_at = "31/01/2025 - 12:00:00"
+
+    assert dates.same_day("31/01/2025, 00:10:00", captured_at)
+    assert dates.same_day("1/31/2025, 11:59:00 PM", captured_at)
+    assert not dates.same_day("30/01/2025, 23:59:00", captured_at)
+    assert not dates.same_day("31/01/2024, 07:00:00", captured_at) # só o ano muda
+    assert not dates.same_day("N/D", captured_at)
+
+def test_api_dates_follow_timezone(settings) -> None:
+    settings()
+
+    # 02:00 UTC ainda é o dia anterior em São Paulo (UTC-3)
+    value = api.format_api_date("2025-01-31T02:00:00Z")
+
+    assert value == "30/01/2025, 23:00:00"
+    assert dates.same_day(value, "30/01/2025 - 23:30:00")
+    assert not dates.same_day(value, "31/01/2025 - 08:00:00")
+
+def test_api_dates_follow_ui_locale(settings) -> None:
+    settings("en-US")
+    moment = datetime.datetime(2025, 2, 3, 10, tzinfo=UTC)
+
+    value = dates.format_title(moment)
+
+    assert value == "02/03/2025, 07:00:00 AM"
+    assert dates.parse_title(value) == moment
+    assert dates.same_day(value, "03/02/2025 - 12:00:00")
@@ -0,0 +1,108 @@
+"""
+    Testes da publicação incremental (src/delta.py): diferença em relação ao snapshot e
+    leitura da resposta '$batch' do SharePoint.
+"""
+
+import json
+
+import pytest
+
+from src import delta
+
+CAPTURED_AT = "03/02/2025 - 08:00:00"
+
+def artifact(last_update: str = "03/02/2025, 07:00:00", success: bool = True) -> dict:
+    """Artefato no formato legado ({workspace: {artefato: dados}})."""
+
+    return {
+        "tipo": "Modelo semântico", "last_update": last_update, "atualizado_hoje": True,
+        "update_success": success, "next_update": "N/D", "agendamento_cancelado": True
+    }
+
+def http_part(status: str, body: dict | None = None) -> str:
+    """Uma operação da resposta '$batch': parte application/http com a resposta inteira."""
+
+    content = json.dumps(body, ensure_ascii=False) if body is not None else ""
+    return (
+        "Content-Type: application/http\r\nContent-Transfer-Encoding: binary\r\n\r\n"
+        f"HTTP/1.1 {status}\r\nContent-Type: application/json;odata=nometadata\r\n\r\n"
+        f"{content}\r\n"
+    )
+
+def batch_response(parts: list[str], batch: str = "batchresponse_1",
+                   changeset: str = "changesetresponse_1") -> tuple[str, bytes]:
+    """Monta (Content-Type, corpo) de uma resposta '$batch' com um changeset aninhado."""
+
+    inner = "".join(f"--{changeset}\r\n{part}" for part in parts) + f"--{changeset}--\r\n"
+    body = (
+        f"--{batch}\r\nContent-Type: multipart/mixed; boundary={changeset}\r\n\r\n"
+        f"{inner}--{batch}--\r\n"
+    )
+    return f"multipart/mixed; boundary={batch}", body.encode("utf-8")
+
+@pytest.fixture(name="publisher")
+def fixture_publisher(tmp_path, monkeypatch) -> delta.ListPublisher:
+    """Publicador com o snapshot numa pasta temporária."""
+
+    monkeypatch.setattr(delta, "SNAPSHOT_PATH", tmp_path / "published.json")
+    return delta.ListPublisher("https://contoso.sharepoint.com/sites/bi", "Monitoramento")
+
+def test_diff_new_changed_and_unchanged(publisher, monkeypatch) -> None:
+    data = {CAPTURED_AT: {"Vendas": {"Painel": artifact(), "Metas": artifact()}}}
+    changes = publisher.diff(data)
+
+    assert [(key, item_id) for key, item_id, _ in changes] == [
+        ("Vendas|Painel|Modelo semântico", None), ("Vendas|Metas|Modelo semântico", None)
+    ]
+
+    # simula os itens já publicados
+    content_type, body = batch_response([
+        http_part("201 Created", {"Id": 1}), http_part("201 Created", {"Id": 2})
+    ])
+
+    class Response: # pylint: disable=too-few-public-methods
+        """Resposta aceita do '$batch'."""
+
+        status_code = 200
+        headers = {"Content-Type": content_type}
+        content = body
+
+    monkeypatch.setattr(delta.client, "post", lambda **_: Response())
+    assert publisher.publish(data, "token")
+
+    # só a data hora da execução mudou: nada a publicar
+    assert not publisher.diff({"04/02/2025 - 08:00:00": data[CAPTURED_AT]})
+
+    changed = {CAPTURED_AT: {"Vendas": {"Painel": artifact(success=False), "Metas": artifact()}}}
+    assert [(key, item_id) for key, item_id, _ in publisher.diff(changed)] == [
+        ("Vendas|Painel|Modelo semântico", 1)
+    ]
+
+def test_diff_skips_empty_optional_fields(publisher) -> None:
+    (_, _, values), = publisher.diff({CAPTURED_AT: {"Vendas": {"Painel": artifact()}}})
+
+    assert not set(delta.OPTIONAL) & set(values)
+
+def test_batch_response_uses_boundary_from_header() -> None:
+    content_type, body = batch_response(
+        [http_part("201 Created", {"Id": 7, "Title": "--a--\r\n--b"}), http_part("204 No Content")],
+        batch="batchresponse_xyz", changeset="changesetresponse_abc"
+    )
+
+    assert delta.parse_batch_response(content_type, body) == [
+        (201, {"Id": 7, "Title": "--a--\r\n--b"}), (204, {})
+    ]
+
+def test_batch_response_keeps_utf8_and_errors() -> None:
+    error = {"odata.error": {"message": {"value": "Coluna 'Relatório' inválida"}}}
+    content_type, body = batch_response([
+        http_part("201 Created", {"Id": 1, "Title": "Relatório de ações"}),
+        http_part("400 Bad Request", error)
+    ])
+
+    assert delta.parse_batch_response(content_type, body) == [
+        (201, {"Id": 1, "Title": "Relatório de ações"}), (400, error)
+    ]
+
+def test_batch_response_without_boundary() -> None:
+    assert not delta.parse_batch_response("application/json", b'{"error": "x"}')
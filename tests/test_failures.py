@@ -0,0 +1,118 @@
+"""
+    Testes do detalhamento das falhas (src/failures.py): caminho do histórico na API, formato
+    do detalhe e leitura em lotes no servidor local que imita a API do Power BI.
+"""
+
+import json
+
+import pytest
+
+from src import failures
+from src.mock_server import MockServer, sample_routes
+from src.records import ResultSet
+
+CAPTURED_AT = "31/01/2025 - 12:00:00"
+GROUP = "00000000-0000-0000-0000-000000000000"
+
+def artifact(kind: str, item: int, failed: bool) -> dict:
+    """Linha da tela de um artefato do servidor local (item 0, 4, 8... falharam lá)."""
+
+    artifact_id = f"{GROUP[:-6]}{item:06d}"
+    return {
+        "id": f"/groups/{GROUP}/{kind}/{artifact_id}/details?experience=power-bi",
+        "name": f"{kind} {item}", "type": kind, "last_refresh": "31/01/2025, 09:05:00",
+        "next_refresh": "N/D", "failed": failed
+    }
+
+@pytest.mark.parametrize(("href", "path"), [
+    (f"/groups/{GROUP}/datasets/1/details?experience=power-bi",
+     f"/groups/{GROUP}/datasets/1/refreshes?$top={failures.HISTORY_TOP}"),
+    (f"/groups/{GROUP}/dataflows/2", f"/groups/{GROUP}/dataflows/2/transactions?$top=5"),
+    ("/groups/me/datasets/3/details", "/datasets/3/refreshes?$top=5"),
+    ("/groups/me/dataflows/4", None),
+    (f"/groups/{GROUP}/reports/5/ReportSection", None),
+    (None, None)
+])
+def test_history_path(href, path) -> None:
+    assert failures.history_path(href) == path
+
+def test_failure_detail_format() -> None:
+    history = [
+        {"status": "Completed"},
+        {
+            "status": "Failed",
+            "startTime": "2025-01-31T09:00:00Z",
+            "endTime": "2025-01-31T09:05:30.500Z",
+            "serviceExceptionJson": json.dumps({
+                "errorCode": "ModelRefresh_ShortMessage_ProcessingError",
+                "errorDescription": "Fonte de dados indisponível."
+            }),
+            "refreshAttempts": [{"attemptId": 1}, {"attemptId": 2}]
+        }
+    ]
+
+    detail = failures.failure_detail(history)
+
+    assert detail == failures.FailureDetail(
+        "ModelRefresh_ShortMessage_ProcessingError", "Fonte de dados indisponível.", 330.5, 2
+    )
+
+def test_failure_detail_without_exception() -> None:
+    detail = failures.failure_detail([{"status": "Cancelled", "serviceExceptionJson": "["}])
+
+    assert detail == failures.FailureDetail("Cancelled", "", None, None)
+    assert failures.failure_detail([{"status": "Completed"}]) is None
+    assert failures.failure_detail([]) is None
+
+@pytest.fixture(name="mock_api")
+def fixture_mock_api(monkeypatch):
+    """Servidor local com 1 workspace e 9 artefatos de cada tipo."""
+
+    server = MockServer(sample_routes(workspaces=1, artifacts=9))
+    monkeypatch.setattr(failures, "API_URL", server.start())
+    yield server
+    server.stop()
+
+def test_enrich_failures_in_batches(mock_api, monkeypatch) -> None:
+    results = ResultSet(CAPTURED_AT)
+    results.add_rows("Workspace 0", [
+        *(artifact("datasets", item, item % 4 == 0) for item in range(9)),
+        *(artifact("dataflows", item, item % 4 == 0) for item in range(9)),
+        {**artifact("reports", 1, True), "name": "Relatório"} # sem histórico na API
+    ])
+    batches = []
+    fan_out = failures.client.fan_out
+
+    def recorded(func, items):
+        batches.append(len(items))
+        return fan_out(func, items)
+
+    monkeypatch.setattr(failures.client, "fan_out", recorded)
+
+    assert failures.enrich_failures(results, "token", batch=4) == 6
+    assert batches == [4, 2]
+    assert mock_api.hits == 6
+
+    details = [row[10:] for row in results.iter_rows() if row[10]]
+    assert details == [[
+        "ModelRefresh_ShortMessage_ProcessingError", "Fonte de dados indisponível.", 300.0, 2
+    ]] * 6
+
+def test_enrich_failures_missing_history(mock_api) -> None:
+    missing = artifact("datasets", 0, True)
+    del mock_api.routes[f"/groups/{GROUP}/datasets/{GROUP[:-6]}000000/refreshes"]
+
+    results = ResultSet(CAPTURED_AT)
+    results.add_rows("Workspace 0", [missing, artifact("datasets", 4, True)])
+
+    assert failures.enrich_failures(results, "token") == 1
+    assert [row[10] for row in results.iter_rows()] == [
+        "", "ModelRefresh_ShortMessage_ProcessingError"
+    ]
+
+def test_enrich_failures_without_failures(mock_api) -> None:
+    results = ResultSet(CAPTURED_AT)
+    results.add_rows("Workspace 0", [artifact("datasets", 1, False)])
+
+    assert failures.enrich_failures(results, "token") == 0
+    assert mock_api.hits == 0
@@ -0,0 +1,111 @@
+"""
+    Testes do histórico local (src/history.py) num SQLite temporário: migração de bancos
+    antigos, retenção, limite do VACUUM e exportação da janela móvel para .xlsx.
+"""
+
+import datetime
+import sqlite3
+
+import openpyxl
+import pytest
+
+from src import history
+from src.history import COLUMNS, DATE_FORMAT, HistoryStore
+
+def artifact(message: str = "") -> dict:
+    """Dados de um artefato no formato legado."""
+
+    return {
+        "tipo": "Relatório", "last_update": "31/01/2025, 07:00:00", "atualizado_hoje": True,
+        "update_success": not message, "next_update": "N/D", "agendamento_cancelado": True,
+        "error_message": message
+    }
+
+def run(days_ago: int, artifacts: int = 1, message: str = "") -> dict:
+    """Execução de N dias atrás, no formato {data hora: {workspace: {artefato: dados}}}."""
+
+    captured_at = datetime.datetime.now() - datetime.timedelta(days=days_ago)
+    return {captured_at.strftime(DATE_FORMAT): {"Vendas": {
+        f"Painel {item}": artifact(message) for item in range(artifacts)
+    }}}
+
+def pragma(path, name: str) -> int:
+    """Lê um PRAGMA numérico do banco, numa conexão à parte."""
+
+    with sqlite3.connect(path) as connection:
+        return connection.execute(f"PRAGMA {name}").fetchone()[0]
+
+@pytest.fixture(name="path")
+def fixture_path(tmp_path):
+    """Caminho de um banco temporário."""
+
+    return tmp_path / "history.sqlite3"
+
+def test_migrations_upgrade_old_database(path) -> None:
+    with sqlite3.connect(path) as connection:
+        connection.executescript("""
+            CREATE TABLE snapshots (
+                captured_at TEXT NOT NULL, workspace TEXT NOT NULL, artifact TEXT NOT NULL,
+                tipo TEXT, last_update TEXT, atualizado_hoje INTEGER, update_success INTEGER,
+                next_update TEXT, agendamento_cancelado INTEGER
+            );
+            CREATE INDEX idx_snapshots_artifact ON snapshots (workspace, artifact, captured_at);
+            INSERT INTO snapshots VALUES
+                ('2025-01-31 08:00:00', 'Vendas', 'Painel', 'Relatório', 'N/D', 0, 1, 'N/D', 1);
+        """)
+
+    with HistoryStore(path) as store:
+        store.append(run(0))
+
+    with sqlite3.connect(path) as connection:
+        columns = [row[1] for row in connection.execute("PRAGMA table_info(snapshots)")]
+        indexes = {row[1] for row in connection.execute("PRAGMA index_list(snapshots)")}
+        tenants = [row[0] for row in connection.execute("SELECT tenant FROM snapshots")]
+
+    assert columns[9:] == list(history.MIGRATIONS)
+    assert "idx_snapshots_tenant_artifact" in indexes
+    assert "idx_snapshots_artifact" not in indexes
+    assert tenants == ["", ""]
+
+def test_compact_removes_rows_past_retention(path) -> None:
+    with HistoryStore(path) as store:
+        store.append(run(200))
+        store.append(run(10))
+        store.compact(retention=180)
+
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0] == 1
+
+def test_compact_vacuums_only_past_free_ratio(path) -> None:
+    message = "x" * 2000
+
+    with HistoryStore(path) as store:
+        store.append(run(200, artifacts=10, message=message))
+        store.append(run(10, artifacts=300, message=message))
+        store.compact(retention=180) # poucas páginas livres: o espaço fica para reuso
+
+    assert pragma(path, "freelist_count") > 0
+
+    with HistoryStore(path) as store:
+        store.append(run(190, artifacts=600, message=message))
+        store.compact(retention=180) # metade do banco livre: reorganiza
+
+    assert pragma(path, "freelist_count") == 0
+
+def test_export_xlsx_window(path) -> None:
+    with HistoryStore(path) as store:
+        store.append(run(40))
+        store.append(run(2, message="Falhou"))
+        store.append(run(1))
+        excel_file = store.export_xlsx(days=30)
+
+    sheet = openpyxl.load_workbook(excel_file, read_only=True).active
+    header, *rows = [list(row) for row in sheet.iter_rows(values_only=True)]
+
+    assert header == COLUMNS
+    assert len(rows) == 2
+    dates = [datetime.datetime.strptime(row[0], DATE_FORMAT) for row in rows]
+    assert dates == sorted(dates) # em ordem de execução, no formato da data hora publicada
+    assert rows[0][5:9] == [True, False, "N/D", True]
+    assert rows[0][11] == "Falhou"
+    assert rows[1][6] is True
@@ -0,0 +1,129 @@
+"""
+    Testes do pool de sessões (src/pool.py) com navegadores falsos: substituição das sessões
+    que caem, reciclagem após SESSION_MAX_PAGES e vagas sem sessão abertas de novo.
+"""
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from src import pool
+from src.pool import DriverPool
+
+class FakeDriver:
+    """Sessão falsa: responde aos comandos até 'crash' e guarda os cookies recebidos."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.alive = True
+        self.quit = False
+        self.cookies = [{"name": "sessao", "value": name}]
+
+    def execute_script(self, _) -> str:
+        """document.readyState, usado na verificação de saúde."""
+
+        if not self.alive:
+            raise WebDriverException("chrome not reachable")
+        return "complete"
+
+    def execute_cdp_cmd(self, command: str, params: dict) -> dict:
+        """Network.getAllCookies e Network.setCookies."""
+
+        if not self.alive:
+            raise WebDriverException("chrome not reachable")
+        if command == "Network.setCookies":
+            self.cookies = params["cookies"]
+        return {"cookies": self.cookies}
+
+    def crash(self) -> None:
+        """Derruba o navegador."""
+
+        self.alive = False
+
+@pytest.fixture(name="factory")
+def fixture_factory(monkeypatch):
+    """Troca new_driver e quit_driver por navegadores falsos, registrados por ordem."""
+
+    created = []
+
+    def new_driver(_options=None) -> FakeDriver:
+        driver = FakeDriver(f"sessao-{len(created) + 1}")
+        created.append(driver)
+        return driver
+
+    def quit_driver(driver: FakeDriver) -> None:
+        driver.quit = True
+
+    monkeypatch.setattr(pool, "new_driver", new_driver)
+    monkeypatch.setattr(pool, "quit_driver", quit_driver)
+    return created
+
+def test_pool_copies_source_cookies(factory) -> None:
+    source = FakeDriver("origem")
+
+    with DriverPool(size=3, source=source, max_pages=0) as sessions:
+        assert len(sessions) == 3
+        assert [driver.cookies for driver in factory] == [source.cookies] * 2
+
+    assert source.quit and all(driver.quit for driver in factory)
+
+def test_dead_driver_is_replaced_on_checkout(factory) -> None:
+    source = FakeDriver("origem")
+    sessions = DriverPool(size=1, source=source, max_pages=0)
+    source.crash()
+
+    with sessions.session() as driver:
+        assert driver is factory[0]
+
+    assert source.quit
+    assert driver.cookies == [{"name": "sessao", "value": "origem"}]
+    sessions.close()
+
+def test_crash_during_read_frees_slot_for_new_session(factory) -> None:
+    source = FakeDriver("origem")
+    sessions = DriverPool(size=1, source=source, max_pages=0)
+
+    with pytest.raises(WebDriverException):
+        with sessions.session() as driver:
+            driver.crash()
+            raise WebDriverException("tab crashed")
+
+    assert source.quit and not factory # a vaga fica vazia até o próximo empréstimo
+
+    with sessions.session() as driver:
+        assert driver is factory[0]
+    sessions.close()
+
+def test_respawn_failure_keeps_slot(factory, monkeypatch) -> None:
+    source = FakeDriver("origem")
+    sessions = DriverPool(size=1, source=source, max_pages=0)
+    source.crash()
+
+    def refused(_options=None):
+        raise WebDriverException("session not created")
+
+    new_driver = pool.new_driver
+    monkeypatch.setattr(pool, "new_driver", refused)
+    with pytest.raises(WebDriverException):
+        with sessions.session():
+            pass
+
+    monkeypatch.setattr(pool, "new_driver", new_driver)
+    with sessions.session() as driver:
+        assert driver is factory[0]
+    assert len(sessions) == 1
+    sessions.close()
+
+def test_session_is_recycled_after_max_pages(factory) -> None:
+    source = FakeDriver("origem")
+    sessions = DriverPool(size=1, source=source, max_pages=2)
+    source.cookies = [{"name": "sessao", "value": "renovada"}] # ex.: novo login na sessão
+
+    used = []
+    for _ in range(5):
+        with sessions.session() as driver:
+            used.append(driver.name)
+
+    assert used == ["origem", "origem", "sessao-1", "sessao-1", "sessao-2"]
+    assert source.quit and factory[0].quit and not factory[1].quit
+    assert factory[0].cookies == [{"name": "sessao", "value": "renovada"}]
+    sessions.close()
@@ -0,0 +1,74 @@
+"""
+    Testes da espera por ociosidade de rede (src/readiness.py), com um navegador falso que
+    devolve os eventos do log 'performance' em lotes, e do descarte dos eventos acumulados.
+"""
+
+import json
+
+from selenium.common.exceptions import WebDriverException
+
+from src.readiness import discard_network_log, wait_network_idle
+
+def event(method: str, request_id: str, url: str = "https://app.powerbi.com/x",
+          kind: str = "XHR") -> dict:
+    """Monta uma entrada do log 'performance' no formato do ChromeDriver."""
+
+    params = {"requestId": request_id, "request": {"url": url}, "type": kind}
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+class FakeDriver:
+    """Devolve um lote por leitura; depois, só eventos que não abrem nem fecham requisições."""
+
+    def __init__(self, batches: list[list], noise: bool = True) -> None:
+        self.batches = list(batches)
+        self.noise = noise
+
+    def get_log(self, _) -> list:
+        """Próximo lote de eventos."""
+
+        if self.batches:
+            return self.batches.pop(0)
+        return [event("Network.dataReceived", "0")] if self.noise else []
+
+class NoLogDriver:
+    """Sessão sem o log 'performance' habilitado."""
+
+    def get_log(self, _) -> list:
+        """O ChromeDriver recusa o tipo de log não habilitado."""
+
+        raise WebDriverException("log type 'performance' not found")
+
+def test_other_events_do_not_delay_idle() -> None:
+    driver = FakeDriver([
+        [event("Network.requestWillBeSent", "1")],
+        [event("Network.loadingFinished", "1")]
+    ])
+
+    assert wait_network_idle(driver, timeout=2, idle=0.2)
+
+def test_long_lived_requests_are_ignored() -> None:
+    driver = FakeDriver([
+        [event("Network.requestWillBeSent", "1", url="https://x/signalr/connect")],
+        [event("Network.requestWillBeSent", "2", kind="WebSocket")]
+    ])
+
+    assert wait_network_idle(driver, timeout=2, idle=0.2)
+
+def test_request_in_flight_times_out() -> None:
+    driver = FakeDriver([[event("Network.requestWillBeSent", "1")]], noise=False)
+
+    assert not wait_network_idle(driver, timeout=0.5, idle=0.2)
+
+def test_missing_log_does_not_wait() -> None:
+    assert wait_network_idle(NoLogDriver(), timeout=5)
+
+def test_discarded_backlog_does_not_count_as_in_flight() -> None:
+    # requisição da página anterior que nunca terminou (a página foi trocada pela rota)
+    driver = FakeDriver([[event("Network.requestWillBeSent", "old")]])
+
+    discard_network_log(driver)
+
+    assert wait_network_idle(driver, timeout=2, idle=0.2)
+
+def test_discard_without_log() -> None:
+    discard_network_log(NoLogDriver())
@@ -0,0 +1,39 @@
+"""
+    Testes do contêiner colunar (src/records.py): artefatos sem ID têm a mesma chave quando
+    vêm da tela (add_rows) ou do formato legado (add_json).
+"""
+
+from src.extract import build_execution_data
+from src.records import ResultSet
+
+CAPTURED_AT = "03/02/2025 - 08:00:00"
+
+ROWS = [
+    {
+        "id": None, "name": "Painel", "type": "Relatório",
+        "last_refresh": "03/02/2025, 07:00:00", "next_refresh": "N/D", "failed": False
+    },
+    {
+        "id": None, "name": "Painel", "type": "Modelo semântico",
+        "last_refresh": "02/02/2025, 07:00:00", "next_refresh": "N/D", "failed": True
+    }
+]
+
+def test_rows_replace_carried_artifacts_without_id() -> None:
+    results = ResultSet(CAPTURED_AT)
+    results.add_json(build_execution_data("Vendas", ROWS, CAPTURED_AT))
+    results.add_rows("Vendas", ROWS)
+
+    assert len(results) == 2
+    assert sorted(results.column("name")) == ["Painel", "Painel Modelo semântico"]
+
+def test_json_round_trip_keeps_keys() -> None:
+    results = ResultSet(CAPTURED_AT)
+    results.add_rows("Vendas", ROWS)
+
+    reloaded = ResultSet(CAPTURED_AT)
+    reloaded.add_json(results.to_json())
+    reloaded.add_rows("Vendas", ROWS)
+
+    assert len(reloaded) == 2
+    assert list(reloaded.iter_rows()) == list(results.iter_rows())
@@ -0,0 +1,69 @@
+"""
+    Testes das regras de seleção (src/selection.py): inclusão, exclusão, capacidade,
+    criticidade, ordem pela próxima atualização e orçamento de tempo.
+"""
+
+import datetime
+
+from src import selection
+from src.selection import RunBudget, WorkspaceRules, parse_list
+
+UTC = datetime.timezone.utc
+
+GROUPS = [
+    {"id": "A1", "name": "Vendas Brasil", "capacityId": "CAP-1"},
+    {"id": "B2", "name": "Vendas Chile", "capacityId": "cap-2"},
+    {"id": "C3", "name": "Financeiro"},
+    {"id": "D4", "name": "Sandbox RH", "capacityId": "CAP-1"}
+]
+
+def ids(groups: list[dict]) -> list[str]:
+    """IDs das workspaces, na ordem."""
+
+    return [group["id"] for group in groups]
+
+def test_parse_list() -> None:
+    assert parse_list(" Vendas*, ,A1 ,") == ("vendas*", "a1")
+    assert not parse_list("")
+
+def test_select_without_rules_keeps_all() -> None:
+    assert WorkspaceRules((), (), (), ()).select(GROUPS) == GROUPS
+
+def test_select_include_by_name_pattern_or_id() -> None:
+    rules = WorkspaceRules(include=parse_list("vendas*, c3"), exclude=(), capacities=())
+
+    assert ids(rules.select(GROUPS)) == ["A1", "B2", "C3"]
+
+def test_select_exclude_wins_over_include() -> None:
+    rules = WorkspaceRules(include=("vendas*",), exclude=("*chile",), capacities=())
+
+    assert ids(rules.select(GROUPS)) == ["A1"]
+
+def test_select_by_capacity() -> None:
+    rules = WorkspaceRules(include=(), exclude=("sandbox ??",), capacities=("cap-1", "cap-2"))
+
+    # sem capacidade (Meu workspace, compartilhada) fica de fora quando a regra existe
+    assert ids(rules.select(GROUPS)) == ["A1", "B2"]
+
+def test_order_critical_first_then_due_date() -> None:
+    due = {
+        "A1": datetime.datetime(2025, 1, 31, 12, tzinfo=UTC),
+        "B2": datetime.datetime(2025, 1, 31, 9, tzinfo=UTC),
+        "C3": datetime.datetime(2025, 1, 31, 8, tzinfo=UTC),
+        "D4": datetime.datetime(2025, 1, 31, 10, tzinfo=UTC)
+    }
+    rules = WorkspaceRules((), (), (), critical=("sandbox*", "a1"))
+
+    assert ids(rules.order(GROUPS, due.__getitem__)) == ["D4", "A1", "C3", "B2"]
+
+def test_run_budget(monkeypatch) -> None:
+    clock = {"now": 100.0}
+    monkeypatch.setattr(selection.time, "monotonic", lambda: clock["now"])
+
+    budget = RunBudget(minutes=10)
+    unlimited = RunBudget(minutes=0)
+
+    assert not budget.expired()
+    clock["now"] += 10 * 60
+    assert budget.expired()
+    assert not unlimited.expired()
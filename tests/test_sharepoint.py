@@ -0,0 +1,233 @@
+"""
+    Testes do upload em partes (src/sharepoint.py) com um SharePoint falso, que aceita uma
+    parte e perde a resposta, ou recusa todas as partes.
+"""
+
+import datetime
+import io
+from zoneinfo import ZoneInfo
+
+import openpyxl
+import pytest
+from requests.exceptions import ConnectionError as LostResponse, RequestException
+
+from src import dates, freshness, sharepoint
+from src.history import COLUMNS
+from src.records import ResultSet
+
+class FakeResponse:
+    """Resposta mínima do requests."""
+
+    def __init__(self, status_code: int, data: dict) -> None:
+        self.status_code = status_code
+        self.data = data
+        self.text = str(data)
+
+    def json(self) -> dict:
+        """Corpo da resposta."""
+
+        return self.data
+
+    def raise_for_status(self) -> None:
+        """Só respostas de sucesso são usadas por get."""
+
+class FakeSharePoint:
+    """Sessão de upload que guarda o offset e pode perder a resposta de uma parte."""
+
+    def __init__(self, lose: str | None = None, refuse: bool = False) -> None:
+        self.offset = 0
+        self.length = None
+        self.lose = lose # trecho da url cuja primeira resposta se perde
+        self.refuse = refuse
+        self.calls = []
+
+    def post(self, url: str, data: bytes = b"", **_) -> FakeResponse:
+        """StartUpload, ContinueUpload, FinishUpload e CancelUpload."""
+
+        self.calls.append(url.rsplit("/", 1)[-1].split("(")[0])
+        if "CancelUpload" in url:
+            return FakeResponse(200, {})
+        if self.refuse:
+            return FakeResponse(500, {})
+
+        expected = int(url.split("fileOffset=")[1].rstrip(")")) if "fileOffset" in url else 0
+        if expected != self.offset or self.length is not None:
+            message = f"Offset inválido. Esperado: {self.offset}."
+            return FakeResponse(400, {"odata.error": {"message": {"value": message}}})
+
+        self.offset += len(data)
+        if "FinishUpload" in url:
+            self.length = self.offset
+
+        if self.lose and self.lose in url:
+            self.lose = None
+            raise LostResponse("resposta perdida")
+        return FakeResponse(200, {"value": str(self.offset)})
+
+    def get(self, *_, **__) -> FakeResponse:
+        """Tamanho do arquivo publicado."""
+
+        return FakeResponse(200, {"Length": str(self.length)})
+
+@pytest.fixture(name="fake")
+def fixture_fake(monkeypatch):
+    """Partes de 10 bytes, sem pausa entre tentativas."""
+
+    monkeypatch.setattr(sharepoint, "CHUNK_SIZE", 10)
+    monkeypatch.setattr(sharepoint, "RETRY_DELAY", 0)
+    monkeypatch.setattr(sharepoint, "check_config", lambda: None)
+
+    def install(server: FakeSharePoint) -> FakeSharePoint:
+        monkeypatch.setattr(sharepoint.client, "post", server.post)
+        monkeypatch.setattr(sharepoint.client, "get", server.get)
+        return server
+
+    return install
+
+@pytest.mark.parametrize("lose", ["StartUpload", "ContinueUpload", "FinishUpload"])
+def test_lost_response_does_not_resend(fake, lose: str) -> None:
+    server = fake(FakeSharePoint(lose=lose))
+
+    sharepoint.UpdateSharepointFile().upload(io.BytesIO(b"x" * 35), "token")
+
+    assert server.length == 35
+    assert "CancelUpload" not in server.calls
+
+def test_refused_chunk_cancels_upload(fake) -> None:
+    server = fake(FakeSharePoint(refuse=True))
+
+    sharepoint.UpdateSharepointFile().upload(io.BytesIO(b"x" * 35), "token")
+
+    assert server.calls == ["StartUpload"] * sharepoint.MAX_RETRIES + ["CancelUpload"]
+
+def test_cancel_failure_is_only_logged(fake, monkeypatch) -> None:
+    server = fake(FakeSharePoint(refuse=True))
+
+    def post(url: str, **kwargs) -> FakeResponse:
+        if "CancelUpload" in url:
+            raise RequestException("sem rede")
+        return server.post(url, **kwargs)
+
+    monkeypatch.setattr(sharepoint.client, "post", post)
+
+    sharepoint.UpdateSharepointFile().upload(io.BytesIO(b"x" * 35), "token")
+
+def error_response(error: dict) -> FakeResponse:
+    """Recusa de uma parte, no formato de erro da API REST do SharePoint."""
+
+    return FakeResponse(400, {"odata.error": error})
+
+def test_chunk_accepted_reads_expected_offset() -> None:
+    message = {"message": {"value": "Offset inválido. Esperado: 20."}}
+
+    assert sharepoint.chunk_accepted(error_response(message), 20)
+    assert sharepoint.chunk_accepted(error_response({"expectedOffset": "20"}), 20)
+    assert not sharepoint.chunk_accepted(error_response({"expectedOffset": 10}), 20)
+
+def test_chunk_accepted_ignores_other_numbers() -> None:
+    message = {"message": {"value": "Sessão 20 expirou após 20 minutos."}}
+
+    assert not sharepoint.chunk_accepted(error_response(message), 20)
+    assert not sharepoint.chunk_accepted(FakeResponse(500, {}), 20)
+
+def test_single_put_uses_upload_timeout(fake, monkeypatch) -> None:
+    fake(FakeSharePoint())
+    calls = []
+
+    def put(**kwargs) -> FakeResponse:
+        calls.append(kwargs["timeout"])
+        return FakeResponse(200, {})
+
+    monkeypatch.setattr(sharepoint.client, "put", put)
+
+    sharepoint.UpdateSharepointFile().upload(io.BytesIO(b"x" * 5), "token")
+
+    assert calls == [sharepoint.UPLOAD_TIMEOUT]
+
+class FakeHistory:
+    """Histórico local que só conta as execuções acrescentadas."""
+
+    def __enter__(self) -> "FakeHistory":
+        return self
+
+    def __exit__(self, *_) -> None:
+        pass
+
+    def append(self, _) -> None:
+        """Execução acrescentada."""
+
+    def compact(self) -> None:
+        """Sem retenção nos testes."""
+
+@pytest.mark.parametrize("published", [True, False])
+def test_workbook_built_only_for_file_upload(monkeypatch, published: bool) -> None:
+    built = []
+    uploaded = []
+
+    class FakePublisher:
+        """Publicação incremental na lista, aceita ou recusada."""
+
+        def __init__(self, _) -> None:
+            pass
+
+        def publish(self, *_) -> bool:
+            """Resultado da publicação na lista."""
+
+            return published
+
+    monkeypatch.setattr(sharepoint, "check_config", lambda: None)
+    monkeypatch.setattr(sharepoint, "HistoryStore", FakeHistory)
+    monkeypatch.setattr(sharepoint, "get_token", lambda _: "token")
+    monkeypatch.setattr(sharepoint, "LIST_NAME", "Monitoramento")
+    monkeypatch.setattr(sharepoint, "ListPublisher", FakePublisher)
+    monkeypatch.setattr(
+        sharepoint.UpdateSharepointFile, "build_file", lambda self, json: built.append(json) or json
+    )
+    monkeypatch.setattr(
+        sharepoint.UpdateSharepointFile, "upload", lambda self, file, token: uploaded.append(file)
+    )
+
+    sharepoint.UpdateSharepointFile().put_in_sharepoint({"dados": {}})
+
+    assert built == uploaded == ([] if published else [{"dados": {}}])
+
+@pytest.fixture(name="sao_paulo")
+def fixture_sao_paulo(monkeypatch):
+    """Fuso de São Paulo, sem conversões em cache, e relógio em 31/01/2025 09:00."""
+
+    monkeypatch.setattr(dates, "TIMEZONE", "America/Sao_Paulo")
+    monkeypatch.setattr(freshness, "now", lambda: datetime.datetime(
+        2025, 1, 31, 9, tzinfo=ZoneInfo("America/Sao_Paulo")
+    ))
+    for cached in (dates.zone, dates.parse_title):
+        cached.cache_clear()
+    yield
+    for cached in (dates.zone, dates.parse_title):
+        cached.cache_clear()
+
+def test_main_sheet_has_numeric_dates(sao_paulo, monkeypatch) -> None:
+    monkeypatch.setattr(sharepoint, "check_config", lambda: None)
+    results = ResultSet("31/01/2025 - 09:00:00")
+    results.add_rows("Vendas", [
+        {
+            "id": "1", "name": "Atrasado", "type": "Relatório",
+            "last_refresh": "31/01/2025, 07:00:00", "next_refresh": "31/01/2025, 08:00:00",
+            "failed": False
+        },
+        {
+            "id": "2", "name": "Sem data", "type": "Relatório",
+            "last_refresh": "N/D", "next_refresh": "N/D", "failed": True
+        }
+    ])
+
+    excel_file = sharepoint.UpdateSharepointFile().build_file(results)
+
+    workbook = openpyxl.load_workbook(excel_file, read_only=True)
+    header, *rows = [list(row) for row in workbook.worksheets[0].iter_rows(values_only=True)]
+    assert header == COLUMNS + freshness.ARTIFACT_COLUMNS
+    assert rows[0][:3] == ["31/01/2025 - 09:00:00", "Vendas", "Atrasado"]
+    assert rows[0][len(COLUMNS):] == [
+        datetime.datetime(2025, 1, 31, 7), datetime.datetime(2025, 1, 31, 8), 2, 60, True
+    ]
+    assert rows[1][len(COLUMNS):] == [None, None, None, None, True]
+    assert workbook.sheetnames[1] == freshness.SLA_SHEET
@@ -0,0 +1,39 @@
+"""
+    Testes da junção do modo multi-tenant (src/tenants.py): o resultado não depende da ordem
+    em que os perfis terminam e o tenant separa as chaves da publicação incremental.
+"""
+
+from src import delta
+from src.records import ResultSet
+from src.tenants import merge_tenant
+
+CAPTURED_AT = "03/02/2025 - 08:00:00"
+
+def profile_result() -> ResultSet:
+    """Resultado de um perfil: a mesma workspace e o mesmo artefato em todos os tenants."""
+
+    results = ResultSet(CAPTURED_AT)
+    results.add_rows("Vendas", [{
+        "id": "/groups/g/datasets/1", "name": "Painel", "type": "Modelo semântico",
+        "last_refresh": "03/02/2025, 07:00:00", "next_refresh": "N/D", "failed": False
+    }])
+    return results
+
+def merged_rows(order: list[str]) -> list[list]:
+    """Junta os perfis na ordem informada e retorna as linhas, ordenadas."""
+
+    merged = ResultSet(CAPTURED_AT)
+    for tenant in order:
+        merge_tenant(merged, tenant, profile_result())
+    return sorted(merged.iter_rows(), key=lambda row: row[9])
+
+def test_merge_keeps_workspace_name_regardless_of_order() -> None:
+    rows = merged_rows(["norte", "sul"])
+
+    assert rows == merged_rows(["sul", "norte"])
+    assert [(row[1], row[9]) for row in rows] == [("Vendas", "norte"), ("Vendas", "sul")]
+
+def test_tenant_is_part_of_the_delta_key() -> None:
+    keys = {delta.row_key(dict(zip(delta.FIELDS, row))) for row in merged_rows(["norte", "sul"])}
+
+    assert keys == {"norte|Vendas|Painel|Modelo semântico", "sul|Vendas|Painel|Modelo semântico"}